@@ -1,10 +1,25 @@
+# Bench imports this module to discover commands on every bench invocation,
+# so only click is imported here. Frappe, the generators and the boilerplates
+# are imported inside the commands, when they actually run.
+import importlib
+
 import click
-import frappe
 
-from .spa_generator import SPAGenerator
-from frappe.commands import get_site, pass_context
-from .frappe_ui import add_frappe_ui
-from .desk_page import setup_desk_page
+# Names re-exported from submodules, resolved on first access
+LAZY_ATTRIBUTES = {
+    "SPAGenerator": ".spa_generator",
+    "add_frappe_ui_starter": ".frappe_ui",
+    "setup_desk_page": ".desk_page",
+    "upgrade_spa": ".upgrade",
+}
+
+
+def __getattr__(name):
+    if name in LAZY_ATTRIBUTES:
+        module = importlib.import_module(LAZY_ATTRIBUTES[name], __name__)
+        return getattr(module, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @click.command("add-spa")
@@ -37,7 +52,15 @@ from .desk_page import setup_desk_page
     is_flag=True,
     help="Setup shadcn/ui component library (React + TypeScript + Tailwind required)"
 )
-def generate_spa(framework, name, app, typescript, tailwindcss, shadcn):
+@click.option(
+    "--pwa",
+    default=False,
+    is_flag=True,
+    help="Add a service worker that precaches the SPA's assets",
+)
+def generate_spa(framework, name, app, typescript, tailwindcss, shadcn, pwa):
+    from .spa_generator import SPAGenerator
+
     if not app:
         click.echo("Please provide an app with --app")
         return
@@ -64,29 +87,290 @@ def generate_spa(framework, name, app, typescript, tailwindcss, shadcn):
         ))
         tailwindcss = True
     
-    generator = SPAGenerator(framework, name, app, tailwindcss, typescript, shadcn)
+    generator = SPAGenerator(framework, name, app, tailwindcss, typescript, shadcn, pwa)
     generator.generate_spa()
 
 @click.command("add-desk-page")
-@click.option("--page-name", prompt="Page Name")
+@click.option("--page-name", help="Name of the page, prompted for if no --manifest is given")
 @click.option("--app", prompt="App Name")
 @click.option(
     "--starter",
     type=click.Choice(["vue", "react"]),
-    default="vue",
-    prompt="Which framework do you want to use?",
     help="Setup a desk page with the framework of your choice",
 )
-@pass_context
-def add_desk_page(context, app, page_name, starter):
-    site = get_site(context)
+@click.option(
+    "--shared-runtime",
+    is_flag=True,
+    help="Load the framework once from a runtime bundle shared by all desk pages of the app",
+)
+@click.option(
+    "--manifest",
+    type=click.Path(exists=True, dir_okay=False),
+    help="YAML or JSON file listing the pages to create in one go",
+)
+@click.option("--headless", is_flag=True, help="Don't open the page in a browser")
+@click.pass_context
+def add_desk_page(ctx, app, page_name, starter, shared_runtime, manifest, headless):
+    import frappe
+    from frappe.commands import get_site
+
+    from .desk_page import load_desk_pages_manifest, setup_desk_pages
+
+    if manifest:
+        pages, manifest_shared_runtime = load_desk_pages_manifest(manifest, starter or "vue")
+        shared_runtime = shared_runtime or manifest_shared_runtime
+        headless = True
+    else:
+        page_name = page_name or click.prompt("Page Name")
+        starter = starter or click.prompt(
+            "Which framework do you want to use?",
+            type=click.Choice(["vue", "react"]),
+            default="vue",
+        )
+        pages = [{"page_name": page_name, "starter": starter}]
+
+    site = get_site(frappe._dict(ctx.obj))
+    frappe.init(site=site)
+
+    try:
+        frappe.connect()
+        setup_desk_pages(site, app, pages, shared_runtime=shared_runtime, headless=headless)
+    finally:
+        frappe.destroy()
+
+
+@click.command("doppio-upgrade")
+@click.option("--app", prompt="App Name")
+@click.option("--spa", prompt="SPA Name", help="Name of the SPA directory inside the app")
+@click.option("--dry-run", is_flag=True, help="Only report what would change")
+@click.option(
+    "--adopt",
+    is_flag=True,
+    help="Start tracking an SPA generated before doppio recorded manifests",
+)
+def upgrade(app, spa, dry_run, adopt):
+    from .upgrade import CONFLICT_SUFFIX, upgrade_spa
+
+    results = upgrade_spa(app, spa, dry_run=dry_run, adopt=adopt)
+
+    colors = {"updated": "green", "merged": "green", "added": "green", "conflict": "yellow"}
+    for path, status in sorted(results.items()):
+        if status == "unchanged":
+            continue
+        click.echo(click.style(f"{status:>16}  {path}", fg=colors.get(status)))
+
+    if any(status == "conflict" for status in results.values()):
+        click.echo(
+            click.style(
+                f"\nSome files have local edits that conflict with the new templates. "
+                f"Review the *{CONFLICT_SUFFIX} files next to them and merge by hand.",
+                fg="yellow",
+            )
+        )
+
+
+@click.command("doppio-profile")
+@click.option("--minutes", default=15, help="How far back to look")
+@click.option("--spa", help="Only show calls made by this SPA")
+@click.option(
+    "--sort",
+    type=click.Choice(["total", "count", "average", "p95", "queries"]),
+    default="total",
+    help="Sort by total time, call count, average or p95 latency, or queries per call",
+)
+@click.option("--limit", default=20, help="Number of methods to show")
+@click.pass_context
+def profile(ctx, minutes, spa, sort, limit):
+    """Show the slowest whitelisted methods called by doppio SPAs"""
+    import frappe
+    from frappe.commands import get_site
+
+    from doppio.profiler import get_profile
+
+    site = get_site(frappe._dict(ctx.obj))
     frappe.init(site=site)
 
     try:
         frappe.connect()
-        setup_desk_page(site, app, page_name, starter)
+        rows = get_profile(minutes, spa)
+    finally:
+        frappe.destroy()
+
+    if not rows:
+        click.echo(f"No SPA API calls recorded in the last {minutes} minutes.")
+        return
+
+    sort_keys = {
+        "total": lambda row: row.total_time,
+        "count": lambda row: row.count,
+        "average": lambda row: row.average_time,
+        "p95": lambda row: float(row.p95),
+        "queries": lambda row: row.average_queries,
+    }
+    rows = sorted(rows, key=sort_keys[sort], reverse=True)[:limit]
+
+    click.echo(
+        f"{'Method':<50} {'SPA':<12} {'Calls':>7} {'Total s':>9} {'Avg ms':>8} "
+        f"{'p50<=':>6} {'p95<=':>6} {'p99<=':>6} {'Queries':>8} {'KB':>8} {'Errors':>7}"
+    )
+    for row in rows:
+        click.echo(
+            f"{row.method[:50]:<50} {row.spa[:12]:<12} {row.count:>7} {row.total_time / 1000:>9.1f} "
+            f"{row.average_time:>8.0f} {row.p50:>6} {row.p95:>6} {row.p99:>6} "
+            f"{row.average_queries:>8.1f} {row.average_bytes / 1024:>8.1f} {row.errors:>7}"
+        )
+
+
+@click.command("doppio-loadtest")
+@click.option("--app", prompt="App Name")
+@click.option("--spa", prompt="SPA Name")
+@click.option("--users", default=10, help="Number of concurrent virtual users")
+@click.option("--iterations", default=5, help="Times each user replays the session")
+@click.option(
+    "--session",
+    "session_path",
+    type=click.Path(exists=True, dir_okay=False),
+    help="YAML or JSON file declaring the calls made after the shell loads",
+)
+@click.option(
+    "--har",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Replay the requests of a HAR file recorded in the browser instead",
+)
+@click.option("--url", help="Bench URL, defaults to the local web server")
+@click.option("--user", help="Log the virtual users in as this user")
+@click.option("--password", help="Password of --user")
+@click.option("--token", help="API key:secret to authenticate with instead")
+@click.pass_context
+def loadtest(ctx, app, spa, users, iterations, session_path, har, url, user, password, token):
+    """Replay an SPA session with concurrent virtual users and report latencies"""
+    import asyncio
+    from pathlib import Path
+
+    import frappe
+    from frappe.commands import get_site
+
+    from .loadtest import load_har, load_session, print_report, run_load_test, summarize
+
+    site = get_site(frappe._dict(ctx.obj))
+    frappe.init(site=site)
+    try:
+        port = frappe.conf.webserver_port or 8000
+    finally:
+        frappe.destroy()
+
+    if not (Path("../apps") / app / app / "www" / f"{spa}.py").exists():
+        click.echo(click.style(f"Warning: {app} has no www/{spa}.py, is {spa} a doppio SPA?", fg="yellow"))
+
+    steps = load_har(har, spa) if har else load_session(spa, session_path)
+    credentials = (user, password) if user else None
+
+    samples, elapsed = asyncio.run(
+        run_load_test(
+            steps,
+            url or f"http://127.0.0.1:{port}",
+            host=site,
+            users=users,
+            iterations=iterations,
+            token=token,
+            credentials=credentials,
+        )
+    )
+    print_report(summarize(samples, elapsed), elapsed, users)
+
+
+@click.command("doppio-dev")
+@click.option("--app", "apps", multiple=True, help="Only serve the SPAs of this app, can be repeated")
+@click.option("--spa", "spas", multiple=True, help="Only serve this SPA, can be repeated")
+@click.option("--host", default="0.0.0.0")
+@click.option("--port", default=8080)
+def dev(apps, spas, host, port):
+    """Serve every SPA of the bench at /<spa> from a single Node process"""
+    from pathlib import Path
+
+    from .dev import discover_spas, run_dev_server
+
+    bench_path = Path("..")
+    discovered = discover_spas(bench_path, apps, spas)
+    if not discovered:
+        click.echo("No SPAs found. SPAs are found from doppio.spas in the app's package.json and its website route rules.")
+        return
+
+    run_dev_server(discovered, host=host, port=port, bench_path=bench_path)
+
+
+@click.command("doppio-translations")
+@click.option("--app", prompt="App Name")
+@click.option("--spa", "spas", multiple=True, help="Only export this SPA, can be repeated")
+@click.option("--lang", "languages", multiple=True, help="Only export this language, can be repeated")
+@click.pass_context
+def translations(ctx, app, spas, languages):
+    """Export the translations used by an app's SPAs as hashed per-language catalogs"""
+    from pathlib import Path
+
+    import frappe
+    from frappe.commands import get_site
+
+    from .dev import get_registered_spas
+    from .translations import export_translations
+
+    site = get_site(frappe._dict(ctx.obj))
+    frappe.init(site=site)
+    frappe.connect()
+    try:
+        if not languages:
+            languages = frappe.get_all("Language", filters={"enabled": 1}, pluck="name")
+
+        for spa in spas or get_registered_spas(Path("../apps") / app):
+            message_count, index = export_translations(app, spa, languages)
+            click.echo(f"{spa}: {message_count} messages, catalogs for {len(index)} languages")
+    finally:
+        frappe.destroy()
+
+
+@click.command("doppio-meta")
+@click.option("--app", prompt="App Name")
+@click.option("--spa", "spas", multiple=True, help="Only snapshot this SPA, can be repeated")
+@click.pass_context
+def meta(ctx, app, spas):
+    """Snapshot the doctype meta declared by an app's SPAs into their source"""
+    from pathlib import Path
+
+    import frappe
+    from frappe.commands import get_site
+
+    from .dev import get_registered_spas
+    from .meta import snapshot_meta
+
+    site = get_site(frappe._dict(ctx.obj))
+    frappe.init(site=site)
+    frappe.connect()
+    try:
+        for spa in spas or get_registered_spas(Path("../apps") / app):
+            doctypes = snapshot_meta(app, spa)
+            if doctypes:
+                click.echo(f"{spa}: snapshotted {', '.join(doctypes)}")
     finally:
         frappe.destroy()
 
 
-commands = [generate_spa, add_frappe_ui, add_desk_page]
\ No newline at end of file
+@click.command("add-frappe-ui")
+@click.option("--name", default="frontend", prompt="Dashboard Name")
+@click.option("--app", prompt="App Name")
+def add_frappe_ui(name, app):
+    from .frappe_ui import add_frappe_ui_starter
+
+    if not app:
+        click.echo("Please provide an app with --app")
+        return
+
+    click.echo(f"Adding Frappe UI starter to {app}...")
+    add_frappe_ui_starter(name, app)
+
+    click.echo(
+        f"🖥️  You can start the dev server by running 'yarn dev' in apps/{app}/{name}"
+    )
+    click.echo("📄  Docs: https://ui.frappe.io")
+
+
+commands = [generate_spa, add_frappe_ui, add_desk_page, upgrade, profile, loadtest, dev, translations, meta]
\ No newline at end of file
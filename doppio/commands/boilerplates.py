@@ -1,618 +0,0 @@
-APP_VUE_BOILERPLATE = """<template>
-	<div>
-		<button v-if="$auth.isLoggedIn" @click="$auth.logout()">Logout</button>
-		<router-view />
-	</div>
-</template>
-
-
-<script>
-export default {
-	inject: ['$auth']
-};
-</script>
-"""
-
-HOME_VUE_BOILERPLATE = """<template>
-  <div>
-	<h1>Home Page</h1>
-	<!-- Fetch the resource on click -->
-	<button @click="$resources.ping.fetch()">Ping</button>
-  </div>
-</template>
-
-<script>
-export default {
-  resources: {
-	ping() {
-	  return {
-		method: "frappe.ping", // Method to call on backend
-		onSuccess(d) {
-		  alert(d);
-		},
-	  };
-	},
-  },
-};
-</script>
-"""
-
-LOGIN_VUE_BOILERPLATE = """<template>
-  <div class="min-h-screen bg-white flex">
-	<div class="mx-auto w-full max-w-sm lg:w-96">
-	  <form @submit.prevent="login" class="space-y-6">
-		<label for="email"> Username: </label>
-		<input type="text" v-model="email" />
-		<br />
-		<label for="password"> Password: </label>
-		<input type="password" v-model="password" />
-
-		<button
-		  class="bg-blue-500 block text-white p-2 hover:bg-blue-700"
-		  type="submit"
-		>
-		  Sign in
-		</button>
-	  </form>
-	</div>
-  </div>
-</template>
-<script>
-export default {
-  data() {
-	return {
-	  email: null,
-	  password: null,
-	};
-  },
-  inject: ["$auth"],
-  async mounted() {
-	if (this.$route?.query?.route) {
-	  this.redirect_route = this.$route.query.route;
-	  this.$router.replace({ query: null });
-	}
-  },
-  methods: {
-	async login() {
-	  if (this.email && this.password) {
-		let res = await this.$auth.login(this.email, this.password);
-		if (res) {
-		  this.$router.push({ name: "Home" });
-		}
-	  }
-	},
-  },
-};
-</script>
-"""
-
-VUE_VITE_CONFIG_BOILERPLATE = """import path from 'path';
-import { defineConfig } from 'vite';
-import vue from '@vitejs/plugin-vue';
-import proxyOptions from './proxyOptions';
-
-// https://vitejs.dev/config/
-export default defineConfig({
-	plugins: [vue()],
-	server: {
-		port: 8080,
-		host: '0.0.0.0',
-		proxy: proxyOptions
-	},
-	resolve: {
-		alias: {
-			'@': path.resolve(__dirname, 'src')
-		}
-	},
-	build: {
-		outDir: '../{{app}}/public/{{name}}',
-		emptyOutDir: true,
-		target: 'es2015',
-	},
-});
-"""
-
-PROXY_OPTIONS_BOILERPLATE = """const common_site_config = require('../../../sites/common_site_config.json');
-const { webserver_port } = common_site_config;
-
-export default {
-	'^/(app|api|assets|files|private)': {
-		target: `http://127.0.0.1:${webserver_port}`,
-		ws: true,
-		router: function(req) {
-			const site_name = req.headers.host.split(':')[0];
-			return `http://${site_name}:${webserver_port}`;
-		}
-	}
-};
-"""
-
-MAIN_JS_BOILERPLATE = """import { createApp, reactive } from "vue";
-import App from "./App.vue";
-
-import router from './router';
-import resourceManager from "../../../doppio/libs/resourceManager";
-import call from "../../../doppio/libs/controllers/call";
-import socket from "../../../doppio/libs/controllers/socket";
-import Auth from "../../../doppio/libs/controllers/auth";
-
-const app = createApp(App);
-const auth = reactive(new Auth());
-
-// Plugins
-app.use(router);
-app.use(resourceManager);
-
-// Global Properties,
-// components can inject this
-app.provide("$auth", auth);
-app.provide("$call", call);
-app.provide("$socket", socket);
-
-
-// Configure route gaurds
-router.beforeEach(async (to, from, next) => {
-	if (to.matched.some((record) => !record.meta.isLoginPage)) {
-		// this route requires auth, check if logged in
-		// if not, redirect to login page.
-		if (!auth.isLoggedIn) {
-			next({ name: 'Login', query: { route: to.path } });
-		} else {
-			next();
-		}
-	} else {
-		if (auth.isLoggedIn) {
-			next({ name: 'Home' });
-		} else {
-			next();
-		}
-	}
-});
-
-app.mount("#app");
-"""
-
-ROUTER_INDEX_BOILERPLATE = """import { createRouter, createWebHistory } from "vue-router";
-import Home from "../views/Home.vue";
-import authRoutes from './auth';
-
-const routes = [
-  {
-	path: "/",
-	name: "Home",
-	component: Home,
-  },
-  ...authRoutes,
-];
-
-const router = createRouter({
-  base: "/{{name}}/",
-  history: createWebHistory(),
-  routes,
-});
-
-export default router;
-"""
-
-
-AUTH_ROUTES_BOILERPLATE = """export default [
-	{
-		path: '/login',
-		name: 'Login',
-		component: () =>
-			import(/* webpackChunkName: "login" */ '../views/Login.vue'),
-		meta: {
-			isLoginPage: true
-		},
-		props: true
-	}
-]
-"""
-
-# React Boilerplates with Tailwind v4 and shadcn support
-
-REACT_VITE_CONFIG_BOILERPLATE = """import path from 'path';
-import { defineConfig } from 'vite';
-import react from '@vitejs/plugin-react';
-import tailwindcss from '@tailwindcss/vite';
-import proxyOptions from './proxyOptions';
-
-// https://vitejs.dev/config/
-export default defineConfig({
-	plugins: [react(), tailwindcss()],
-	server: {
-		port: 8080,
-		host: '0.0.0.0',
-		proxy: proxyOptions
-	},
-	resolve: {
-		alias: {
-			'@': path.resolve(__dirname, 'src')
-		}
-	},
-	build: {
-		outDir: '../{{app}}/public/{{name}}',
-		emptyOutDir: true,
-		target: 'es2015',
-	},
-});
-"""
-
-APP_REACT_BOILERPLATE = """import { FrappeProvider } from 'frappe-react-sdk';
-import { Button } from "@/components/ui/button";
-
-const resolveSiteName = () => {
-	// @ts-ignore
-	if (window.frappe?.boot?.versions?.frappe && (window.frappe.boot.versions.frappe.startsWith('15') || window.frappe.boot.versions.frappe.startsWith('16'))) {
-		// @ts-ignore
-		return window.frappe?.boot?.sitename ?? import.meta.env.VITE_SITE_NAME;
-	}
-	return import.meta.env.VITE_SITE_NAME;
-};
-
-function App() {
-	return (
-		<FrappeProvider
-			socketPort={import.meta.env.VITE_SOCKET_PORT}
-			siteName={resolveSiteName()}
-		>
-			<div className="flex min-h-svh flex-col items-center justify-center">
-				<h1 className="text-3xl font-bold underline mb-4">
-					Vite + React + Frappe
-				</h1>
-				<Button>Click me</Button>
-				<p className="mt-4 text-muted-foreground">
-					Edit <code>src/App.tsx</code> and save to test HMR
-				</p>
-			</div>
-		</FrappeProvider>
-	);
-}
-
-export default App;
-"""
-
-INDEX_CSS_BOILERPLATE = """@import "tailwindcss";
-
-@theme inline {
-  --color-background: var(--background);
-  --color-foreground: var(--foreground);
-  --color-card: var(--card);
-  --color-card-foreground: var(--card-foreground);
-  --color-popover: var(--popover);
-  --color-popover-foreground: var(--popover-foreground);
-  --color-primary: var(--primary);
-  --color-primary-foreground: var(--primary-foreground);
-  --color-secondary: var(--secondary);
-  --color-secondary-foreground: var(--secondary-foreground);
-  --color-muted: var(--muted);
-  --color-muted-foreground: var(--muted-foreground);
-  --color-accent: var(--accent);
-  --color-accent-foreground: var(--accent-foreground);
-  --color-destructive: var(--destructive);
-  --color-destructive-foreground: var(--destructive-foreground);
-  --color-border: var(--border);
-  --color-input: var(--input);
-  --color-ring: var(--ring);
-  --color-chart-1: var(--chart-1);
-  --color-chart-2: var(--chart-2);
-  --color-chart-3: var(--chart-3);
-  --color-chart-4: var(--chart-4);
-  --color-chart-5: var(--chart-5);
-  --radius: var(--radius);
-}
-
-:root {
-  --radius: 0.5rem;
-  --background: oklch(1 0 0);
-  --foreground: oklch(0.145 0 0);
-  --card: oklch(1 0 0);
-  --card-foreground: oklch(0.145 0 0);
-  --popover: oklch(1 0 0);
-  --popover-foreground: oklch(0.145 0 0);
-  --primary: oklch(0.205 0 0);
-  --primary-foreground: oklch(0.985 0 0);
-  --secondary: oklch(0.97 0 0);
-  --secondary-foreground: oklch(0.205 0 0);
-  --muted: oklch(0.97 0 0);
-  --muted-foreground: oklch(0.556 0 0);
-  --accent: oklch(0.97 0 0);
-  --accent-foreground: oklch(0.205 0 0);
-  --destructive: oklch(0.577 0.245 27.325);
-  --destructive-foreground: oklch(0.985 0 0);
-  --border: oklch(0.922 0 0);
-  --input: oklch(0.922 0 0);
-  --ring: oklch(0.708 0 0);
-  --chart-1: oklch(0.646 0.222 41.116);
-  --chart-2: oklch(0.6 0.118 184.704);
-  --chart-3: oklch(0.398 0.07 227.392);
-  --chart-4: oklch(0.828 0.189 84.429);
-  --chart-5: oklch(0.769 0.188 70.08);
-}
-
-.dark {
-  --background: oklch(0.145 0 0);
-  --foreground: oklch(0.985 0 0);
-  --card: oklch(0.205 0 0);
-  --card-foreground: oklch(0.985 0 0);
-  --popover: oklch(0.269 0 0);
-  --popover-foreground: oklch(0.985 0 0);
-  --primary: oklch(0.922 0 0);
-  --primary-foreground: oklch(0.205 0 0);
-  --secondary: oklch(0.269 0 0);
-  --secondary-foreground: oklch(0.985 0 0);
-  --muted: oklch(0.269 0 0);
-  --muted-foreground: oklch(0.708 0 0);
-  --accent: oklch(0.371 0 0);
-  --accent-foreground: oklch(0.985 0 0);
-  --destructive: oklch(0.704 0.191 22.216);
-  --destructive-foreground: oklch(0.985 0 0);
-  --border: oklch(1 0 0 / 10%);
-  --input: oklch(1 0 0 / 15%);
-  --ring: oklch(0.556 0 0);
-  --chart-1: oklch(0.488 0.243 264.376);
-  --chart-2: oklch(0.696 0.17 162.48);
-  --chart-3: oklch(0.769 0.188 70.08);
-  --chart-4: oklch(0.627 0.265 303.9);
-  --chart-5: oklch(0.645 0.246 16.439);
-}
-"""
-
-ENV_LOCAL_BOILERPLATE = """VITE_BASE_PATH=
-VITE_SOCKET_PORT=9000
-VITE_SITE_NAME=TO_BE_FILLED_MANUALLY
-"""
-
-ENV_PRODUCTION_BOILERPLATE = """VITE_BASE_PATH=/{{name}}
-"""
-
-PYTHON_CONTEXT_BOILERPLATE = """import frappe
-import json
-import re
-
-no_cache = 1
-
-SCRIPT_TAG_PATTERN = re.compile(r"\<script[^<]*\</script\>")
-CLOSING_SCRIPT_TAG_PATTERN = re.compile(r"</script\>")
-
-def get_context(context):
-	if frappe.session.user == "Guest":
-		boot = frappe.website.utils.get_boot_data()
-	else:
-		try:
-			boot = frappe.sessions.get()
-		except Exception as e:
-			raise frappe.SessionBootFailed from e
-	
-	boot_json = frappe.as_json(boot, indent=None, separators=(",", ":"))
-	boot_json = SCRIPT_TAG_PATTERN.sub("", boot_json)
-	boot_json = CLOSING_SCRIPT_TAG_PATTERN.sub("", boot_json)
-	boot_json = json.dumps(boot_json)
-
-	context.update({
-		"build_version": frappe.utils.get_build_version(),
-		"boot": boot_json,
-	})
-
-	return context
-"""
-
-INDEX_HTML_BOILERPLATE = """<!doctype html>
-<html lang="en">
-  <head>
-    <meta charset="UTF-8" />
-    <link rel="icon" type="image/svg+xml" href="/vite.svg" />
-    <meta name="viewport" content="width=device-width, initial-scale=1.0" />
-    <title>Vite + React + TS</title>
-  </head>
-  <body>
-    <div id="root"></div>
-    <script>
-      window.frappe = {
-        session: { csrf_token: '{{ frappe.session.csrf_token }}' }
-      };
-      if (!window.frappe) { window.frappe = {}; }
-      window.frappe.boot = JSON.parse({{ boot | tojson }});
-    </script>
-    <script type="module" src="/src/main.tsx"></script>
-  </body>
-</html>
-"""
-
-TSCONFIG_JSON_BOILERPLATE = """{
-  "files": [],
-  "references": [
-    {
-      "path": "./tsconfig.app.json"
-    },
-    {
-      "path": "./tsconfig.node.json"
-    }
-  ],
-  "compilerOptions": {
-    "baseUrl": ".",
-    "paths": {
-      "@/*": ["./src/*"]
-    }
-  }
-}
-"""
-
-TSCONFIG_APP_JSON_BOILERPLATE = """{
-  "compilerOptions": {
-    "target": "ES2020",
-    "useDefineForClassFields": true,
-    "lib": ["ES2020", "DOM", "DOM.Iterable"],
-    "module": "ESNext",
-    "skipLibCheck": true,
-
-    /* Bundler mode */
-    "moduleResolution": "bundler",
-    "allowImportingTsExtensions": true,
-    "isolatedModules": true,
-    "moduleDetection": "force",
-    "noEmit": true,
-    "jsx": "react-jsx",
-
-    /* Linting */
-    "strict": true,
-    "noUnusedLocals": true,
-    "noUnusedParameters": true,
-    "noFallthroughCasesInSwitch": true,
-
-    /* Path resolution */
-    "baseUrl": ".",
-    "paths": {
-      "@/*": ["./src/*"]
-    }
-  },
-  "include": ["src"]
-}
-"""
-
-COMPONENTS_JSON_BOILERPLATE = """{
-  "$schema": "https://ui.shadcn.com/schema.json",
-  "style": "new-york",
-  "rsc": false,
-  "tsx": true,
-  "tailwind": {
-    "config": "",
-    "css": "src/index.css",
-    "baseColor": "neutral",
-    "cssVariables": true,
-    "prefix": ""
-  },
-  "aliases": {
-    "components": "@/components",
-    "utils": "@/lib/utils",
-    "ui": "@/components/ui",
-    "lib": "@/lib",
-    "hooks": "@/hooks"
-  },
-  "iconLibrary": "lucide"
-}
-"""
-
-DESK_PAGE_JS_TEMPLATE = """frappe.pages["{{ page_name }}"].on_page_load = function (wrapper) {
-	frappe.ui.make_app_page({
-		parent: wrapper,
-		title: __("{{ page_title }}"),
-		single_column: true,
-	});
-};
-
-frappe.pages["{{ page_name }}"].on_page_show = function (wrapper) {
-	load_desk_page(wrapper);
-};
-
-function load_desk_page(wrapper) {
-	let $parent = $(wrapper).find(".layout-main-section");
-	$parent.empty();
-
-	frappe.require("{{ scrubbed_name }}.bundle.{{ bundle_type }}").then(() => {
-		frappe.{{ scrubbed_name }} = new frappe.ui.{{ pascal_cased_name }}({
-			wrapper: $parent,
-			page: wrapper.page,
-		});
-	});
-}
-"""
-
-DESK_PAGE_JS_BUNDLE_TEMPLATE_VUE = """import { createApp } from "vue";
-import App from "./App.vue";
-
-
-class {{ pascal_cased_name }} {
-	constructor({ page, wrapper }) {
-		this.$wrapper = $(wrapper);
-		this.page = page;
-
-		this.init();
-	}
-
-	init() {
-		this.setup_page_actions();
-		this.setup_app();
-	}
-
-	setup_page_actions() {
-		// setup page actions
-		this.primary_btn = this.page.set_primary_action(__("Print Message"), () =>
-	  frappe.msgprint("Hello My Page!")
-		);
-	}
-
-	setup_app() {
-		// create a vue instance
-		let app = createApp(App);
-		// mount the app
-		this.${{ scrubbed_name }} = app.mount(this.$wrapper.get(0));
-	}
-}
-
-frappe.provide("frappe.ui");
-frappe.ui.{{ pascal_cased_name }} = {{ pascal_cased_name }};
-export default {{ pascal_cased_name }};
-"""
-
-DESK_PAGE_VUE_APP_COMPONENT_BOILERPLATE = """<script setup>
-import { ref } from "vue";
-
-const dynamicMessage = ref("Hello from App.vue");
-</script>
-<template>
-  <div>
-	<h3>{{ dynamicMessage }}</h3>
-    <h4>Start editing at {{ app_component_path }}</h4>
-  </div>
-</template>"""
-
-DESK_PAGE_REACT_APP_COMPONENT_BOILERPLATE = """import * as React from "react";
-
-export function App() {
-  const dynamicMessage = React.useState("Hello from App.jsx");
-  return (
-    <div className="m-4">
-      <h3>{dynamicMessage}</h3>
-      <h4>Start editing at {{ app_component_path }}</h4>
-    </div>
-  );
-}"""
-
-DESK_PAGE_JSX_BUNDLE_TEMPLATE_REACT = """import * as React from "react";
-import { App } from "./App";
-import { createRoot } from "react-dom/client";
-
-
-class {{ pascal_cased_name }} {
-	constructor({ page, wrapper }) {
-		this.$wrapper = $(wrapper);
-		this.page = page;
-
-		this.init();
-	}
-
-	init() {
-		this.setup_page_actions();
-		this.setup_app();
-	}
-
-	setup_page_actions() {
-		// setup page actions
-		this.primary_btn = this.page.set_primary_action(__("Print Message"), () =>
-	  		frappe.msgprint("Hello My Page!")
-		);
-	}
-
-	setup_app() {
-		// create and mount the react app
-		const root = createRoot(this.$wrapper.get(0));
-		root.render(<App />);
-		this.${{ scrubbed_name }} = root;
-	}
-}
-
-frappe.provide("frappe.ui");
-frappe.ui.{{ pascal_cased_name }} = {{ pascal_cased_name }};
-export default {{ pascal_cased_name }};
-"""
\ No newline at end of file
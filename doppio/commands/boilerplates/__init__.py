@@ -0,0 +1,218 @@
+"""Boilerplates used to generate SPAs and desk pages.
+
+Each boilerplate is a `<name>.tpl` file in this directory. It is read and compiled
+the first time it is rendered and then cached for the rest of the process, so
+nothing is parsed at import.
+
+Syntax:
+
+	{{ name }}                   substituted with the value of `name`
+	{{#flag}} ... {{/flag}}      kept only if `flag` is truthy
+	{{^flag}} ... {{/flag}}      kept only if `flag` is falsy
+
+Only the variables declared for a template in `TEMPLATES` are substituted. Any other
+`{{ ... }}` is part of the output, e.g. Vue template expressions or Jinja that
+Frappe renders at request time.
+"""
+
+import hashlib
+import re
+
+from functools import lru_cache
+from pathlib import Path
+
+BOILERPLATES_PATH = Path(__file__).parent
+
+TOKEN_PATTERN = re.compile(r"{{\s*([#^/]?)\s*(\w+)\s*}}")
+
+# Template name -> variables it accepts, with their types
+TEMPLATES = {
+	# Vue SPA
+	"app.vue": {},
+	"home.vue": {},
+	"login.vue": {},
+	"main.js": {"tailwindcss": bool},
+	"router_index.js": {"name": str},
+	"auth_routes.js": {},
+	"vue_vite_config.js": {
+		"app": str,
+		"name": str,
+		"tailwindcss": bool,
+		"pwa": bool,
+		"optimize_deps": str,
+		"warmup": str,
+		"critical": str,
+	},
+	# React SPA
+	"app.jsx": {"shadcn": bool},
+	"react_vite_config.js": {
+		"app": str,
+		"name": str,
+		"tailwindcss": bool,
+		"pwa": bool,
+		"optimize_deps": str,
+		"warmup": str,
+		"critical": str,
+	},
+	"env.local": {},
+	"env.production": {"name": str},
+	"tsconfig.json": {},
+	"tsconfig.app.json": {},
+	"components.json": {},
+	"shadcn_utils.ts": {},
+	# Common to all SPAs
+	"index.html": {"title": str, "mount_id": str, "entry": str},
+	"www_context.py": {"pwa": bool},
+	"proxy_options.js": {},
+	"index.css": {},
+	"doppio_build.mjs": {},
+	"doppio_deploy.mjs": {},
+	"service_worker.js": {},
+	"pwa_plugin.js": {"app": str, "name": str},
+	"preload_plugin.js": {},
+	# Desk pages
+	"desk_page.js": {
+		"page_name": str,
+		"page_title": str,
+		"scrubbed_name": str,
+		"pascal_cased_name": str,
+		"bundle_type": str,
+		"runtime_bundle": str,
+	},
+	"desk_page_vue.bundle.js": {"pascal_cased_name": str, "scrubbed_name": str},
+	"desk_page_react.bundle.jsx": {"pascal_cased_name": str, "scrubbed_name": str},
+	"desk_page_app.vue": {"app_component_path": str},
+	"desk_page_app.jsx": {"app_component_path": str},
+	"shared_runtime_vue.bundle.js": {},
+	"shared_runtime_react.bundle.js": {},
+	"shared_runtime_shim.js": {"runtime_bundle": str, "global_name": str},
+}
+
+# Names of the string constants boilerplates used to be defined as
+LEGACY_NAMES = {
+	"APP_VUE_BOILERPLATE": "app.vue",
+	"HOME_VUE_BOILERPLATE": "home.vue",
+	"LOGIN_VUE_BOILERPLATE": "login.vue",
+	"VUE_VITE_CONFIG_BOILERPLATE": "vue_vite_config.js",
+	"PROXY_OPTIONS_BOILERPLATE": "proxy_options.js",
+	"MAIN_JS_BOILERPLATE": "main.js",
+	"ROUTER_INDEX_BOILERPLATE": "router_index.js",
+	"AUTH_ROUTES_BOILERPLATE": "auth_routes.js",
+	"REACT_VITE_CONFIG_BOILERPLATE": "react_vite_config.js",
+	"APP_REACT_BOILERPLATE": "app.jsx",
+	"INDEX_CSS_BOILERPLATE": "index.css",
+	"ENV_LOCAL_BOILERPLATE": "env.local",
+	"ENV_PRODUCTION_BOILERPLATE": "env.production",
+	"PYTHON_CONTEXT_BOILERPLATE": "www_context.py",
+	"INDEX_HTML_BOILERPLATE": "index.html",
+	"TSCONFIG_JSON_BOILERPLATE": "tsconfig.json",
+	"TSCONFIG_APP_JSON_BOILERPLATE": "tsconfig.app.json",
+	"SHADCN_UTILS_BOILERPLATE": "shadcn_utils.ts",
+	"COMPONENTS_JSON_BOILERPLATE": "components.json",
+	"DESK_PAGE_JS_TEMPLATE": "desk_page.js",
+	"DESK_PAGE_JS_BUNDLE_TEMPLATE_VUE": "desk_page_vue.bundle.js",
+	"DESK_PAGE_VUE_APP_COMPONENT_BOILERPLATE": "desk_page_app.vue",
+	"DESK_PAGE_REACT_APP_COMPONENT_BOILERPLATE": "desk_page_app.jsx",
+	"DESK_PAGE_JSX_BUNDLE_TEMPLATE_REACT": "desk_page_react.bundle.jsx",
+}
+
+
+class TemplateError(Exception):
+	pass
+
+
+class Template:
+	def __init__(self, name, source, variables):
+		self.name = name
+		self.source = source
+		self.variables = variables
+		self.hash = hashlib.sha1(source.encode()).hexdigest()
+		self.nodes = self.compile()
+
+	def compile(self):
+		"""Parse the source into a tree of strings, variables and sections.
+
+		A variable is `(name,)` and a section is `(name, inverted, children)`.
+		"""
+		root = []
+		stack = [(None, root)]
+		position = 0
+
+		for match in TOKEN_PATTERN.finditer(self.source):
+			kind, name = match.groups()
+			if name not in self.variables:
+				# not ours, keep as text
+				continue
+
+			nodes = stack[-1][1]
+			if match.start() > position:
+				nodes.append(self.source[position : match.start()])
+			position = match.end()
+
+			if kind in ("#", "^"):
+				children = []
+				nodes.append((name, kind == "^", children))
+				stack.append((name, children))
+			elif kind == "/":
+				if stack[-1][0] != name:
+					raise TemplateError(f"{self.name}: unexpected {{{{/{name}}}}}")
+				stack.pop()
+			else:
+				nodes.append((name,))
+
+		if len(stack) > 1:
+			raise TemplateError(f"{self.name}: unclosed section {{{{#{stack[-1][0]}}}}}")
+
+		root.append(self.source[position:])
+		return root
+
+	def render(self, **context):
+		missing = self.variables.keys() - context.keys()
+		unknown = context.keys() - self.variables.keys()
+		if missing or unknown:
+			raise TypeError(
+				f"{self.name}: missing variables {sorted(missing)}, unknown variables {sorted(unknown)}"
+			)
+
+		for name, value in context.items():
+			if not isinstance(value, self.variables[name]):
+				raise TypeError(
+					f"{self.name}: {name} must be {self.variables[name].__name__}, not {type(value).__name__}"
+				)
+
+		output = []
+		self.render_nodes(self.nodes, context, output)
+		return "".join(output)
+
+	def render_nodes(self, nodes, context, output):
+		for node in nodes:
+			if isinstance(node, str):
+				output.append(node)
+			elif len(node) == 1:
+				output.append(str(context[node[0]]))
+			else:
+				name, inverted, children = node
+				if bool(context[name]) != inverted:
+					self.render_nodes(children, context, output)
+
+
+@lru_cache(maxsize=None)
+def get_template(name) -> Template:
+	if name not in TEMPLATES:
+		raise TemplateError(f"Unknown boilerplate: {name}")
+
+	source = (BOILERPLATES_PATH / f"{name}.tpl").read_text()
+	return Template(name, source, TEMPLATES[name])
+
+
+def render(template_name, /, **context):
+	"""Render the boilerplate `template_name` with `context`"""
+	return get_template(template_name).render(**context)
+
+
+def __getattr__(name):
+	# raw source under the old constant names, for code written against them
+	if name in LEGACY_NAMES:
+		return get_template(LEGACY_NAMES[name]).source
+
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
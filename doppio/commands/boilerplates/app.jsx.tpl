@@ -0,0 +1,68 @@
+import { useEffect, useState } from 'react';
+import { FrappeProvider } from 'frappe-react-sdk';
+// @ts-ignore
+import { enableTelemetry } from '../../../doppio/libs/controllers/telemetry';
+// @ts-ignore
+import { loadTranslations } from '../../../doppio/libs/controllers/translation';
+{{#shadcn}}import { Button } from "@/components/ui/button";
+{{/shadcn}}
+const resolveSiteName = () => {
+	// @ts-ignore
+	if (window.frappe?.boot?.versions?.frappe && (window.frappe.boot.versions.frappe.startsWith('15') || window.frappe.boot.versions.frappe.startsWith('16'))) {
+		// @ts-ignore
+		return window.frappe?.boot?.sitename ?? import.meta.env.VITE_SITE_NAME;
+	}
+	return import.meta.env.VITE_SITE_NAME;
+};
+
+// Data prefetched by the www context file (INITIAL_RESOURCES), used as the
+// initial data of useFrappeGetCall(method, params, key) hooks with a matching key
+const getInitialData = () => {
+	try {
+		const entries = JSON.parse(document.getElementById('initial-data')?.textContent ?? '{}');
+		return Object.fromEntries(
+			Object.entries(entries).map(([key, entry]) => [key, { message: entry.message }])
+		);
+	} catch (e) {
+		// not rendered by Frappe, e.g. on the Vite dev server
+		return {};
+	}
+};
+
+// Opt-in, see doppio_telemetry in the README
+enableTelemetry();
+
+// Fetched while the app loads, import __ from libs/controllers/translation
+loadTranslations();
+
+function App() {
+	// __() reads the catalog synchronously, render once it is there
+	const [translationsLoaded, setTranslationsLoaded] = useState(false);
+	useEffect(() => {
+		loadTranslations().then(() => setTranslationsLoaded(true));
+	}, []);
+
+	if (!translationsLoaded) {
+		return null;
+	}
+
+	return (
+		<FrappeProvider
+			socketPort={import.meta.env.VITE_SOCKET_PORT}
+			siteName={resolveSiteName()}
+			swrConfig={{ fallback: getInitialData() }}
+		>
+			<div className="flex min-h-svh flex-col items-center justify-center">
+				<h1 className="text-3xl font-bold underline mb-4">
+					Vite + React + Frappe
+				</h1>
+{{#shadcn}}				<Button>Click me</Button>
+{{/shadcn}}				<p className="mt-4 text-muted-foreground">
+					Edit <code>src/App.tsx</code> and save to test HMR
+				</p>
+			</div>
+		</FrappeProvider>
+	);
+}
+
+export default App;
@@ -0,0 +1,13 @@
+<template>
+	<div>
+		<button v-if="$auth.isLoggedIn" @click="$auth.logout()">Logout</button>
+		<router-view />
+	</div>
+</template>
+
+
+<script>
+export default {
+	inject: ['$auth']
+};
+</script>
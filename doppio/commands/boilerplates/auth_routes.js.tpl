@@ -0,0 +1,12 @@
+export default [
+	{
+		path: '/login',
+		name: 'Login',
+		component: () =>
+			import(/* webpackChunkName: "login" */ '../views/Login.vue'),
+		meta: {
+			isLoginPage: true
+		},
+		props: true
+	}
+]
@@ -0,0 +1,78 @@
+// Mounted desk page apps, most recently shown last. Apps stay mounted while
+// their page is hidden and are only destroyed when too many are alive or the
+// JS heap is close to its limit. Shared by every doppio desk page.
+frappe.provide("frappe.doppio");
+if (!frappe.doppio.desk_pages) {
+	frappe.doppio.desk_pages = (() => {
+		const MAX_ALIVE_PAGES = 5;
+		const MAX_HEAP_USAGE = 0.8;
+		const pages = new Map();
+
+		function under_memory_pressure() {
+			// only available in Chromium based browsers
+			const memory = performance.memory;
+			return memory && memory.usedJSHeapSize / memory.jsHeapSizeLimit > MAX_HEAP_USAGE;
+		}
+
+		return {
+			get(name) {
+				const instance = pages.get(name);
+				if (instance) {
+					pages.delete(name);
+					pages.set(name, instance);
+				}
+				return instance;
+			},
+			set(name, instance) {
+				pages.set(name, instance);
+				this.evict(name);
+			},
+			evict(current) {
+				for (const [name, instance] of pages) {
+					if (pages.size <= MAX_ALIVE_PAGES && !under_memory_pressure()) break;
+					if (name === current) continue;
+					instance.destroy();
+					pages.delete(name);
+				}
+			},
+		};
+	})();
+}
+
+frappe.pages["{{ page_name }}"].on_page_load = function (wrapper) {
+	frappe.ui.make_app_page({
+		parent: wrapper,
+		title: __("{{ page_title }}"),
+		single_column: true,
+	});
+
+	$(wrapper).on("hide", () => {
+		frappe.doppio.desk_pages.get("{{ page_name }}")?.hide();
+	});
+};
+
+frappe.pages["{{ page_name }}"].on_page_show = function (wrapper) {
+	let instance = frappe.doppio.desk_pages.get("{{ page_name }}");
+	if (instance) {
+		// still mounted, keep its state
+		instance.show();
+		return;
+	}
+	frappe.pages["{{ page_name }}"].load_desk_page(wrapper);
+};
+
+frappe.pages["{{ page_name }}"].load_desk_page = function (wrapper) {
+	let $parent = $(wrapper).find(".layout-main-section");
+	$parent.empty();
+
+	const bundles = [{{#runtime_bundle}}"{{ runtime_bundle }}", {{/runtime_bundle}}"{{ scrubbed_name }}.bundle.{{ bundle_type }}"];
+	const loaded = bundles.reduce((loading, bundle) => loading.then(() => frappe.require(bundle)), Promise.resolve());
+
+	loaded.then(() => {
+		frappe.{{ scrubbed_name }} = new frappe.ui.{{ pascal_cased_name }}({
+			wrapper: $parent,
+			page: wrapper.page,
+		});
+		frappe.doppio.desk_pages.set("{{ page_name }}", frappe.{{ scrubbed_name }});
+	});
+};
@@ -0,0 +1,13 @@
+import * as React from "react";
+
+// The app stays mounted when you navigate away from the page,
+// pause and resume work with deskPage.onHide / deskPage.onShow
+export function App({ deskPage }) {
+  const dynamicMessage = React.useState("Hello from App.jsx");
+  return (
+    <div className="m-4">
+      <h3>{dynamicMessage}</h3>
+      <h4>Start editing at {{ app_component_path }}</h4>
+    </div>
+  );
+}
\ No newline at end of file
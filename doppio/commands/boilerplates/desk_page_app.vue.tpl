@@ -0,0 +1,15 @@
+<script setup>
+import { inject, ref } from "vue";
+
+const dynamicMessage = ref("Hello from App.vue");
+
+// The app stays mounted when you navigate away from the page,
+// pause and resume work with deskPage.onHide / deskPage.onShow
+const deskPage = inject("deskPage");
+</script>
+<template>
+  <div>
+	<h3>{{ dynamicMessage }}</h3>
+    <h4>Start editing at {{ app_component_path }}</h4>
+  </div>
+</template>
\ No newline at end of file
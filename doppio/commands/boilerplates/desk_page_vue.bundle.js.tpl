@@ -0,0 +1,76 @@
+import { createApp } from "vue";
+import App from "./App.vue";
+
+
+class {{ pascal_cased_name }} {
+	constructor({ page, wrapper }) {
+		this.$wrapper = $(wrapper);
+		this.page = page;
+		this.listeners = { show: [], hide: [] };
+
+		this.init();
+	}
+
+	init() {
+		this.setup_page_actions();
+		this.setup_app();
+	}
+
+	setup_page_actions() {
+		// setup page actions
+		this.primary_btn = this.page.set_primary_action(__("Print Message"), () =>
+	  frappe.msgprint("Hello My Page!")
+		);
+	}
+
+	setup_app() {
+		// create a vue instance
+		let app = createApp(App);
+		// components can use inject("deskPage").onShow(() => ...)
+		app.provide("deskPage", this.lifecycle);
+		// mount the app
+		this.${{ scrubbed_name }} = app.mount(this.$wrapper.get(0));
+		this.app = app;
+	}
+
+	unmount() {
+		this.app.unmount();
+	}
+
+	// lifecycle hooks for the app, which stays mounted while the page is hidden
+	get lifecycle() {
+		return {
+			onShow: (handler) => this.on("show", handler),
+			onHide: (handler) => this.on("hide", handler),
+		};
+	}
+
+	on(event, handler) {
+		this.listeners[event].push(handler);
+		return () => {
+			this.listeners[event] = this.listeners[event].filter((h) => h !== handler);
+		};
+	}
+
+	trigger(event) {
+		this.listeners[event].forEach((handler) => handler());
+	}
+
+	show() {
+		this.trigger("show");
+	}
+
+	hide() {
+		this.trigger("hide");
+	}
+
+	destroy() {
+		this.listeners = { show: [], hide: [] };
+		this.unmount();
+		this.$wrapper.empty();
+	}
+}
+
+frappe.provide("frappe.ui");
+frappe.ui.{{ pascal_cased_name }} = {{ pascal_cased_name }};
+export default {{ pascal_cased_name }};
@@ -0,0 +1,215 @@
+// Builds the doppio SPAs of this app, skipping the ones whose sources did not
+// change since they were last built. Generated by doppio.
+//
+//	node doppio-build.mjs [--force] [--jobs N] [spa ...]
+//
+// SPAs are listed under "doppio.spas" in this app's package.json. An SPA is
+// rebuilt when the hash of its files changes (sources, package.json, lockfile
+// and configs, everything but node_modules) or of any path listed under
+// "doppio.buildInputs" in its package.json. The hash of the last successful
+// build is kept in the SPA's node_modules/.cache.
+//
+// Translation catalogs are exported from a site, by `bench doppio-translations`,
+// so they can't be exported here. SPAs whose sources changed since their last
+// export are reported instead.
+
+import { createHash } from 'crypto';
+import { spawn } from 'child_process';
+import fs from 'fs/promises';
+import os from 'os';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const APP_ROOT = path.dirname(fileURLToPath(import.meta.url));
+const APP = path.basename(APP_ROOT);
+const IGNORE = new Set(['node_modules', '.git', '.doppio', 'dist']);
+const CACHE_FILE = path.join('node_modules', '.cache', 'doppio-build.json');
+
+async function readJSON(file, fallback = null) {
+	try {
+		return JSON.parse(await fs.readFile(file, 'utf8'));
+	} catch (e) {
+		return fallback;
+	}
+}
+
+async function exists(file) {
+	try {
+		await fs.access(file);
+		return true;
+	} catch (e) {
+		return false;
+	}
+}
+
+async function listFiles(entry) {
+	let entries;
+	try {
+		entries = await fs.readdir(entry, { withFileTypes: true });
+	} catch (e) {
+		if (e.code === 'ENOTDIR') return [entry];
+		if (e.code === 'ENOENT') return [];
+		throw e;
+	}
+
+	const files = [];
+	for (const dirent of entries) {
+		if (IGNORE.has(dirent.name)) continue;
+		const file = path.join(entry, dirent.name);
+		if (dirent.isDirectory()) {
+			files.push(...(await listFiles(file)));
+		} else if (dirent.isFile()) {
+			files.push(file);
+		}
+	}
+	return files;
+}
+
+async function getSourceHash(spaPath, packageJson) {
+	const inputs = [spaPath, ...(packageJson.doppio?.buildInputs || [])];
+	const files = (await Promise.all(inputs.map((input) => listFiles(path.resolve(spaPath, input)))))
+		.flat()
+		.sort();
+
+	const hash = createHash('sha1');
+	for (const file of files) {
+		hash.update(path.relative(spaPath, file) + '\0');
+		hash.update(await fs.readFile(file));
+		hash.update('\0');
+	}
+	return hash.digest('hex');
+}
+
+async function getSPAs() {
+	const packageJson = await readJSON(path.join(APP_ROOT, 'package.json'), {});
+	if (packageJson.doppio?.spas) {
+		return packageJson.doppio.spas;
+	}
+
+	// apps set up before the list was kept: every directory with a vite config
+	const spas = [];
+	for (const dirent of await fs.readdir(APP_ROOT, { withFileTypes: true })) {
+		if (!dirent.isDirectory() || IGNORE.has(dirent.name)) continue;
+		for (const config of ['vite.config.js', 'vite.config.ts']) {
+			if (await exists(path.join(APP_ROOT, dirent.name, config))) {
+				spas.push(dirent.name);
+				break;
+			}
+		}
+	}
+	return spas;
+}
+
+async function isBuilt(spa) {
+	return (
+		(await exists(path.join(APP_ROOT, APP, 'public', spa, 'index.html'))) &&
+		(await exists(path.join(APP_ROOT, APP, 'www', `${spa}.html`)))
+	);
+}
+
+async function warnStaleTranslations(spa, spaPath) {
+	let exportedAt;
+	try {
+		exportedAt = (await fs.stat(path.join(APP_ROOT, APP, 'public', 'locale', spa, 'index.json'))).mtimeMs;
+	} catch (e) {
+		// translations never exported for this SPA
+		return;
+	}
+
+	for (const file of await listFiles(path.join(spaPath, 'src'))) {
+		if ((await fs.stat(file)).mtimeMs > exportedAt) {
+			console.warn(
+				`[${spa}] sources changed since translations were exported, run: bench --site <site> doppio-translations --app ${APP} --spa ${spa}`
+			);
+			return;
+		}
+	}
+}
+
+function run(spa, command, args, cwd) {
+	return new Promise((resolve) => {
+		const child = spawn(command, args, { cwd, stdio: ['ignore', 'pipe', 'pipe'] });
+		const prefix = (stream, out) => {
+			let buffer = '';
+			stream.on('data', (chunk) => {
+				const lines = (buffer + chunk).split('\n');
+				buffer = lines.pop();
+				for (const line of lines) out.write(`[${spa}] ${line}\n`);
+			});
+			stream.on('end', () => buffer && out.write(`[${spa}] ${buffer}\n`));
+		};
+		prefix(child.stdout, process.stdout);
+		prefix(child.stderr, process.stderr);
+		child.on('error', () => resolve(false));
+		child.on('close', (code) => resolve(code === 0));
+	});
+}
+
+async function build(spa, force) {
+	const spaPath = path.join(APP_ROOT, spa);
+	const packageJson = await readJSON(path.join(spaPath, 'package.json'));
+	if (!packageJson) {
+		console.warn(`[${spa}] package.json not found, skipping`);
+		return true;
+	}
+
+	await warnStaleTranslations(spa, spaPath);
+
+	const cacheFile = path.join(spaPath, CACHE_FILE);
+	const hash = await getSourceHash(spaPath, packageJson);
+	const cache = await readJSON(cacheFile, {});
+
+	if (!force && cache.hash === hash && (await isBuilt(spa))) {
+		console.log(`[${spa}] sources unchanged, reusing the last build`);
+		return true;
+	}
+
+	const ok = await run(spa, 'yarn', ['build'], spaPath);
+	if (ok) {
+		await fs.mkdir(path.dirname(cacheFile), { recursive: true });
+		await fs.writeFile(cacheFile, JSON.stringify({ hash, builtAt: new Date().toISOString() }));
+	} else {
+		console.error(`[${spa}] build failed`);
+	}
+	return ok;
+}
+
+async function pool(items, limit, worker) {
+	const results = [];
+	let next = 0;
+	const runners = Array.from({ length: Math.min(limit, items.length) }, async () => {
+		while (next < items.length) {
+			const index = next++;
+			results[index] = await worker(items[index]);
+		}
+	});
+	await Promise.all(runners);
+	return results;
+}
+
+function parseArgs(argv) {
+	const args = {
+		force: false,
+		// Vite builds are CPU and memory heavy, use half the cores by default
+		jobs: Number(process.env.DOPPIO_BUILD_JOBS) || Math.max(1, Math.floor(os.cpus().length / 2)),
+		spas: [],
+	};
+	for (let i = 0; i < argv.length; i++) {
+		if (argv[i] === '--force') {
+			args.force = true;
+		} else if (argv[i] === '--jobs' || argv[i] === '-j') {
+			args.jobs = Math.max(1, Number(argv[++i]) || 1);
+		} else {
+			args.spas.push(argv[i]);
+		}
+	}
+	return args;
+}
+
+const args = parseArgs(process.argv.slice(2));
+const spas = args.spas.length ? args.spas : await getSPAs();
+const results = await pool(spas, args.jobs, (spa) => build(spa, args.force));
+
+if (results.includes(false)) {
+	process.exit(1);
+}
@@ -0,0 +1,144 @@
+// Publishes a built SPA without ever exposing a half-written directory, and
+// keeps the hashed assets of previous builds around for clients still running
+// an older index.html. Generated by doppio, run by the SPA's build script:
+//
+//	node ../doppio-deploy.mjs <spa>
+//
+// Vite builds into public/.doppio/<spa>/staging. The build becomes a new
+// generation directory next to it, public/<spa> is a symlink that is swapped to
+// the new generation in one rename, and www/<spa>.html is replaced the same
+// way. Hashed files under assets/ of the last DOPPIO_ASSET_GENERATIONS
+// (default 3) generations are carried forward into the new one, so lazy
+// chunks requested by old pages keep loading. Older generations are deleted.
+// The number kept is recorded in public/.doppio/<spa>/generations.json, for
+// doppio's daily cleanup (doppio.utils.assets) to keep as many.
+
+import fs from 'fs/promises';
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+const APP_ROOT = path.dirname(fileURLToPath(import.meta.url));
+const APP = path.basename(APP_ROOT);
+const PUBLIC = path.join(APP_ROOT, APP, 'public');
+const WWW = path.join(APP_ROOT, APP, 'www');
+const KEEP = Math.max(1, Number(process.env.DOPPIO_ASSET_GENERATIONS) || 3);
+const GENERATION_FILE = '.doppio-generation.json';
+const GENERATIONS_FILE = 'generations.json';
+const GENERATION_PATTERN = /^g\d+$/;
+
+async function listFiles(dir, root = dir) {
+	const files = [];
+	for (const dirent of await fs.readdir(dir, { withFileTypes: true })) {
+		const file = path.join(dir, dirent.name);
+		if (dirent.isDirectory()) {
+			files.push(...(await listFiles(file, root)));
+		} else if (dirent.isFile() && dirent.name !== GENERATION_FILE) {
+			files.push(path.relative(root, file));
+		}
+	}
+	return files;
+}
+
+async function getGenerations(generationsPath) {
+	const names = await fs.readdir(generationsPath).catch(() => []);
+	// newest first
+	return names
+		.filter((name) => GENERATION_PATTERN.test(name))
+		.sort((a, b) => Number(b.slice(1)) - Number(a.slice(1)));
+}
+
+async function readGeneration(generationPath) {
+	try {
+		return JSON.parse(await fs.readFile(path.join(generationPath, GENERATION_FILE), 'utf8'));
+	} catch (e) {
+		return { files: [] };
+	}
+}
+
+async function carryForward(from, to, file) {
+	const target = path.join(to, file);
+	await fs.mkdir(path.dirname(target), { recursive: true });
+	try {
+		// generations live on the same filesystem, so a hard link costs nothing
+		await fs.link(path.join(from, file), target);
+	} catch (e) {
+		if (e.code === 'EEXIST') return;
+		if (e.code === 'ENOENT') return;
+		await fs.copyFile(path.join(from, file), target);
+	}
+}
+
+async function swapSymlink(linkPath, target) {
+	const tmp = `${linkPath}.doppio-tmp`;
+	await fs.rm(tmp, { force: true });
+	await fs.symlink(target, tmp);
+
+	const stat = await fs.lstat(linkPath).catch(() => null);
+	if (stat && !stat.isSymbolicLink()) {
+		// first deploy over a plain build directory, which a symlink can't
+		// atomically replace: move it out of the way first
+		await fs.rename(linkPath, `${linkPath}.doppio-old`);
+		await fs.rename(tmp, linkPath);
+		await fs.rm(`${linkPath}.doppio-old`, { recursive: true, force: true });
+	} else {
+		await fs.rename(tmp, linkPath);
+	}
+}
+
+async function writeAtomic(from, to) {
+	const tmp = `${to}.doppio-tmp`;
+	await fs.mkdir(path.dirname(to), { recursive: true });
+	await fs.copyFile(from, tmp);
+	await fs.rename(tmp, to);
+}
+
+async function deploy(spa) {
+	const generationsPath = path.join(PUBLIC, '.doppio', spa);
+	const staging = path.join(generationsPath, 'staging');
+
+	try {
+		await fs.access(path.join(staging, 'index.html'));
+	} catch (e) {
+		throw new Error(`No build found in ${staging}, run vite build first`);
+	}
+
+	const files = await listFiles(staging);
+	const own = new Set(files);
+
+	const previous = await getGenerations(generationsPath);
+	for (const name of previous.slice(0, KEEP - 1)) {
+		const generationPath = path.join(generationsPath, name);
+		const generation = await readGeneration(generationPath);
+		for (const file of generation.files) {
+			if (file.startsWith('assets/') && !own.has(file)) {
+				own.add(file);
+				await carryForward(generationPath, staging, file);
+			}
+		}
+	}
+
+	await fs.writeFile(
+		path.join(staging, GENERATION_FILE),
+		JSON.stringify({ files, createdAt: new Date().toISOString() })
+	);
+
+	const name = `g${Date.now()}`;
+	await fs.rename(staging, path.join(generationsPath, name));
+
+	await swapSymlink(path.join(PUBLIC, spa), path.join('.doppio', spa, name));
+	await writeAtomic(path.join(generationsPath, name, 'index.html'), path.join(WWW, `${spa}.html`));
+
+	await fs.writeFile(path.join(generationsPath, GENERATIONS_FILE), JSON.stringify({ keep: KEEP }));
+	for (const old of previous.slice(KEEP - 1)) {
+		await fs.rm(path.join(generationsPath, old), { recursive: true, force: true });
+	}
+
+	console.log(`Deployed ${spa} as ${name}`);
+}
+
+const spa = process.argv[2];
+if (!spa) {
+	console.error('Usage: node doppio-deploy.mjs <spa>');
+	process.exit(1);
+}
+await deploy(spa);
@@ -0,0 +1,3 @@
+VITE_BASE_PATH=
+VITE_SOCKET_PORT=9000
+VITE_SITE_NAME=TO_BE_FILLED_MANUALLY
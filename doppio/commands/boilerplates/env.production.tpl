@@ -0,0 +1 @@
+VITE_BASE_PATH=/{{name}}
@@ -0,0 +1,38 @@
+<!doctype html>
+<html lang="en">
+  <head>
+    <meta charset="UTF-8" />
+    <link rel="icon" type="image/svg+xml" href="/vite.svg" />
+    <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+    <title>{{ title }}</title>
+  </head>
+  <body>
+    <div id="{{ mount_id }}"></div>
+    <script type="application/json" id="frappe-boot">{{ boot_data }}</script>
+    <script>
+      window.frappe = {
+        session: { csrf_token: '{{ frappe.session.csrf_token }}' }
+      };
+      // parsed on first access rather than before the app starts loading
+      Object.defineProperty(window.frappe, 'boot', {
+        configurable: true,
+        enumerable: true,
+        get() {
+          let boot;
+          try {
+            boot = JSON.parse(document.getElementById('frappe-boot').textContent);
+          } catch (e) {
+            // not rendered by Frappe, e.g. served by the vite dev server
+          }
+          Object.defineProperty(window.frappe, 'boot', { value: boot, writable: true, configurable: true, enumerable: true });
+          return boot;
+        },
+        set(value) {
+          Object.defineProperty(window.frappe, 'boot', { value, writable: true, configurable: true, enumerable: true });
+        }
+      });
+    </script>
+    <script type="application/json" id="initial-data">{{ initial_data }}</script>
+    <script type="module" src="/src/{{ entry }}"></script>
+  </body>
+</html>
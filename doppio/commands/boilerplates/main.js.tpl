@@ -0,0 +1,65 @@
+{{#tailwindcss}}import './index.css';
+{{/tailwindcss}}import { createApp, reactive } from "vue";
+import App from "./App.vue";
+
+import router from './router';
+import resourceManager from "../../../doppio/libs/resourceManager";
+import call from "../../../doppio/libs/controllers/call";
+import socket from "../../../doppio/libs/controllers/socket";
+import Auth from "../../../doppio/libs/controllers/auth";
+import { cancelAll } from "../../../doppio/libs/controllers/scheduler";
+import { enableTelemetry } from "../../../doppio/libs/controllers/telemetry";
+import { __, loadTranslations } from "../../../doppio/libs/controllers/translation";
+
+const app = createApp(App);
+const auth = reactive(new Auth());
+
+// Opt-in, see doppio_telemetry in the README
+enableTelemetry();
+
+// Plugins
+app.use(router);
+app.use(resourceManager);
+
+// Global Properties,
+// components can inject this
+app.provide("$auth", auth);
+app.provide("$call", call);
+app.provide("$socket", socket);
+app.config.globalProperties.__ = __;
+
+
+// The translation catalog is fetched while the app starts, the first
+// navigation waits for it
+loadTranslations();
+router.beforeEach(async () => {
+	await loadTranslations();
+});
+
+// Configure route gaurds
+router.beforeEach(async (to, from, next) => {
+	if (to.matched.some((record) => !record.meta.isLoginPage)) {
+		// this route requires auth, check if logged in
+		// if not, redirect to login page.
+		if (!auth.isLoggedIn) {
+			next({ name: 'Login', query: { route: to.path } });
+		} else {
+			next();
+		}
+	} else {
+		if (auth.isLoggedIn) {
+			next({ name: 'Home' });
+		} else {
+			next();
+		}
+	}
+});
+
+// Background fetches are for the page being left
+router.afterEach((to, from) => {
+	if (to.path !== from.path) {
+		cancelAll("background");
+	}
+});
+
+app.mount("#app");
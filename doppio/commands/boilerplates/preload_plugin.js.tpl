@@ -0,0 +1,59 @@
+import fs from 'fs';
+import path from 'path';
+
+// Preload hints for the first render. Vite already preloads the entry's static
+// imports; this adds <link rel="modulepreload"> for the chunks of `critical`
+// lazy-loaded modules (e.g. the view of the landing route, as paths relative to
+// the project root) to the built index.html. Everything to preload is also
+// written to preload.json, which the www context sends as a Link header so
+// that proxies can answer with 103 Early Hints.
+export default function preload({ critical = [] } = {}) {
+	let config;
+	let hints = [];
+
+	return {
+		name: 'doppio-preload',
+		apply: 'build',
+		configResolved(resolvedConfig) {
+			config = resolvedConfig;
+		},
+		transformIndexHtml: {
+			order: 'post',
+			handler(html, { bundle }) {
+				const criticalIds = critical.map((module) => path.resolve(config.root, module));
+				const scripts = new Set();
+				const styles = new Set();
+
+				const visit = (chunk) => {
+					if (!chunk || chunk.type !== 'chunk' || scripts.has(chunk.fileName)) return;
+					scripts.add(chunk.fileName);
+					chunk.viteMetadata?.importedCss.forEach((file) => styles.add(file));
+					chunk.imports.forEach((file) => visit(bundle[file]));
+				};
+
+				for (const chunk of Object.values(bundle)) {
+					if (chunk.type === 'chunk' && (chunk.isEntry || criticalIds.includes(chunk.facadeModuleId))) {
+						visit(chunk);
+					}
+				}
+
+				hints = [
+					...[...scripts].map((file) => ({ href: config.base + file, rel: 'modulepreload' })),
+					...[...styles].map((file) => ({ href: config.base + file, rel: 'preload', as: 'style' })),
+				];
+
+				return hints
+					.filter((hint) => hint.rel === 'modulepreload' && !html.includes(hint.href))
+					.map((hint) => ({
+						tag: 'link',
+						attrs: { rel: 'modulepreload', crossorigin: true, href: hint.href },
+						injectTo: 'head',
+					}));
+			},
+		},
+		writeBundle(options) {
+			const outDir = options.dir || config.build.outDir;
+			fs.writeFileSync(path.join(outDir, 'preload.json'), JSON.stringify(hints));
+		},
+	};
+}
@@ -0,0 +1,43 @@
+import fs from 'fs';
+import http from 'http';
+import path from 'path';
+
+// Port of the bench web server. Environment variables take precedence over
+// sites/common_site_config.json, which is only read if they are not set.
+const webserver_port =
+	process.env.FRAPPE_WEBSERVER_PORT ||
+	process.env.WEBSERVER_PORT ||
+	readWebserverPort();
+
+function readWebserverPort() {
+	const config_path = path.resolve(__dirname, '../../../sites/common_site_config.json');
+	try {
+		return JSON.parse(fs.readFileSync(config_path, 'utf-8')).webserver_port || 8000;
+	} catch (e) {
+		return 8000;
+	}
+}
+
+// Reuse connections to the bench instead of opening one per proxied request
+const agent = new http.Agent({ keepAlive: true, maxSockets: 64 });
+
+// Resolved target per host header, the site name is the host without the port
+const targets = new Map();
+
+export default {
+	'^/(app|api|assets|files|private)': {
+		target: `http://127.0.0.1:${webserver_port}`,
+		ws: true,
+		agent,
+		router: function(req) {
+			const host = req.headers.host;
+			let target = targets.get(host);
+			if (!target) {
+				const site_name = host.split(':')[0];
+				target = `http://${site_name}:${webserver_port}`;
+				targets.set(host, target);
+			}
+			return target;
+		}
+	}
+};
@@ -0,0 +1,81 @@
+import fs from 'fs';
+import path from 'path';
+import { createHash } from 'crypto';
+
+const SERVICE_WORKER_URL = '/api/method/{{ app }}.www.{{ name }}.service_worker';
+const SCOPE = '/{{ name }}';
+
+// Builds src/sw.js into sw.js next to the build output, with a precache list
+// read from Vite's build manifest, and registers it from the built index.html
+export default function pwa() {
+	let config;
+
+	return {
+		name: 'doppio-pwa',
+		apply: 'build',
+		config() {
+			return { build: { manifest: true } };
+		},
+		configResolved(resolvedConfig) {
+			config = resolvedConfig;
+		},
+		transformIndexHtml() {
+			return [
+				{
+					tag: 'script',
+					injectTo: 'body',
+					children: `if ('serviceWorker' in navigator) {
+	window.addEventListener('load', () => {
+		navigator.serviceWorker.register('${SERVICE_WORKER_URL}', { scope: '${SCOPE}' });
+		// the worker only serves cached pages to the user they were cached for
+		const user = document.cookie.match(/(?:^|; )user_id=([^;]*)/);
+		navigator.serviceWorker.ready.then((registration) => {
+			registration.active.postMessage({
+				type: 'doppio:user',
+				user: user ? decodeURIComponent(user[1]) : 'Guest',
+			});
+		});
+	});
+}`,
+				},
+			];
+		},
+		writeBundle(options) {
+			const outDir = options.dir || config.build.outDir;
+			const manifest = JSON.parse(
+				fs.readFileSync(path.join(outDir, '.vite', 'manifest.json'), 'utf8')
+			);
+
+			// everything the entry needs before it renders: its chunk, static
+			// imports, css and assets. Lazy chunks are cached when first loaded.
+			const files = new Set();
+			const visit = (key) => {
+				const chunk = manifest[key];
+				if (!chunk || files.has(chunk.file)) return;
+				files.add(chunk.file);
+				(chunk.css || []).forEach((file) => files.add(file));
+				(chunk.assets || []).forEach((file) => files.add(file));
+				(chunk.imports || []).forEach(visit);
+			};
+			Object.keys(manifest)
+				.filter((key) => manifest[key].isEntry)
+				.forEach(visit);
+
+			const precache = [...files].sort();
+			const source = fs.readFileSync(path.resolve(config.root, 'src/sw.js'), 'utf8');
+			const version = createHash('sha1')
+				.update(source)
+				.update(precache.join('\n'))
+				.digest('hex')
+				.slice(0, 12);
+
+			fs.writeFileSync(
+				path.join(outDir, 'sw.js'),
+				source
+					.replace('__DOPPIO_PRECACHE__', JSON.stringify(precache))
+					.replace('__DOPPIO_VERSION__', JSON.stringify(version))
+					.replace('__DOPPIO_BASE__', JSON.stringify(config.base))
+			);
+		},
+	};
+}
@@ -0,0 +1,20 @@
+import { createRouter, createWebHistory } from "vue-router";
+import Home from "../views/Home.vue";
+import authRoutes from './auth';
+
+const routes = [
+  {
+	path: "/",
+	name: "Home",
+	component: Home,
+  },
+  ...authRoutes,
+];
+
+const router = createRouter({
+  base: "/{{name}}/",
+  history: createWebHistory(),
+  routes,
+});
+
+export default router;
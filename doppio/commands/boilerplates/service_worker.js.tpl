@@ -0,0 +1,127 @@
+// Service worker of this SPA, generated by doppio. `vite build` turns this file
+// into sw.js in the build output (see pwa.js), replacing the __DOPPIO_*__
+// placeholders. It is served by the service_worker method of the www context.
+//
+// - the entry chunks are precached, and hashed files under the SPA's asset
+//   base are served cache-first, since their content never changes
+// - page loads, and the API methods in CACHED_API_METHODS, always go to the
+//   network. Their last response is only served when the network fails, i.e.
+//   offline, and only to the user it was cached for.
+// - every cache of a previous build is deleted when a new version activates
+
+const PRECACHE = __DOPPIO_PRECACHE__;
+const VERSION = __DOPPIO_VERSION__;
+const BASE = __DOPPIO_BASE__;
+
+const CACHE_PREFIX = `doppio:${BASE}:`;
+const ASSETS_CACHE = `${CACHE_PREFIX}assets:${VERSION}`;
+const RUNTIME_CACHE_PREFIX = `${CACHE_PREFIX}runtime:${VERSION}:`;
+const USER_CACHE = `${CACHE_PREFIX}user`;
+
+// Read-only methods whose last response may be shown offline, e.g.
+// '/api/method/frappe.auth.get_logged_user'. Responses of other API calls are
+// never cached, they could be stale or belong to another user.
+const CACHED_API_METHODS = [];
+
+// Set by the page on every load (see pwa.js), the runtime cache is per user
+let user = null;
+
+self.addEventListener('install', (event) => {
+	event.waitUntil(
+		caches
+			.open(ASSETS_CACHE)
+			.then((cache) => cache.addAll(PRECACHE.map((file) => BASE + file)))
+			.then(() => self.skipWaiting())
+	);
+});
+
+self.addEventListener('activate', (event) => {
+	event.waitUntil(
+		caches
+			.keys()
+			.then((keys) =>
+				Promise.all(
+					keys
+						// runtime caches too, they hold pages of the previous build
+						.filter((key) => key.startsWith(CACHE_PREFIX) && key !== ASSETS_CACHE && key !== USER_CACHE)
+						.map((key) => caches.delete(key))
+				)
+			)
+			.then(() => self.clients.claim())
+	);
+});
+
+self.addEventListener('fetch', (event) => {
+	const { request } = event;
+	const url = new URL(request.url);
+	if (url.origin !== self.location.origin) return;
+
+	if (url.pathname === '/api/method/logout') {
+		// cached responses belong to the user logging out
+		event.waitUntil(setUser('Guest'));
+		return;
+	}
+	if (request.method !== 'GET') return;
+
+	if (url.pathname.startsWith(BASE)) {
+		event.respondWith(cacheFirst(request));
+	} else if (request.mode === 'navigate' || CACHED_API_METHODS.includes(url.pathname)) {
+		event.respondWith(networkFirst(request));
+	}
+});
+
+self.addEventListener('message', (event) => {
+	if (event.data?.type === 'doppio:user') {
+		event.waitUntil(setUser(event.data.user || 'Guest'));
+	}
+});
+
+async function getUser() {
+	if (user === null) {
+		const stored = await (await caches.open(USER_CACHE)).match('user');
+		user = stored ? await stored.text() : 'Guest';
+	}
+	return user;
+}
+
+async function setUser(newUser) {
+	const previous = await getUser();
+	user = newUser;
+	await (await caches.open(USER_CACHE)).put('user', new Response(newUser));
+
+	if (previous !== newUser) {
+		// logged out, session expired or another user logged in
+		const keys = await caches.keys();
+		await Promise.all(
+			keys.filter((key) => key.startsWith(`${CACHE_PREFIX}runtime:`)).map((key) => caches.delete(key))
+		);
+	}
+}
+
+async function cacheFirst(request) {
+	const cached = await caches.match(request);
+	if (cached) return cached;
+
+	const response = await fetch(request);
+	if (response.ok) {
+		const cache = await caches.open(ASSETS_CACHE);
+		cache.put(request, response.clone());
+	}
+	return response;
+}
+
+async function networkFirst(request) {
+	const cache = await caches.open(RUNTIME_CACHE_PREFIX + (await getUser()));
+	try {
+		const response = await fetch(request);
+		if (response.ok) {
+			cache.put(request, response.clone());
+		}
+		return response;
+	} catch (e) {
+		// offline: serve the last response if there is one
+		const cached = await cache.match(request);
+		if (cached) return cached;
+		throw e;
+	}
+}
@@ -0,0 +1,10 @@
+// React runtime shared by every desk page of this app, loaded once per session.
+// In desk page directories "react" and "react-dom" resolve to shims that return
+// these copies, so page bundles don't ship their own. Order matters: react-dom
+// requires "react".
+frappe.provide("frappe.doppio.runtime");
+if (!frappe.doppio.runtime.React) {
+	frappe.doppio.runtime.React = require("doppio-react");
+	frappe.doppio.runtime.ReactDOM = require("doppio-react-dom");
+	frappe.doppio.runtime.ReactDOMClient = require("doppio-react-dom/client");
+}
@@ -0,0 +1,2 @@
+// Generated by doppio: resolves to the runtime loaded by {{ runtime_bundle }}
+module.exports = window.{{ global_name }};
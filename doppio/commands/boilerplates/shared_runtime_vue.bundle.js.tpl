@@ -0,0 +1,8 @@
+// Vue runtime shared by every desk page of this app, loaded once per session.
+// In desk page directories "vue" resolves to a shim that returns this copy, so
+// page bundles don't ship their own. It is kept apart from any window.Vue of
+// the desk, which may be another version.
+frappe.provide("frappe.doppio.runtime");
+if (!frappe.doppio.runtime.Vue) {
+	frappe.doppio.runtime.Vue = require("doppio-vue/dist/vue.runtime.esm-bundler.js");
+}
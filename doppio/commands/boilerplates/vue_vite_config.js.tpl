@@ -0,0 +1,39 @@
+import path from 'path';
+import { defineConfig } from 'vite';
+import vue from '@vitejs/plugin-vue';
+{{#tailwindcss}}import tailwindcss from '@tailwindcss/vite';
+{{/tailwindcss}}{{#pwa}}import pwa from './pwa';
+{{/pwa}}import preload from './preload';
+import proxyOptions from './proxyOptions';
+
+// https://vitejs.dev/config/
+export default defineConfig({
+	plugins: [vue(){{#tailwindcss}}, tailwindcss(){{/tailwindcss}}, preload({ critical: [{{ critical }}] }){{#pwa}}, pwa(){{/pwa}}],
+	server: {
+		port: 8080,
+		host: '0.0.0.0',
+		proxy: proxyOptions,
+		// transformed when the server starts instead of on the first page load
+		warmup: {
+			clientFiles: [{{ warmup }}]
+		}
+	},
+	optimizeDeps: {
+		// everything the presets installed, pre-bundled before the first page load
+		// instead of being discovered by it, followed by a reload
+		include: [{{ optimize_deps }}]
+	},
+	// outside node_modules, so that reinstalling dependencies keeps the pre-bundle
+	cacheDir: '../../../.doppio/vite-cache/{{app}}-{{name}}',
+	resolve: {
+		alias: {
+			'@': path.resolve(__dirname, 'src')
+		}
+	},
+	build: {
+		// published to ../{{app}}/public/{{name}} by doppio-deploy.mjs
+		outDir: '../{{app}}/public/.doppio/{{name}}/staging',
+		emptyOutDir: true,
+		target: 'es2015',
+	},
+});
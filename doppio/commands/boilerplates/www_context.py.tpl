@@ -0,0 +1,190 @@
+import frappe
+import json
+import re
+
+from functools import lru_cache
+from pathlib import Path
+{{#pwa}}
+from werkzeug.wrappers import Response
+{{/pwa}}
+no_cache = 1
+
+# Written next to the build output by the preload vite plugin
+PRELOAD_HINTS_PATH = Path(__file__).parent.parent / "public" / Path(__file__).stem / "preload.json"
+
+# Declares the doctypes `bench doppio-meta` snapshots into the SPA (doppio.meta)
+PACKAGE_JSON_PATH = Path(__file__).parents[2] / Path(__file__).stem / "package.json"
+
+# Written by `bench doppio-translations`, maps languages to the SPA's catalogs
+TRANSLATIONS_INDEX_PATH = (
+	Path(__file__).parent.parent / "public" / "locale" / Path(__file__).stem / "index.json"
+)
+
+SCRIPT_TAG_PATTERN = re.compile(r"\<script[^<]*\</script\>")
+CLOSING_SCRIPT_TAG_PATTERN = re.compile(r"</script\>")
+
+# Resources fetched while rendering the page and embedded in it, so the first
+# view renders without waiting for API calls. Maps a route (the path after the
+# SPA's base, "*" for every route) to the resources to prefetch for it.
+# Methods must be whitelisted and read-only; they run as the session user.
+# The SPA picks up an entry by its key (defaults to the method):
+# Resources with the same method and params use it instead of fetching, and
+# useFrappeGetCall(method, params, key) hooks get it as their initial data.
+INITIAL_RESOURCES = {
+	# "/": [
+	# 	{"method": "frappe.auth.get_logged_user"},
+	# 	{"key": "todos", "method": "frappe.client.get_list", "params": {"doctype": "ToDo"}},
+	# ],
+}
+
+
+def get_context(context):
+	if frappe.session.user == "Guest":
+		boot = frappe.website.utils.get_boot_data()
+	else:
+		try:
+			boot = frappe.sessions.get()
+		except Exception as e:
+			raise frappe.SessionBootFailed from e
+
+	set_translations(boot)
+	set_meta_versions(boot)
+
+	boot_json = frappe.as_json(boot, indent=None, separators=(",", ":"))
+	boot_json = SCRIPT_TAG_PATTERN.sub("", boot_json)
+	boot_json = CLOSING_SCRIPT_TAG_PATTERN.sub("", boot_json)
+
+	route = "/" + (frappe.form_dict.app_path or "").strip("/")
+	initial_data_json = frappe.as_json(get_initial_data(route), indent=None, separators=(",", ":"))
+
+	set_preload_header(get_socketio_origin())
+
+	context.update({
+		"build_version": frappe.utils.get_build_version(),
+		# embedded as JSON and parsed on first use of frappe.boot
+		"boot_data": boot_json.replace("</", "<\\/"),
+		# for pages built before boot_data
+		"boot": json.dumps(boot_json),
+		# escaped so that it can't close the <script> it is embedded in
+		"initial_data": initial_data_json.replace("</", "<\\/"),
+	})
+
+	return context
+
+
+def set_translations(boot):
+	"""Replace the messages of every app in the boot with the URL of the SPA's catalog, if there is one"""
+	lang = frappe.local.lang
+	# edited on this site, so not in the exported catalogs
+	boot["translation_overrides"] = frappe.translate.get_user_translations(lang)
+
+	index = read_json(TRANSLATIONS_INDEX_PATH) or {}
+	if lang in index:
+		app = Path(__file__).parent.parent.name
+		boot["translations_url"] = f"/assets/{app}/locale/{Path(__file__).stem}/{index[lang]}"
+		boot.pop("__messages", None)
+	# else no catalog for this language, libs/controllers/translation.js reads __messages
+
+
+def set_meta_versions(boot):
+	"""Current versions of the doctype meta the SPA snapshots, see libs/controllers/meta.js"""
+	package_json = read_json(PACKAGE_JSON_PATH) or {}
+	doctypes = package_json.get("doppio", {}).get("meta")
+	if doctypes:
+		from doppio.meta import get_meta_versions
+
+		boot["doppio_meta_versions"] = get_meta_versions(doctypes)
+
+
+def get_socketio_origin():
+	"""Origin the socket.io client connects to, if not the page's own (see libs/controllers/socket.js)"""
+	host = frappe.local.request.host if getattr(frappe.local, "request", None) else ""
+	if ":" not in host:
+		# production, socket.io is proxied on the same origin
+		return None
+
+	hostname = host.rsplit(":", 1)[0]
+	return f"http://{hostname}:{frappe.conf.socketio_port or 9000}"
+
+
+def set_preload_header(socketio_origin=None):
+	"""Send the build's preload hints and a preconnect to socket.io as a Link header.
+
+	Browsers act on it before parsing the page, and proxies can turn it into 103 Early Hints.
+	"""
+	links = []
+	for hint in get_preload_hints():
+		link = f"<{hint['href']}>; rel={hint['rel']}"
+		if hint.get("as"):
+			link += f"; as={hint['as']}"
+		links.append(link)
+
+	if socketio_origin:
+		links.append(f"<{socketio_origin}>; rel=preconnect")
+
+	headers = getattr(frappe.local, "response_headers", None)
+	if links and headers is not None:
+		headers["Link"] = ", ".join(links)
+
+
+def get_preload_hints():
+	return read_json(PRELOAD_HINTS_PATH) or []
+
+
+def read_json(path: Path):
+	"""Contents of a JSON file the SPA is built or configured with, None if missing"""
+	try:
+		return read_json_file(path, path.stat().st_mtime)
+	except (FileNotFoundError, ValueError):
+		return None
+
+
+@lru_cache(maxsize=8)
+def read_json_file(path, mtime):
+	# keyed by mtime, so that a new build is picked up
+	return json.loads(path.read_text())
+
+
+def get_initial_data(route):
+	initial_data = {}
+	for resource in INITIAL_RESOURCES.get("*", []) + INITIAL_RESOURCES.get(route, []):
+		method = resource["method"]
+		params = resource.get("params") or {}
+		try:
+			fn = frappe.get_attr(method)
+			# same checks as an API call: whitelisted, and allowed for guests if logged out
+			frappe.is_whitelisted(fn)
+			message = frappe.call(fn, **params)
+		except Exception:
+			# leave it to the client to fetch (and report the error)
+			frappe.local.message_log = []
+			continue
+
+		initial_data[resource.get("key", method)] = {
+			"method": method,
+			"params": params,
+			"message": message,
+		}
+
+	return initial_data
+{{#pwa}}
+
+
+@frappe.whitelist(allow_guest=True, methods=["GET"])
+def service_worker():
+	"""Serve the service worker built into public/<spa>/sw.js.
+
+	Scripts under /assets can only control pages under /assets, so it is served
+	from here with a Service-Worker-Allowed header for the SPA's route.
+	"""
+	spa = Path(__file__).stem
+	sw_path = PRELOAD_HINTS_PATH.with_name("sw.js")
+	if not sw_path.exists():
+		raise frappe.DoesNotExistError
+
+	response = Response(sw_path.read_text(), mimetype="text/javascript")
+	response.headers["Service-Worker-Allowed"] = f"/{spa}"
+	# browsers check for a new worker on navigation, always revalidate
+	response.headers["Cache-Control"] = "no-cache"
+	return response
+{{/pwa}}
\ No newline at end of file
@@ -1,43 +1,141 @@
 import os
+import json
 import click
 import frappe
+import shutil
 import subprocess
 
 from frappe import scrub
 from pathlib import Path
 
-from .boilerplates import (
-	DESK_PAGE_JS_BUNDLE_TEMPLATE_VUE,
-	DESK_PAGE_JS_TEMPLATE,
-	DESK_PAGE_VUE_APP_COMPONENT_BOILERPLATE,
-	DESK_PAGE_JSX_BUNDLE_TEMPLATE_REACT,
-	DESK_PAGE_REACT_APP_COMPONENT_BOILERPLATE,
-)
+from .boilerplates import render
+from .presets import PRESETS
 
+# Modules that desk page bundles import from shims returning the shared runtime
+# in shared runtime mode: package name -> {module: (shim file, global name)}
+SHARED_RUNTIME_SHIMS = {
+	"vue": {"vue": {"vue": ("index.js", "frappe.doppio.runtime.Vue")}},
+	"react": {
+		"react": {"react": ("index.js", "frappe.doppio.runtime.React")},
+		"react-dom": {
+			"react-dom": ("index.js", "frappe.doppio.runtime.ReactDOM"),
+			"react-dom/client": ("client.js", "frappe.doppio.runtime.ReactDOMClient"),
+		},
+	},
+}
 
-def setup_desk_page(site, app_name, page_name, starter):
+SHARED_RUNTIME_DIR = "doppio_shared"
+
+
+# Module Def of each (site, app), looked up once per run by `get_app_module_def`
+module_def_cache = {}
+
+
+def setup_desk_page(site, app_name, page_name, starter, shared_runtime=False, headless=False):
+	setup_desk_pages(
+		site,
+		app_name,
+		[{"page_name": page_name, "starter": starter}],
+		shared_runtime=shared_runtime,
+		headless=headless,
+	)
+
+
+def setup_desk_pages(site, app_name, pages, shared_runtime=False, headless=False):
+	"""Create desk pages in a single transaction, then write their files and build assets once.
+
+	`pages` is a list of dicts with `page_name` and `starter` keys.
+	"""
 	if not frappe.conf.developer_mode:
 		click.echo("Please enable developer mode to add custom page")
 		return
 
-	page = create_page_doc(page_name, app_name, site)
-
-	if starter == "vue":
-		setup_vue_desk_page_starter(page, app_name)
-	elif starter == "react":
-		setup_react_desk_page_starter(page, app_name)
-	else:
+	starters = {page["starter"] for page in pages}
+	if not starters <= {"vue", "react"}:
 		click.echo("Please provide a valid starter")
 		return
 
-	launch_desk_page_in_browser(page, site)
+	module_name = get_app_module_def(app_name)
+	if not module_name:
+		click.echo(click.style(f"Make sure {app_name} is installed on the site {site}", fg="yellow"))
+		return
+
+	# Page.on_update exports each page to its module in developer mode, which a
+	# rollback doesn't undo: remove the directories this run exported
+	pages_path = Path(frappe.get_module_path(module_name)) / "page"
+	existing_paths = set(pages_path.iterdir()) if pages_path.exists() else None
+	try:
+		page_docs = [create_page_doc(page["page_name"], module_name) for page in pages]
+		frappe.db.commit()
+	except Exception:
+		frappe.db.rollback()
+		remove_new_paths(pages_path, existing_paths)
+		raise
 
+	for starter in sorted(starters):
+		setup_desk_page_framework(starter, app_name, shared_runtime)
 
-def setup_vue_desk_page_starter(page_doc, app_name):
-	setup_desk_page_for_framework("vue", page_doc, app_name)
+	for page, page_doc in zip(pages, page_docs):
+		setup_desk_page_for_framework(page["starter"], page_doc, app_name, shared_runtime)
 
+	from frappe.build import bundle
+
+	bundle("development", apps=app_name)
+
+	if len(page_docs) == 1 and not headless:
+		launch_desk_page_in_browser(page_docs[0], site)
+	else:
+		for page_doc in page_docs:
+			click.echo(f"Created {page_doc.title}: {frappe.utils.get_site_url(site)}/app/{page_doc.name}")
+
+
+def load_desk_pages_manifest(manifest_path, default_starter="vue"):
+	"""Read the pages to create from a YAML or JSON manifest.
+
+	The manifest is a list of pages, or a mapping with `pages` and optional
+	`starter` / `shared_runtime` defaults. Each page is a page name or a mapping
+	with `page_name` and an optional `starter`.
+	Returns (pages, shared_runtime).
+	"""
+	manifest_path = Path(manifest_path)
+	with manifest_path.open("r") as f:
+		if manifest_path.suffix == ".json":
+			manifest = json.load(f)
+		else:
+			import yaml
+
+			manifest = yaml.safe_load(f)
+
+	if isinstance(manifest, list):
+		manifest = {"pages": manifest}
+
+	starter = manifest.get("starter", default_starter)
+	pages = []
+	for page in manifest.get("pages") or []:
+		if isinstance(page, str):
+			page = {"page_name": page}
+		pages.append({"page_name": page["page_name"], "starter": page.get("starter", starter)})
+
+	return pages, manifest.get("shared_runtime", False)
+
+
+def setup_desk_page_framework(framework, app_name, shared_runtime=False):
+	"""Install what desk pages of `framework` need in the app, once per run"""
+	if shared_runtime:
+		setup_shared_runtime(app_name, framework)
+	elif framework == "react":
+		ensure_app_package_json(app_name)
+
+		# install react and react-dom
+		click.echo("Installing react and react-dom...")
+		react_versions = PRESETS["react"]["dependencies"]
+		subprocess.run(
+			["yarn", "add", *(f"{name}@{react_versions[name]}" for name in ("react", "react-dom"))],
+			cwd=Path("../apps") / app_name,
+		)
 
-def setup_react_desk_page_starter(page_doc, app_name):
+
+def ensure_app_package_json(app_name):
 	# check if package.json exists in app directory
 	# if not, create package.json using npm init --yes
 	app_path = Path("../apps") / app_name
@@ -45,16 +143,79 @@ def setup_react_desk_page_starter(page_doc, app_name):
 	if not package_json_path.exists():
 		subprocess.run(["npm", "init", "--yes"], cwd=app_path)
 
-	# install react and react-dom
-	click.echo("Installing react and react-dom...")
-	subprocess.run(
-		["yarn", "add", "react", "react-dom"], cwd=app_path
-	)
 
-	setup_desk_page_for_framework("react", page_doc, app_name)
+def get_shared_runtime_bundle(app_name, framework):
+	return f"{app_name}_{framework}_runtime.bundle.js"
+
+
+def setup_shared_runtime(app_name, framework):
+	"""Set up one framework runtime bundle shared by all desk pages of the app.
+
+	The real packages are installed under a `doppio-` alias and loaded once by the
+	runtime bundle, which puts them on `frappe.doppio.runtime`. Desk page
+	directories get a jsconfig.json (see `write_shared_runtime_jsconfig`) mapping
+	the framework to shims in `doppio_shared/` that return them, so page bundles
+	import the framework without bundling it again. Other bundles of the app
+	keep resolving the real packages.
+	"""
+	ensure_app_package_json(app_name)
+
+	app_path = Path("../apps") / app_name
+	runtime_bundle = get_shared_runtime_bundle(app_name, framework)
+	versions = PRESETS[framework]["dependencies"]
+
+	with (app_path / "package.json").open("r") as f:
+		dependencies = json.load(f).get("dependencies", {})
+
+	packages = []
+	for package, modules in SHARED_RUNTIME_SHIMS[framework].items():
+		shim_path = app_path / SHARED_RUNTIME_DIR / package
+		shim_path.mkdir(parents=True, exist_ok=True)
+
+		for shim_file, global_name in modules.values():
+			(shim_path / shim_file).write_text(
+				render("shared_runtime_shim.js", runtime_bundle=runtime_bundle, global_name=global_name)
+			)
+
+		if f"doppio-{package}" not in dependencies:
+			packages.append(f"doppio-{package}@npm:{package}@{versions[package]}")
+		if dependencies.get(package, "").startswith("file:"):
+			# replaced app-wide by earlier versions of doppio, restore the real package
+			packages.append(f"{package}@{versions[package]}")
+
+	if packages:
+		click.echo(f"Installing shared {framework} runtime...")
+		subprocess.run(["yarn", "add", *packages], cwd=app_path)
+
+	runtime_bundle_path = Path(frappe.get_app_path(app_name, "public", "js", runtime_bundle))
+	runtime_bundle_path.parent.mkdir(parents=True, exist_ok=True)
+	runtime_bundle_path.write_text(render(f"shared_runtime_{framework}.bundle.js"))
+
+
+def get_shared_runtime_paths(framework, shared_dir):
+	"""jsconfig `paths` resolving the framework's modules to the shims in `shared_dir`"""
+	return {
+		module: [f"{shared_dir}/{package}/{shim_file}"]
+		for package, modules in SHARED_RUNTIME_SHIMS[framework].items()
+		for module, (shim_file, _) in modules.items()
+	}
+
+
+def write_shared_runtime_jsconfig(page_path: Path, framework):
+	"""Resolve the framework to the shared runtime shims, for the files of one desk page only.
+
+	esbuild applies the `paths` of the closest jsconfig.json to every file below
+	it, including the code compiled from single file components.
+	"""
+	# <app>/<app>/public/js/<page> -> <app>/doppio_shared
+	shared_dir = f"../../../../{SHARED_RUNTIME_DIR}"
+	jsconfig = {
+		"compilerOptions": {"baseUrl": ".", "paths": get_shared_runtime_paths(framework, shared_dir)}
+	}
+	(page_path / "jsconfig.json").write_text(json.dumps(jsconfig, indent=2))
 
 
-def setup_desk_page_for_framework(framework, page_doc, app_name):
+def setup_desk_page_for_framework(framework, page_doc, app_name, shared_runtime=False):
 	bundle_type = "js" if framework == "vue" else "jsx"
 	context = {
 		"pascal_cased_name": page_doc.name.replace("-", " ").title().replace(" ", ""),
@@ -62,16 +223,14 @@ def setup_desk_page_for_framework(framework, page_doc, app_name):
 		"page_title": page_doc.title,
 		"page_name": page_doc.name,
 		"bundle_type": bundle_type,
+		"runtime_bundle": get_shared_runtime_bundle(app_name, framework) if shared_runtime else "",
 	}
 
-	desk_page_js_file_content = frappe.render_template(
-		DESK_PAGE_JS_TEMPLATE, context
-	)
-	desk_page_js_bundle_file_content = frappe.render_template(
-		DESK_PAGE_JS_BUNDLE_TEMPLATE_VUE
-		if framework == "vue"
-		else DESK_PAGE_JSX_BUNDLE_TEMPLATE_REACT,
-		context,
+	desk_page_js_file_content = render("desk_page.js", **context)
+	desk_page_js_bundle_file_content = render(
+		"desk_page_vue.bundle.js" if framework == "vue" else "desk_page_react.bundle.jsx",
+		pascal_cased_name=context["pascal_cased_name"],
+		scrubbed_name=context["scrubbed_name"],
 	)
 
 	# module
@@ -95,6 +254,8 @@ def setup_desk_page_for_framework(framework, page_doc, app_name):
 
 	# create dir if not exists
 	Path(js_bundle_file_path).parent.mkdir(parents=True, exist_ok=True)
+	if shared_runtime:
+		write_shared_runtime_jsconfig(Path(js_bundle_file_path).parent, framework)
 	with Path(js_bundle_file_path).open("w") as f:
 		f.write(desk_page_js_bundle_file_content)
 
@@ -111,53 +272,52 @@ def setup_desk_page_for_framework(framework, page_doc, app_name):
 		app_name / Path(app_component_path).relative_to(frappe.get_app_path(app_name))
 	)
 
-	app_component_template = None
-	if framework == "vue":
-		app_component_template = DESK_PAGE_VUE_APP_COMPONENT_BOILERPLATE
-	else:
-		app_component_template = DESK_PAGE_REACT_APP_COMPONENT_BOILERPLATE
+	app_component_template = "desk_page_app.vue" if framework == "vue" else "desk_page_app.jsx"
 
 	with Path(app_component_path).open("w") as f:
-		app_component_template = frappe.render_template(app_component_template, {
-			"app_component_path": app_component_path_relative,
-		})
-		f.write(app_component_template)
-
-	from frappe.build import bundle
-
-	bundle("development", apps=app_name)
-
+		f.write(render(app_component_template, app_component_path=app_component_path_relative))
+
+
+def get_app_module_def(app_name):
+	key = (frappe.local.site, app_name)
+	if key not in module_def_cache:
+		module_name = frappe.get_all(
+			"Module Def",
+			filters={"app_name": app_name},
+			limit=1,
+			pluck="name",
+			order_by="creation",
+		)
+		module_def_cache[key] = module_name[0] if module_name else None
 
-def create_page_doc(page_name, app_name, site):
-	module_name = frappe.get_all(
-		"Module Def",
-		filters={"app_name": app_name},
-		limit=1,
-		pluck="name",
-		order_by="creation",
-	)
+	return module_def_cache[key]
 
-	if module_name:
-		module_name = module_name[0]
-	else:
-		message = click.style(
-			f"Make sure {app_name} is installed on the site {site}", fg="yellow"
-		)
-		click.echo(message)
-		return
 
-	# create page doc
+def create_page_doc(page_name, module_name):
 	page = frappe.new_doc("Page")
 	page.module = module_name
 	page.standard = "Yes"
 	page.page_name = page_name
 	page.title = page_name
 	page.insert()
-
-	frappe.db.commit()
 	return page
 
 
+def remove_new_paths(path: Path, existing_paths):
+	"""Remove what was added to `path` since `existing_paths` were listed (None: it didn't exist)"""
+	if existing_paths is None:
+		shutil.rmtree(path, ignore_errors=True)
+		return
+	if not path.exists():
+		return
+
+	for new_path in set(path.iterdir()) - existing_paths:
+		if new_path.is_dir():
+			shutil.rmtree(new_path, ignore_errors=True)
+		else:
+			new_path.unlink()
+
+
 def launch_desk_page_in_browser(page, site):
 	click.echo(f"Opening {page.title} in browser...")
 	page_url = f"{frappe.utils.get_site_url(site)}/app/{page.name}"
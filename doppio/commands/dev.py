@@ -0,0 +1,93 @@
+import json
+import re
+import subprocess
+
+from pathlib import Path
+
+# Serves every SPA from one Node process, see `libs/dev/server.mjs`
+DEV_SERVER_PATH = Path(__file__).resolve().parents[2] / "libs" / "dev" / "server.mjs"
+
+# Where the vite dep pre-bundles of all SPAs of the bench are kept, one
+# directory per SPA. Outside node_modules so that a reinstall keeps them.
+VITE_CACHE_DIR = Path(".doppio") / "vite-cache"
+
+VITE_CONFIG_FILES = ("vite.config.js", "vite.config.ts", "vite.config.mjs")
+
+# Rules added by `add_routing_rule_to_hooks`, from_route is /<spa>/<path:app_path>
+ROUTE_RULE_PATTERN = re.compile(r"""["']from_route["']\s*:\s*["']/([\w-]+)/<path:\w+>["']""")
+
+
+def get_bench_apps(bench_path: Path):
+	apps_txt = bench_path / "sites" / "apps.txt"
+	if apps_txt.exists():
+		return [app.strip() for app in apps_txt.read_text().splitlines() if app.strip()]
+
+	return sorted(path.name for path in (bench_path / "apps").iterdir() if path.is_dir())
+
+
+def get_registered_spas(app_path: Path):
+	"""SPA directories of an app, from its package.json, route rules and doppio manifests"""
+	names = []
+
+	package_json_path = app_path / "package.json"
+	if package_json_path.exists():
+		with package_json_path.open("r") as f:
+			names += json.load(f).get("doppio", {}).get("spas", [])
+
+	hooks_py = app_path / app_path.name / "hooks.py"
+	if hooks_py.exists():
+		names += ROUTE_RULE_PATTERN.findall(hooks_py.read_text())
+
+	names += [path.parent.parent.name for path in app_path.glob("*/.doppio/manifest.json")]
+
+	# route rules also exist for pages that are not SPAs, only keep vite projects
+	return [
+		name
+		for name in dict.fromkeys(names)
+		if any((app_path / name / config).exists() for config in VITE_CONFIG_FILES)
+	]
+
+
+def discover_spas(bench_path: Path, apps=None, spas=None):
+	"""Every SPA of the bench, as dicts with `app`, `name`, `root` and `cacheDir`"""
+	discovered = []
+	for app in get_bench_apps(bench_path):
+		if apps and app not in apps:
+			continue
+
+		app_path = bench_path / "apps" / app
+		for name in get_registered_spas(app_path):
+			if spas and name not in spas:
+				continue
+
+			discovered.append(
+				{
+					"app": app,
+					"name": name,
+					"root": str((app_path / name).resolve()),
+					"cacheDir": str((bench_path / VITE_CACHE_DIR / f"{app}-{name}").resolve()),
+				}
+			)
+
+	return discovered
+
+
+def get_webserver_port(bench_path: Path):
+	config_path = bench_path / "sites" / "common_site_config.json"
+	try:
+		with config_path.open("r") as f:
+			return json.load(f).get("webserver_port") or 8000
+	except (OSError, ValueError):
+		return 8000
+
+
+def run_dev_server(spas, host="0.0.0.0", port=8080, bench_path: Path = Path("..")):
+	"""Serve `spas` at /<spa> from a single Node process, proxying the rest to the bench"""
+	config = {
+		"host": host,
+		"port": port,
+		"webserverPort": get_webserver_port(bench_path),
+		"spas": spas,
+	}
+
+	return subprocess.run(["node", str(DEV_SERVER_PATH), json.dumps(config)]).returncode
@@ -1,26 +1,11 @@
+import re
 import subprocess
 from pathlib import Path
 
-import click
+from .boilerplates import render
+from .utils import add_commands_to_root_package_json, add_routing_rule_to_hooks, create_file
 
-from .utils import add_commands_to_root_package_json, add_routing_rule_to_hooks
-
-
-@click.command("add-frappe-ui")
-@click.option("--name", default="frontend", prompt="Dashboard Name")
-@click.option("--app", prompt="App Name")
-def add_frappe_ui(name, app):
-    if not app:
-        click.echo("Please provide an app with --app")
-        return
-
-    click.echo(f"Adding Frappe UI starter to {app}...")
-    add_frappe_ui_starter(name, app)
-
-    click.echo(
-        f"🖥️  You can start the dev server by running 'yarn dev' in apps/{app}/{name}"
-    )
-    click.echo("📄  Docs: https://ui.frappe.io")
+OUT_DIR_PATTERN = re.compile(r"""outDir:\s*(['"`])[^'"`]*\1""")
 
 
 def add_frappe_ui_starter(name, app):
@@ -33,6 +18,25 @@ def add_frappe_ui_starter(name, app):
     add_commands_to_root_package_json(app, name)
     add_routing_rule_to_hooks(app, name)
     replace_placeholders_in_starter(app, name)
+    setup_deploy(app, name)
+
+
+def setup_deploy(app, name):
+    """Build the starter like generated SPAs: into a staging directory, deployed by doppio-deploy.mjs"""
+    app_path = Path("../apps", app)
+
+    # the build and deploy scripts the package.json scripts run
+    create_file(app_path / "doppio-build.mjs", render("doppio_build.mjs"))
+    create_file(app_path / "doppio-deploy.mjs", render("doppio_deploy.mjs"))
+
+    vite_config_path = app_path / name / "vite.config.js"
+    content = vite_config_path.read_text()
+    staging = f"outDir: '../{app}/public/.doppio/{name}/staging'"
+    if OUT_DIR_PATTERN.search(content):
+        content = OUT_DIR_PATTERN.sub(staging, content, count=1)
+    else:
+        content = content.replace("build: {", f"build: {{\n    {staging},", 1)
+    vite_config_path.write_text(content)
 
 
 def replace_placeholders_in_starter(app, name):
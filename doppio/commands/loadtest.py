@@ -0,0 +1,225 @@
+import asyncio
+import json
+import re
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import quote, urlencode, urlsplit
+
+import click
+
+CSRF_TOKEN_PATTERN = re.compile(r"csrf_token:\s*'([^']+)'")
+
+
+def percentile(values, percent):
+	"""`percent` (0-100) percentile of `values`, interpolating between closest ranks"""
+	if not values:
+		return None
+
+	values = sorted(values)
+	rank = (len(values) - 1) * percent / 100
+	lower = int(rank)
+	upper = min(lower + 1, len(values) - 1)
+	return values[lower] + (values[upper] - values[lower]) * (rank - lower)
+
+
+def get_query_string(params):
+	# same serialization as toQueryString in libs/controllers/utils.js: None is
+	# sent empty, and characters are escaped like encodeURIComponent does
+	return urlencode(
+		{
+			key: ""
+			if value is None
+			else json.dumps(value, sort_keys=True, separators=(",", ":"))
+			if isinstance(value, (dict, list, bool))
+			else value
+			for key, value in sorted(params.items())
+		},
+		quote_via=quote,
+		safe="!'()*",
+	)
+
+
+def load_session(spa, session_path=None):
+	"""Steps of a declared session: the SPA shell, then the calls listed in `session_path`.
+
+	The session file (YAML or JSON) is a list of steps, or a mapping with `steps`:
+
+		- call: frappe.auth.get_logged_user
+		- call: frappe.client.get_list
+		  params: {doctype: ToDo}
+		  cacheable: true          # sent as GET, like call(..., { cacheable: true })
+		- get: /api/resource/ToDo  # any other request
+		- think: 0.5               # seconds to wait
+
+	The shell request renders the www context, boot included.
+	"""
+	steps = [{"label": f"shell /{spa}", "method": "GET", "path": f"/{spa}", "shell": True}]
+	if not session_path:
+		return steps
+
+	session_path = Path(session_path)
+	with session_path.open("r") as f:
+		if session_path.suffix == ".json":
+			declared = json.load(f)
+		else:
+			import yaml
+
+			declared = yaml.safe_load(f)
+
+	if isinstance(declared, dict):
+		declared = declared.get("steps") or []
+
+	for step in declared:
+		if "think" in step:
+			steps.append({"think": float(step["think"])})
+		elif "call" in step:
+			params = step.get("params") or {}
+			path = f"/api/method/{step['call']}"
+			if step.get("cacheable"):
+				query = get_query_string(params)
+				steps.append({"label": step["call"], "method": "GET", "path": f"{path}?{query}" if query else path})
+			else:
+				steps.append({"label": step["call"], "method": "POST", "path": path, "json": params})
+		elif "get" in step:
+			steps.append({"label": step["get"], "method": "GET", "path": step["get"]})
+
+	return steps
+
+
+def load_har(har_path, spa):
+	"""Steps replaying the same-origin requests of a HAR file recorded in the browser"""
+	with open(har_path) as f:
+		entries = json.load(f)["log"]["entries"]
+
+	steps = []
+	for entry in entries:
+		request = entry["request"]
+		url = urlsplit(request["url"])
+		path = url.path + (f"?{url.query}" if url.query else "")
+		if url.path.startswith("/assets/") or url.path.startswith("/socket.io/"):
+			# static files and websockets are not what we are measuring
+			continue
+
+		step = {"label": url.path, "method": request["method"], "path": path}
+		if url.path.rstrip("/") == f"/{spa}" or url.path.startswith(f"/{spa}/"):
+			step.update(label=f"shell /{spa}", shell=True)
+
+		post_data = request.get("postData")
+		if post_data and post_data.get("text"):
+			step["data"] = post_data["text"]
+			step["content_type"] = post_data.get("mimeType")
+		steps.append(step)
+
+	return steps
+
+
+class VirtualUser:
+	def __init__(self, base_url, host, token=None, credentials=None):
+		import requests
+
+		self.base_url = base_url.rstrip("/")
+		self.credentials = credentials
+		self.session = requests.Session()
+		self.session.headers.update({"Host": host, "Accept": "application/json"})
+		if token:
+			self.session.headers["Authorization"] = f"token {token}"
+
+	def login(self):
+		if self.credentials:
+			usr, pwd = self.credentials
+			self.session.post(f"{self.base_url}/api/method/login", json={"usr": usr, "pwd": pwd})
+
+	def send(self, step):
+		headers = {}
+		if step.get("content_type"):
+			headers["Content-Type"] = step["content_type"]
+
+		response = self.session.request(
+			step["method"],
+			self.base_url + step["path"],
+			json=step.get("json"),
+			data=step.get("data"),
+			headers=headers,
+		)
+
+		if step.get("shell"):
+			# later calls need the CSRF token the shell embeds for the session
+			match = CSRF_TOKEN_PATTERN.search(response.text)
+			if match:
+				self.session.headers["X-Frappe-CSRF-Token"] = match.group(1)
+
+		return response
+
+
+async def run_load_test(steps, base_url, host, users=10, iterations=1, token=None, credentials=None):
+	"""Replay `steps` with `users` concurrent virtual users, `iterations` times each.
+
+	Returns (samples, elapsed), samples mapping each step label to a list of
+	(seconds, ok) tuples.
+	"""
+	import requests
+
+	loop = asyncio.get_running_loop()
+	# requests is blocking, give every virtual user its own thread
+	executor = ThreadPoolExecutor(max_workers=users)
+	samples = {}
+
+	async def virtual_user():
+		user = VirtualUser(base_url, host, token, credentials)
+		await loop.run_in_executor(executor, user.login)
+
+		for _ in range(iterations):
+			for step in steps:
+				if "think" in step:
+					await asyncio.sleep(step["think"])
+					continue
+
+				start = time.perf_counter()
+				try:
+					response = await loop.run_in_executor(executor, user.send, step)
+					ok = response.ok
+				except requests.RequestException:
+					ok = False
+				samples.setdefault(step["label"], []).append((time.perf_counter() - start, ok))
+
+	start = time.perf_counter()
+	try:
+		await asyncio.gather(*(virtual_user() for _ in range(users)))
+	finally:
+		executor.shutdown(wait=False)
+
+	return samples, time.perf_counter() - start
+
+
+def summarize(samples, elapsed):
+	rows = []
+	for label, results in samples.items():
+		durations = [seconds * 1000 for seconds, _ in results]
+		rows.append(
+			{
+				"label": label,
+				"requests": len(results),
+				"errors": sum(1 for _, ok in results if not ok),
+				"throughput": len(results) / elapsed if elapsed else 0,
+				"p50": percentile(durations, 50),
+				"p95": percentile(durations, 95),
+				"p99": percentile(durations, 99),
+			}
+		)
+	return rows
+
+
+def print_report(rows, elapsed, users):
+	total = sum(row["requests"] for row in rows)
+	click.echo(
+		f"\n{total} requests by {users} virtual users in {elapsed:.1f}s "
+		f"({total / elapsed if elapsed else 0:.1f} req/s)\n"
+	)
+	click.echo(f"{'Request':<50} {'Count':>7} {'Errors':>7} {'req/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+	for row in rows:
+		click.echo(
+			f"{row['label'][:50]:<50} {row['requests']:>7} {row['errors']:>7} {row['throughput']:>7.1f} "
+			f"{row['p50']:>8.0f} {row['p95']:>8.0f} {row['p99']:>8.0f}"
+		)
@@ -0,0 +1,47 @@
+import json
+
+from pathlib import Path
+
+# Snapshots are written to the SPA's source, where vite bundles each one as a
+# hashed chunk loaded by libs/controllers/meta.js when first needed
+SNAPSHOT_DIR = Path("src") / "meta"
+
+
+def get_snapshot_doctypes(spa_path: Path):
+	"""Doctypes declared under `doppio.meta` in the SPA's package.json"""
+	package_json_path = spa_path / "package.json"
+	if not package_json_path.exists():
+		return []
+
+	with package_json_path.open("r") as f:
+		return json.load(f).get("doppio", {}).get("meta", [])
+
+
+def snapshot_meta(app, spa_name):
+	"""Write the compact meta of the SPA's declared doctypes to src/meta/<doctype>.json.
+
+	Must run on an initialized site. Returns the doctypes snapshotted.
+	"""
+	import frappe
+
+	from doppio.meta import get_compact_meta
+
+	spa_path = Path("../apps") / app / spa_name
+	snapshot_path = spa_path / SNAPSHOT_DIR
+	doctypes = get_snapshot_doctypes(spa_path)
+
+	written = set()
+	for doctype in doctypes:
+		snapshot = json.dumps(get_compact_meta(doctype), indent=None, separators=(",", ":"), default=str)
+		file_name = f"{frappe.scrub(doctype)}.json"
+
+		snapshot_path.mkdir(parents=True, exist_ok=True)
+		(snapshot_path / file_name).write_text(snapshot)
+		written.add(file_name)
+
+	# doctypes no longer declared
+	for path in snapshot_path.glob("*.json"):
+		if path.name not in written:
+			path.unlink()
+
+	return doctypes
@@ -0,0 +1,183 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+
+from pathlib import Path
+
+# Version of create-vite used to scaffold SPAs, pinned so that the template's
+# own package.json does not drift between runs
+CREATE_VITE_VERSION = "5.5.5"
+
+# Curated yarn.lock files per preset combination, one directory per lockfile
+# format: "classic" for Yarn 1, "berry" for Yarn 2 and later
+LOCKFILES_PATH = Path(__file__).parent / "lockfiles"
+
+# A caret or tilde range on an exact version, e.g. "^9.13.0"
+VERSION_RANGE_PATTERN = re.compile(r"^[\^~](\d+\.\d+\.\d+)$")
+
+# Exact versions installed by each preset. Keep these in sync with the
+# lockfiles shipped in `lockfiles/` (see `get_preset_lockfile`).
+PRESETS = {
+	"vue": {
+		"dependencies": {
+			"vue": "3.5.12",
+			"vue-router": "4.4.5",
+			"socket.io-client": "4.8.1",
+		},
+		"devDependencies": {
+			"vite": "5.4.10",
+			"@vitejs/plugin-vue": "5.1.4",
+		},
+	},
+	"react": {
+		"dependencies": {
+			"react": "18.3.1",
+			"react-dom": "18.3.1",
+			"frappe-react-sdk": "1.8.0",
+		},
+		"devDependencies": {
+			"vite": "5.4.10",
+			"@vitejs/plugin-react": "4.3.3",
+			"@types/node": "22.8.1",
+		},
+		# entry points the boilerplates import besides the packages themselves
+		"optimizeDeps": ["react-dom/client"],
+	},
+	"typescript": {
+		"devDependencies": {
+			"typescript": "5.6.3",
+		},
+	},
+	"tailwindcss": {
+		"devDependencies": {
+			"tailwindcss": "4.0.0",
+			"@tailwindcss/vite": "4.0.0",
+		},
+	},
+	"shadcn": {
+		"dependencies": {
+			"class-variance-authority": "0.7.1",
+			"clsx": "2.1.1",
+			"tailwind-merge": "3.0.1",
+		},
+	},
+}
+
+
+def get_presets(framework, typescript=False, tailwindcss=False, shadcn=False):
+	"""Return the ordered list of preset names for a scaffold configuration"""
+	presets = [framework]
+
+	if typescript:
+		presets.append("typescript")
+	if tailwindcss:
+		presets.append("tailwindcss")
+	if shadcn:
+		presets.append("shadcn")
+
+	return presets
+
+
+def get_preset_dependencies(presets):
+	"""Merge the pinned dependencies of the given presets"""
+	dependencies, dev_dependencies = {}, {}
+	for preset in presets:
+		dependencies.update(PRESETS[preset].get("dependencies", {}))
+		dev_dependencies.update(PRESETS[preset].get("devDependencies", {}))
+
+	return dependencies, dev_dependencies
+
+
+def get_optimized_dependencies(presets):
+	"""Modules the vite dev server pre-bundles for the given presets"""
+	dependencies, _ = get_preset_dependencies(presets)
+	modules = list(dependencies)
+	for preset in presets:
+		modules += PRESETS[preset].get("optimizeDeps", [])
+
+	return sorted(modules)
+
+
+def pin_version(version):
+	match = VERSION_RANGE_PATTERN.match(version)
+	return match.group(1) if match else version
+
+
+def pin_preset_dependencies(package_json_path: Path, presets):
+	"""Write exact preset versions into package.json, and pin the template's own ranges.
+
+	The template of the pinned create-vite version lists `^x.y.z` ranges, which
+	are pinned to `x.y.z` so that they don't float either.
+	"""
+	dependencies, dev_dependencies = get_preset_dependencies(presets)
+
+	with package_json_path.open("r") as f:
+		data = json.load(f)
+
+	for key in ("dependencies", "devDependencies"):
+		data[key] = {name: pin_version(version) for name, version in data.get(key, {}).items()}
+
+	data.setdefault("dependencies", {}).update(dependencies)
+	data.setdefault("devDependencies", {}).update(dev_dependencies)
+
+	# A package must only be listed once, pinned versions win
+	for name in dependencies:
+		data["devDependencies"].pop(name, None)
+	for name in dev_dependencies:
+		data["dependencies"].pop(name, None)
+
+	with package_json_path.open("w") as f:
+		json.dump(data, f, indent=2)
+
+
+def get_yarn_version(cwd: Path):
+	# run in the SPA, which may pin its own yarn with packageManager
+	return subprocess.run(["yarn", "--version"], cwd=cwd, capture_output=True, text=True, check=True).stdout.strip()
+
+
+def is_yarn_berry(yarn_version):
+	return int(yarn_version.split(".", 1)[0]) >= 2
+
+
+def get_preset_lockfile(presets, yarn_version):
+	"""Path of the curated lockfile for this preset combination and yarn, if one ships with doppio"""
+	lockfile = (
+		LOCKFILES_PATH / ("berry" if is_yarn_berry(yarn_version) else "classic") / ("+".join(presets) + ".yarn.lock")
+	)
+	return lockfile if lockfile.exists() else None
+
+
+def get_install_command(yarn_version, frozen=False):
+	"""`yarn install`, refusing to change the lockfile if `frozen`, with the flags of this yarn version"""
+	if is_yarn_berry(yarn_version):
+		# berry installs from its cache by default
+		return ["yarn", "install", "--immutable"] if frozen else ["yarn", "install"]
+
+	return ["yarn", "install", "--prefer-offline"] + (["--frozen-lockfile"] if frozen else [])
+
+
+def install_preset_dependencies(spa_path: Path, presets, env=None):
+	"""Pin the preset dependencies and install them in one step.
+
+	If doppio ships a lockfile for the preset combination it is copied into the
+	SPA and installed frozen, so nothing is resolved and the install can be
+	served entirely from the yarn cache.
+	"""
+	package_json_path = spa_path / "package.json"
+	if not package_json_path.exists():
+		print("package.json not found. Skipping dependency installation.")
+		return
+
+	pin_preset_dependencies(package_json_path, presets)
+
+	yarn_version = get_yarn_version(spa_path)
+	lockfile = get_preset_lockfile(presets, yarn_version)
+	if lockfile:
+		shutil.copyfile(lockfile, spa_path / "yarn.lock")
+	else:
+		# berry defaults to immutable installs on CI, a new SPA has no lockfile yet
+		env = {**(env or os.environ), "YARN_ENABLE_IMMUTABLE_INSTALLS": "false"}
+
+	subprocess.run(get_install_command(yarn_version, frozen=bool(lockfile)), cwd=spa_path, env=env, check=True)
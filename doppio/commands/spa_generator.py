@@ -4,8 +4,16 @@ import json
 import re
 import os
 
+from functools import cached_property
 from pathlib import Path
-from .boilerplates import *
+from .boilerplates import render
+from .presets import (
+	CREATE_VITE_VERSION,
+	get_optimized_dependencies,
+	get_presets,
+	install_preset_dependencies,
+)
+from .upgrade import save_manifest
 from .utils import (
 	create_file,
 	add_commands_to_root_package_json,
@@ -14,7 +22,9 @@ from .utils import (
 
 
 class SPAGenerator:
-	def __init__(self, framework, spa_name, app, add_tailwindcss, typescript, add_shadcn=False):
+	def __init__(
+		self, framework, spa_name, app, add_tailwindcss, typescript, add_shadcn=False, add_pwa=False
+	):
 		"""Initialize a new SPAGenerator instance"""
 		self.framework = framework
 		self.app = app
@@ -24,9 +34,123 @@ class SPAGenerator:
 		self.add_tailwindcss = add_tailwindcss
 		self.use_typescript = typescript
 		self.add_shadcn = add_shadcn
+		self.add_pwa = add_pwa
+		self.presets = get_presets(framework, typescript, add_tailwindcss, add_shadcn)
+
+		# files written from boilerplates during this run, recorded in the
+		# manifest used by `bench doppio-upgrade`
+		self.generated_files = {}
 
 		self.validate_spa_name()
 
+	@property
+	def options(self):
+		return {
+			"framework": self.framework,
+			"typescript": self.use_typescript,
+			"tailwindcss": self.add_tailwindcss,
+			"shadcn": self.add_shadcn,
+			"pwa": self.add_pwa,
+		}
+
+	@cached_property
+	def template_files(self):
+		"""Every file rendered from a boilerplate, keyed by its path relative to the app directory.
+
+		Values are `(boilerplate name, rendered content)`. This is the single place
+		where boilerplates are rendered, so that `bench doppio-upgrade` can render
+		the current templates for an existing SPA.
+		"""
+		files = {}
+		ext = "ts" if self.use_typescript else "js"
+
+		def add(path, template_name, **context):
+			files[path] = (template_name, render(template_name, **context))
+
+		def to_js_list(values):
+			return ", ".join(f"'{value}'" for value in values)
+
+		optimize_deps = to_js_list(get_optimized_dependencies(self.presets))
+
+		spa = self.spa_name
+		add(f"{spa}/proxyOptions.{ext}", "proxy_options.js")
+		add(f"{spa}/preload.js", "preload_plugin.js")
+
+		if self.framework == "vue":
+			add(f"{spa}/src/main.{ext}", "main.js", tailwindcss=self.add_tailwindcss)
+			add(
+				f"{spa}/vite.config.{ext}",
+				"vue_vite_config.js",
+				app=self.app,
+				name=spa,
+				tailwindcss=self.add_tailwindcss,
+				pwa=self.add_pwa,
+				optimize_deps=optimize_deps,
+				# the entry and the views of the initial routes
+				warmup=to_js_list(
+					[f"./src/main.{ext}", "./src/App.vue", "./src/router/index.js", "./src/views/*.vue"]
+				),
+				# the view of the home route, lazy loaded by the router
+				critical=to_js_list(["src/views/Home.vue"]),
+			)
+			add(f"{spa}/src/router/index.js", "router_index.js", name=spa)
+			add(f"{spa}/src/router/auth.js", "auth_routes.js")
+			add(f"{spa}/src/App.vue", "app.vue")
+			add(f"{spa}/src/views/Home.vue", "home.vue")
+			add(f"{spa}/src/views/Login.vue", "login.vue")
+
+			if self.add_tailwindcss:
+				add(f"{spa}/src/index.css", "index.css")
+
+			add(f"{spa}/index.html", "index.html", title=spa, mount_id="app", entry=f"main.{ext}")
+
+		elif self.framework == "react":
+			add(
+				f"{spa}/vite.config.{ext}",
+				"react_vite_config.js",
+				app=self.app,
+				name=spa,
+				tailwindcss=self.add_tailwindcss,
+				pwa=self.add_pwa,
+				optimize_deps=optimize_deps,
+				warmup=to_js_list([f"./src/main.{ext}x", f"./src/App.{ext}x"]),
+				critical=to_js_list([f"src/App.{ext}x"]),
+			)
+
+			if self.add_tailwindcss:
+				add(f"{spa}/src/index.css", "index.css")
+			add(f"{spa}/src/App.{ext}x", "app.jsx", shadcn=self.add_shadcn)
+
+			add(f"{spa}/.env.local", "env.local")
+			add(f"{spa}/.env.production", "env.production", name=spa)
+			add(f"{spa}/index.html", "index.html", title=spa, mount_id="root", entry=f"main.{ext}x")
+
+			if self.add_shadcn:
+				add(f"{spa}/src/lib/utils.ts", "shadcn_utils.ts")
+				add(f"{spa}/components.json", "components.json")
+
+		# lives in the app's www directory, next to the built html entry
+		add(f"{self.app}/www/{spa}.py", "www_context.py", pwa=self.add_pwa)
+
+		if self.add_pwa:
+			add(f"{spa}/pwa.js", "pwa_plugin.js", app=self.app, name=spa)
+			add(f"{spa}/src/sw.js", "service_worker.js")
+
+		# shared by all SPAs of the app
+		add("doppio-build.mjs", "doppio_build.mjs")
+		add("doppio-deploy.mjs", "doppio_deploy.mjs")
+
+		return files
+
+	def create_template_file(self, path: Path):
+		"""Write a file from `template_files` and record it for the manifest"""
+		key = path.relative_to(self.app_path).as_posix()
+		template_name, content = self.template_files[key]
+
+		path.parent.mkdir(parents=True, exist_ok=True)
+		create_file(path, content)
+		self.generated_files[key] = template_name
+
 	def validate_spa_name(self):
 		if self.spa_name == self.app:
 			click.echo("Dashboard name must not be same as app name", err=True, color=True)
@@ -41,6 +165,8 @@ class SPAGenerator:
 			self.setup_vue_vite_config()
 			self.setup_vue_router()
 			self.create_vue_files()
+			self.create_python_context_file()
+			self.update_index_html()
 
 		elif self.framework == "react":
 			self.initialize_react_vite_project()
@@ -55,61 +181,47 @@ class SPAGenerator:
 				self.setup_shadcn()
 
 		# Common to all frameworks
-		add_commands_to_root_package_json(self.app, self.spa_name)
+		self.create_template_file(self.app_path / "doppio-build.mjs")
+		self.create_template_file(self.app_path / "doppio-deploy.mjs")
+		add_commands_to_root_package_json(
+			self.app,
+			self.spa_name,
+			# the boilerplates import doppio's controllers, rebuild when they change
+			build_inputs=["../../doppio/libs"],
+		)
 		self.create_www_directory()
 
 		if self.add_tailwindcss and self.framework == "vue":
 			self.setup_tailwindcss_vue()
 
+		if self.add_pwa:
+			self.setup_service_worker()
+
 		add_routing_rule_to_hooks(self.app, self.spa_name)
+		save_manifest(self)
 
 		click.echo(f"Run: cd {self.spa_path.absolute().resolve()} && npm run dev")
 		click.echo("to start the development server and visit: http://<site>:8080")
 
-	def setup_tailwindcss_vue(self):
-		# Install Tailwind v4 for Vue
-		subprocess.run(
-			[
-				"npm",
-				"install",
-				"-D",
-				"tailwindcss@latest",
-				"@tailwindcss/vite@latest",
-			],
-			cwd=self.spa_path,
-		)
+	def setup_service_worker(self):
+		# the vite plugin builds src/sw.js and registers it from index.html
+		self.create_template_file(self.spa_path / "pwa.js")
+		self.create_template_file(self.spa_path / "src/sw.js")
 
+	def setup_tailwindcss_vue(self):
+		# Tailwind v4 is installed along with the other preset dependencies
 		# Create index.css with Tailwind v4 syntax
+		# (the Tailwind plugin is enabled in vite.config when it is rendered)
 		index_css_path: Path = self.spa_path / "src/index.css"
-		create_file(index_css_path, INDEX_CSS_BOILERPLATE)
-
-		# Update vite.config to include Tailwind plugin
-		vite_config_path = self.spa_path / ("vite.config.ts" if self.use_typescript else "vite.config.js")
-		content = vite_config_path.read_text()
-		
-		# Add tailwindcss import
-		if "import tailwindcss from '@tailwindcss/vite'" not in content:
-			content = content.replace(
-				"import vue from '@vitejs/plugin-vue';",
-				"import vue from '@vitejs/plugin-vue';\nimport tailwindcss from '@tailwindcss/vite';"
-			)
-			# Add to plugins array
-			content = content.replace(
-				"plugins: [vue()],",
-				"plugins: [vue(), tailwindcss()],"
-			)
-			vite_config_path.write_text(content)
+		self.create_template_file(index_css_path)
 
 	def create_env_files(self):
 		"""Create .env.local and .env.production files"""
 		env_local_path = self.spa_path / ".env.local"
 		env_production_path = self.spa_path / ".env.production"
 		
-		create_file(env_local_path, ENV_LOCAL_BOILERPLATE)
-		create_file(
-			env_production_path, 
-			ENV_PRODUCTION_BOILERPLATE.replace("{{name}}", self.spa_name)
-		)
+		self.create_template_file(env_local_path)
+		self.create_template_file(env_production_path)
 		
 		click.echo(click.style(
 			f"\n⚠️  Important: Edit {env_local_path} and set VITE_SITE_NAME to your site name\n",
@@ -121,44 +233,24 @@ class SPAGenerator:
 		www_path = self.app_path / self.app / "www"
 		context_file = www_path / f"{self.spa_name}.py"
 		
-		create_file(context_file, PYTHON_CONTEXT_BOILERPLATE)
+		self.create_template_file(context_file)
 		click.echo(f"Created context file: {context_file}")
 
 	def update_index_html(self):
-		"""Update index.html with boot data injection"""
+		"""Update index.html with boot and initial data injection"""
 		index_html_path = self.spa_path / "index.html"
-		
-		if index_html_path.exists():
-			# Replace entire content with new template
-			create_file(index_html_path, INDEX_HTML_BOILERPLATE)
-		else:
-			create_file(index_html_path, INDEX_HTML_BOILERPLATE)
+		# Replace entire content with new template
+		self.create_template_file(index_html_path)
 
 	def setup_shadcn(self):
 		"""Setup shadcn/ui for React with Tailwind v4"""
 		click.echo("Setting up shadcn/ui...")
 		
-		# Install required dependencies
-		subprocess.run(
-			["npm", "install", "class-variance-authority", "clsx", "tailwind-merge"],
-			cwd=self.spa_path,
-		)
-		
 		# Create lib/utils.ts
-		lib_dir = self.spa_path / "src/lib"
-		lib_dir.mkdir(exist_ok=True)
-		
-		utils_content = """import { clsx, type ClassValue } from "clsx"
-import { twMerge } from "tailwind-merge"
-
-export function cn(...inputs: ClassValue[]) {
-  return twMerge(clsx(inputs))
-}
-"""
-		create_file(lib_dir / "utils.ts", utils_content)
+		self.create_template_file(self.spa_path / "src/lib/utils.ts")
 		
 		# Create components.json
-		create_file(self.spa_path / "components.json", COMPONENTS_JSON_BOILERPLATE)
+		self.create_template_file(self.spa_path / "components.json")
 		
 		# Update tsconfig files
 		self.update_tsconfig_for_shadcn()
@@ -186,7 +278,7 @@ export function cn(...inputs: ClassValue[]) {
 		# Update tsconfig.json
 		tsconfig_path = self.spa_path / "tsconfig.json"
 		if not tsconfig_path.exists():
-			create_file(tsconfig_path, TSCONFIG_JSON_BOILERPLATE)
+			create_file(tsconfig_path, render("tsconfig.json"))
 		else:
 			try:
 				with tsconfig_path.open("r") as f:
@@ -205,7 +297,7 @@ export function cn(...inputs: ClassValue[]) {
 			except json.JSONDecodeError as e:
 				click.echo(f"Warning: Could not parse tsconfig.json: {e}")
 				click.echo("Creating new tsconfig.json")
-				create_file(tsconfig_path, TSCONFIG_JSON_BOILERPLATE)
+				create_file(tsconfig_path, render("tsconfig.json"))
 		
 		# Update tsconfig.app.json
 		tsconfig_app_path = self.spa_path / "tsconfig.app.json"
@@ -227,11 +319,11 @@ export function cn(...inputs: ClassValue[]) {
 			except json.JSONDecodeError as e:
 				click.echo(f"Warning: Could not parse tsconfig.app.json: {e}")
 				# Create a basic tsconfig.app.json with the needed config
-				create_file(tsconfig_app_path, TSCONFIG_APP_JSON_BOILERPLATE)
+				create_file(tsconfig_app_path, render("tsconfig.app.json"))
 
 	def create_vue_files(self):
 		app_vue = self.spa_path / "src/App.vue"
-		create_file(app_vue, APP_VUE_BOILERPLATE)
+		self.create_template_file(app_vue)
 
 		views_dir: Path = self.spa_path / "src/views"
 		if not views_dir.exists():
@@ -240,8 +332,8 @@ export function cn(...inputs: ClassValue[]) {
 		home_vue = views_dir / "Home.vue"
 		login_vue = views_dir / "Login.vue"
 
-		create_file(home_vue, HOME_VUE_BOILERPLATE)
-		create_file(login_vue, LOGIN_VUE_BOILERPLATE)
+		self.create_template_file(home_vue)
+		self.create_template_file(login_vue)
 
 	def setup_vue_router(self):
 		# Setup vue router
@@ -252,31 +344,27 @@ export function cn(...inputs: ClassValue[]) {
 
 		# Create files
 		router_index_file = router_dir_path / "index.js"
-		create_file(
-			router_index_file, ROUTER_INDEX_BOILERPLATE.replace("{{name}}", self.spa_name)
-		)
+		self.create_template_file(router_index_file)
 
 		auth_routes_file = router_dir_path / "auth.js"
-		create_file(auth_routes_file, AUTH_ROUTES_BOILERPLATE)
+		self.create_template_file(auth_routes_file)
 
 	def initialize_vue_vite_project(self):
-		# Run "yarn create vite {name} --template vue"
+		# Run "yarn create vite@<version> {name} --template vue"
 		print("Scafolding vue project...")
+		create_vite = f"vite@{CREATE_VITE_VERSION}"
 		if self.use_typescript:
 			subprocess.run(
-				["yarn", "create", "vite", self.spa_name, "--template", "vue-ts"], cwd=self.app_path
+				["yarn", "create", create_vite, self.spa_name, "--template", "vue-ts"], cwd=self.app_path
 			)
 		else:
 			subprocess.run(
-				["yarn", "create", "vite", self.spa_name, "--template", "vue"], cwd=self.app_path
+				["yarn", "create", create_vite, self.spa_name, "--template", "vue"], cwd=self.app_path
 			)
 
-		# Install router and other npm packages
-		# yarn add vue-router@4 socket.io-client@4.5.1
+		# Install router and other npm packages (pinned per preset)
 		print("Installing dependencies...")
-		subprocess.run(
-			["yarn", "add", "vue-router@^4", "socket.io-client@^4.5.1"], cwd=self.spa_path
-		)
+		install_preset_dependencies(self.spa_path, self.presets)
 
 	def link_controller_files(self):
 		# Link controller files in main.js/main.ts
@@ -288,14 +376,8 @@ export function cn(...inputs: ClassValue[]) {
 		)
 
 		if main_js.exists():
-			with main_js.open("w") as f:
-				boilerplate = MAIN_JS_BOILERPLATE
-
-				# Add css import
-				if self.add_tailwindcss:
-					boilerplate = "import './index.css';\n" + boilerplate
-
-				f.write(boilerplate)
+			# css import is added when tailwind is enabled
+			self.create_template_file(main_js)
 		else:
 			click.echo("src/main.js not found!")
 			return
@@ -305,18 +387,15 @@ export function cn(...inputs: ClassValue[]) {
 		proxy_options_file: Path = self.spa_path / (
 			"proxyOptions.ts" if self.use_typescript else "proxyOptions.js"
 		)
-		create_file(proxy_options_file, PROXY_OPTIONS_BOILERPLATE)
+		self.create_template_file(proxy_options_file)
 
 	def setup_vue_vite_config(self):
 		vite_config_file: Path = self.spa_path / (
 			"vite.config.ts" if self.use_typescript else "vite.config.js"
 		)
-		if not vite_config_file.exists():
-			vite_config_file.touch()
-		with vite_config_file.open("w") as f:
-			boilerplate = VUE_VITE_CONFIG_BOILERPLATE.replace("{{app}}", self.app)
-			boilerplate = boilerplate.replace("{{name}}", self.spa_name)
-			f.write(boilerplate)
+		self.create_template_file(vite_config_file)
+		# plugin used by the config
+		self.create_template_file(self.spa_path / "preload.js")
 
 	def create_www_directory(self):
 		www_dir_path: Path = self.app_path / f"{self.app}/www"
@@ -325,56 +404,41 @@ export function cn(...inputs: ClassValue[]) {
 			www_dir_path.mkdir()
 
 	def initialize_react_vite_project(self):
-		# Run "yarn create vite {name} --template react"
+		# Run "yarn create vite@<version> {name} --template react"
 		print("Scaffolding React project...")
+		create_vite = f"vite@{CREATE_VITE_VERSION}"
 		if self.use_typescript:
 			subprocess.run(
-				["yarn", "create", "vite", self.spa_name, "--template", "react-ts"],
+				["yarn", "create", create_vite, self.spa_name, "--template", "react-ts"],
 				cwd=self.app_path,
 				env={**os.environ, "YARN_ENABLE_IMMUTABLE_INSTALLS": "false"}
 			)
 		else:
 			subprocess.run(
-				["yarn", "create", "vite", self.spa_name, "--template", "react"], 
+				["yarn", "create", create_vite, self.spa_name, "--template", "react"], 
 				cwd=self.app_path,
 				env={**os.environ, "YARN_ENABLE_IMMUTABLE_INSTALLS": "false"}
 			)
 
-		# Install dependencies
+		# Install frappe-react-sdk, Tailwind v4 (if enabled), shadcn/ui deps
+		# and dev dependencies in a single pinned install
 		print("Installing dependencies...")
-		
-		# Base dependencies
-		base_deps = ["frappe-react-sdk"]
-		
-		# Tailwind v4 dependencies
-		if self.add_tailwindcss:
-			base_deps.extend(["tailwindcss@next", "@tailwindcss/vite"])
-		
-		subprocess.run(["yarn", "add"] + base_deps, cwd=self.spa_path)
-		
-		# Dev dependencies
-		subprocess.run(
-			["yarn", "add", "-D", "@types/node"],
-			cwd=self.spa_path
-		)
+		install_preset_dependencies(self.spa_path, self.presets)
 
 	def setup_react_vite_config(self):
 		vite_config_file: Path = self.spa_path / (
 			"vite.config.ts" if self.use_typescript else "vite.config.js"
 		)
-		if not vite_config_file.exists():
-			vite_config_file.touch()
-		with vite_config_file.open("w") as f:
-			boilerplate = REACT_VITE_CONFIG_BOILERPLATE.replace("{{app}}", self.app)
-			boilerplate = boilerplate.replace("{{name}}", self.spa_name)
-			f.write(boilerplate)
+		self.create_template_file(vite_config_file)
+		# plugin used by the config
+		self.create_template_file(self.spa_path / "preload.js")
 
 	def create_react_files(self):
 		# Create index.css with Tailwind v4
 		if self.add_tailwindcss:
 			index_css_path = self.spa_path / "src/index.css"
-			create_file(index_css_path, INDEX_CSS_BOILERPLATE)
+			self.create_template_file(index_css_path)
 		
 		# Create App component
 		app_react = self.spa_path / ("src/App.tsx" if self.use_typescript else "src/App.jsx")
-		create_file(app_react, APP_REACT_BOILERPLATE)
\ No newline at end of file
+		self.create_template_file(app_react)
\ No newline at end of file
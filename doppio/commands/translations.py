@@ -0,0 +1,81 @@
+import hashlib
+import json
+import re
+
+from pathlib import Path
+
+# Where the catalogs of an SPA are written, inside the app's public directory.
+# `index.json` maps each language to its hashed catalog file.
+LOCALE_DIR = "locale"
+INDEX_FILE = "index.json"
+
+SOURCE_EXTENSIONS = (".js", ".ts", ".jsx", ".tsx", ".vue")
+
+# __("message"), __('message'), __(`message`), the first argument only
+MESSAGE_PATTERN = re.compile(r"""(?<![\w$.])__\(\s*(["'`])((?:\\.|(?!\1).)*?)\1""", re.DOTALL)
+ESCAPE_PATTERN = re.compile(r"\\(.)", re.DOTALL)
+
+
+def extract_messages(code):
+	"""Messages passed as literals to __() in `code`"""
+	return [ESCAPE_PATTERN.sub(r"\1", match.group(2)) for match in MESSAGE_PATTERN.finditer(code)]
+
+
+def get_spa_messages(spa_path: Path):
+	messages = set()
+	for path in (spa_path / "src").rglob("*"):
+		if path.suffix in SOURCE_EXTENSIONS and path.is_file():
+			messages.update(extract_messages(path.read_text()))
+
+	return messages
+
+
+def filter_translations(translations, messages):
+	"""Translations of `messages`, including the ones for a context (keyed `message:context`)"""
+	return {
+		key: translated
+		for key, translated in translations.items()
+		if key in messages or key.rsplit(":", 1)[0] in messages
+	}
+
+
+def get_catalog_path(app, spa_name):
+	return Path("../apps") / app / app / "public" / LOCALE_DIR / spa_name
+
+
+def write_catalog(catalog_path: Path, lang, catalog):
+	"""Write `catalog` as `<lang>.<hash>.json` and return the file name"""
+	content = json.dumps(catalog, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+	file_name = f"{lang}.{hashlib.sha1(content.encode()).hexdigest()[:10]}.json"
+
+	catalog_path.mkdir(parents=True, exist_ok=True)
+	(catalog_path / file_name).write_text(content)
+	return file_name
+
+
+def export_translations(app, spa_name, languages):
+	"""Export the catalogs of an SPA, one per language, for the messages its source uses.
+
+	Only the translations shipped with apps are exported, the ones edited on a
+	site are sent with its boot. Must run on an initialized site.
+	"""
+	from frappe.translate import get_translations_from_apps
+
+	messages = get_spa_messages(Path("../apps") / app / spa_name)
+	catalog_path = get_catalog_path(app, spa_name)
+
+	index = {}
+	for lang in languages:
+		catalog = filter_translations(get_translations_from_apps(lang), messages)
+		if catalog:
+			index[lang] = write_catalog(catalog_path, lang, catalog)
+
+	catalog_path.mkdir(parents=True, exist_ok=True)
+	(catalog_path / INDEX_FILE).write_text(json.dumps(index, indent=1, sort_keys=True))
+
+	# catalogs of previous exports
+	for path in catalog_path.glob("*.json"):
+		if path.name != INDEX_FILE and path.name not in index.values():
+			path.unlink()
+
+	return len(messages), index
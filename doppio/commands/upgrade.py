@@ -0,0 +1,229 @@
+import hashlib
+import json
+import subprocess
+import tempfile
+
+import click
+
+from pathlib import Path
+
+from doppio import __version__
+
+from .boilerplates import get_template
+from .utils import add_commands_to_root_package_json, get_spa_scripts
+
+# Directory inside each SPA where doppio keeps what it generated.
+# `manifest.json` records the boilerplate and doppio version behind every file,
+# `base/` holds the content as generated, the common ancestor for three-way merges.
+MANIFEST_DIR = ".doppio"
+MANIFEST_FILE = "manifest.json"
+BASE_DIR = "base"
+
+# Suffix of the file written next to a locally edited file when an update can
+# not be merged automatically
+CONFLICT_SUFFIX = ".doppio-new"
+
+
+def get_content_hash(content: str):
+	return hashlib.sha1(content.encode()).hexdigest()
+
+
+def get_manifest_path(spa_path: Path):
+	return spa_path / MANIFEST_DIR / MANIFEST_FILE
+
+
+def load_manifest(spa_path: Path):
+	manifest_path = get_manifest_path(spa_path)
+	if not manifest_path.exists():
+		return None
+
+	with manifest_path.open("r") as f:
+		return json.load(f)
+
+
+def write_manifest(spa_path: Path, manifest):
+	manifest_path = get_manifest_path(spa_path)
+	manifest_path.parent.mkdir(parents=True, exist_ok=True)
+
+	with manifest_path.open("w") as f:
+		json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def get_base_path(spa_path: Path, key: str):
+	return spa_path / MANIFEST_DIR / BASE_DIR / key
+
+
+def record_file(manifest, spa_path: Path, key: str, template_name: str, content: str):
+	"""Record `content` as the generated version of `key`"""
+	base_path = get_base_path(spa_path, key)
+	base_path.parent.mkdir(parents=True, exist_ok=True)
+	base_path.write_text(content)
+
+	manifest["files"][key] = {
+		"template": template_name,
+		"template_hash": get_template(template_name).hash,
+		"hash": get_content_hash(content),
+		"doppio_version": __version__,
+	}
+
+
+def save_manifest(generator):
+	"""Record the files written by a `SPAGenerator` run"""
+	manifest = load_manifest(generator.spa_path) or {"files": {}}
+	manifest["doppio_version"] = __version__
+	manifest["options"] = generator.options
+
+	for key, template_name in generator.generated_files.items():
+		_, content = generator.template_files[key]
+		record_file(manifest, generator.spa_path, key, template_name, content)
+
+	write_manifest(generator.spa_path, manifest)
+
+
+def infer_options(spa_path: Path):
+	"""Guess the generator options of an SPA created before manifests were recorded"""
+	package_json_path = spa_path / "package.json"
+	dependencies = {}
+	if package_json_path.exists():
+		with package_json_path.open("r") as f:
+			data = json.load(f)
+		dependencies = {**data.get("dependencies", {}), **data.get("devDependencies", {})}
+
+	return {
+		"framework": "vue" if (spa_path / "src/App.vue").exists() else "react",
+		"typescript": (spa_path / "tsconfig.json").exists(),
+		"tailwindcss": "tailwindcss" in dependencies,
+		"shadcn": (spa_path / "components.json").exists(),
+		"pwa": (spa_path / "pwa.js").exists(),
+	}
+
+
+def merge_file(current: str, base: str, new: str):
+	"""Three-way merge of local edits (`current`) and template updates (`new`).
+
+	Returns the merged content, or None if the changes conflict.
+	"""
+	with tempfile.TemporaryDirectory() as tmp:
+		paths = []
+		for name, content in (("current", current), ("base", base), ("new", new)):
+			path = Path(tmp) / name
+			path.write_text(content)
+			paths.append(str(path))
+
+		try:
+			result = subprocess.run(
+				["git", "merge-file", "-p", *paths], capture_output=True, text=True
+			)
+		except FileNotFoundError:
+			return None
+
+	# git merge-file exits with the number of conflicts, negative on error
+	if result.returncode != 0:
+		return None
+
+	return result.stdout
+
+
+def upgrade_spa(app, spa_name, dry_run=False, adopt=False):
+	"""Apply boilerplate updates to an existing SPA without clobbering local edits.
+
+	Returns a dict mapping each template-generated file to what happened to it.
+	"""
+	from .spa_generator import SPAGenerator
+
+	app_path = Path("../apps") / app
+	spa_path = app_path / spa_name
+
+	manifest = load_manifest(spa_path)
+	if not manifest:
+		if not adopt:
+			click.echo(
+				f"No doppio manifest found in {spa_path}. "
+				"Run with --adopt to start tracking an SPA generated by an older version of doppio.",
+				err=True,
+			)
+			return {}
+		manifest = {"files": {}, "options": infer_options(spa_path)}
+
+	options = manifest["options"]
+	generator = SPAGenerator(
+		options["framework"],
+		spa_name,
+		app,
+		options["tailwindcss"],
+		options["typescript"],
+		options["shadcn"],
+		# not recorded by manifests of older versions
+		options.get("pwa", False),
+	)
+
+	results = {}
+	for key, (template_name, new) in generator.template_files.items():
+		path = app_path / key
+		current = path.read_text() if path.exists() else None
+
+		base_path = get_base_path(spa_path, key)
+		base = base_path.read_text() if key in manifest["files"] and base_path.exists() else None
+
+		if base is None:
+			if current is None:
+				status, content = "added", new
+			elif current == new:
+				status, content = "unchanged", None
+			else:
+				# untracked file that differs from the template, leave it for review
+				status, content = "conflict", None
+		elif current is None:
+			# removed locally, respect that
+			results[key] = "deleted locally"
+			continue
+		elif new == base or current == new:
+			status, content = "unchanged", None
+		elif current == base:
+			status, content = "updated", new
+		else:
+			merged = merge_file(current, base, new)
+			if merged is None:
+				status, content = "conflict", None
+			else:
+				status, content = "merged", merged
+
+		results[key] = status
+		if dry_run:
+			continue
+
+		if status == "conflict":
+			Path(str(path) + CONFLICT_SUFFIX).write_text(new)
+			if base is not None:
+				# keep the old base, so the next upgrade retries the merge
+				continue
+		elif content is not None:
+			path.parent.mkdir(parents=True, exist_ok=True)
+			path.write_text(content)
+
+		record_file(manifest, spa_path, key, template_name, new)
+
+	# scripts that run the files above, e.g. deploying the staging build output
+	package_json_key = f"{spa_name}/package.json"
+	if needs_script_update(spa_path / "package.json", app, spa_name):
+		results[package_json_key] = "updated"
+		if not dry_run:
+			add_commands_to_root_package_json(app, spa_name, build_inputs=["../../doppio/libs"])
+
+	if not dry_run:
+		manifest["doppio_version"] = __version__
+		manifest["options"] = options
+		write_manifest(spa_path, manifest)
+
+	return results
+
+
+def needs_script_update(package_json_path: Path, app, spa_name):
+	if not package_json_path.exists():
+		return False
+
+	with package_json_path.open("r") as f:
+		scripts = json.load(f).get("scripts", {})
+
+	expected = get_spa_scripts(app, spa_name)
+	return "copy-html-entry" in scripts or any(scripts.get(name) != script for name, script in expected.items())
@@ -15,7 +15,16 @@ def create_file(path: Path, content: str = None):
 			f.write(content)
 
 
-def add_commands_to_root_package_json(app, spa_name):
+def get_spa_scripts(app, spa_name):
+	return {
+		"build": f"vite build --base=/assets/{app}/{spa_name}/ && yarn deploy",
+		# vite builds into a staging directory, doppio-deploy.mjs swaps it in
+		# atomically and copies the html entry to www
+		"deploy": f"node ../doppio-deploy.mjs {spa_name}",
+	}
+
+
+def add_commands_to_root_package_json(app, spa_name, build_inputs=None):
 	app_path = Path("../apps") / app
 	spa_path: Path = app_path / spa_name
 	package_json_path: Path = spa_path / "package.json"
@@ -28,13 +37,12 @@ def add_commands_to_root_package_json(app, spa_name):
 	with package_json_path.open("r") as f:
 		data = json.load(f)
 
-	data["scripts"][
-		"build"
-	] = f"vite build --base=/assets/{app}/{spa_name}/ && yarn copy-html-entry"
+	data["scripts"].update(get_spa_scripts(app, spa_name))
+	data["scripts"].pop("copy-html-entry", None)
 
-	data["scripts"]["copy-html-entry"] = (
-		f"cp ../{app}/public/{spa_name}/index.html" f" ../{app}/www/{spa_name}.html"
-	)
+	# paths outside the SPA that its build depends on, see doppio-build.mjs
+	if build_inputs:
+		data.setdefault("doppio", {}).setdefault("buildInputs", build_inputs)
 
 	with package_json_path.open("w") as f:
 		json.dump(data, f, indent=2)
@@ -51,11 +59,28 @@ def add_commands_to_root_package_json(app, spa_name):
 
 		data["scripts"]["postinstall"] = f"cd {spa_name} && yarn install"
 		data["scripts"]["dev"] = f"cd {spa_name} && yarn dev"
-		data["scripts"]["build"] = f"cd {spa_name} && yarn build"
 
 		with app_package_json_path.open("w") as f:
 			json.dump(data, f, indent=2)
 
+	with app_package_json_path.open("r") as f:
+		data = json.load(f)
+
+	# every SPA of the app is built by doppio-build.mjs, skipping unchanged ones
+	spas = data.setdefault("doppio", {}).setdefault("spas", [])
+	if spa_name not in spas:
+		spas.append(spa_name)
+
+	scripts = data.setdefault("scripts", {})
+	build = scripts.get("build", "")
+	if not build or re.fullmatch(r"cd \S+ && yarn build", build):
+		scripts["build"] = "node doppio-build.mjs"
+	elif build != "node doppio-build.mjs":
+		print(f"Add `node doppio-build.mjs` to the build script of {app_package_json_path} to build {spa_name}.")
+
+	with app_package_json_path.open("w") as f:
+		json.dump(data, f, indent=2)
+
 
 def add_routing_rule_to_hooks(app, spa_name):
 	hooks_py = Path(f"../apps/{app}/{app}") / "hooks.py"
@@ -0,0 +1,97 @@
+frappe.pages["doppio-telemetry"].on_page_load = function (wrapper) {
+	const page = frappe.ui.make_app_page({
+		parent: wrapper,
+		title: __("Doppio Telemetry"),
+		single_column: true,
+	});
+
+	const hours = page.add_field({
+		fieldname: "hours",
+		label: __("Last"),
+		fieldtype: "Select",
+		options: [
+			{ value: 1, label: __("1 hour") },
+			{ value: 24, label: __("24 hours") },
+			{ value: 168, label: __("7 days") },
+		],
+		default: 24,
+		change: () => refresh(),
+	});
+	page.set_primary_action(__("Refresh"), () => refresh());
+
+	const $body = $('<div class="doppio-telemetry"></div>').appendTo(page.main);
+
+	const format = (value, digits = 0) =>
+		value === null || value === undefined ? "" : format_number(value, null, digits);
+	const percent = (value) => (value === null ? "" : `${format(value * 100, 1)}%`);
+
+	const SECTIONS = [
+		{
+			kind: "vital",
+			title: __("Web Vitals (ms, CLS unitless)"),
+			columns: [__("Metric"), __("Samples"), __("Average"), __("p75 ≤"), __("p95 ≤")],
+			row: (r) => [r.name, format(r.count), format(r.average, 2), r.p75, r.p95],
+		},
+		{
+			kind: "call",
+			title: __("API Calls (ms)"),
+			columns: [__("Method"), __("Calls"), __("Average"), __("p75 ≤"), __("p95 ≤"), __("Errors"), __("Avg. Bytes")],
+			row: (r) => [r.name, format(r.count), format(r.average), r.p75, r.p95, percent(r.error_rate), format(r.average_bytes)],
+		},
+		{
+			kind: "resource",
+			title: __("Resources"),
+			columns: [__("Method"), __("Fetches"), __("Served Without Request")],
+			row: (r) => [r.name, format(r.count), percent(r.hit_rate)],
+		},
+	];
+
+	function render(rows) {
+		$body.empty();
+		if (!rows.length) {
+			$body.append(
+				`<p class="text-muted">${__(
+					"No data. Telemetry is enabled with the doppio_telemetry site config."
+				)}</p>`
+			);
+			return;
+		}
+
+		const spas = [...new Set(rows.map((r) => r.spa))];
+		for (const spa of spas) {
+			$body.append(`<h4 class="mt-4">${frappe.utils.escape_html(spa || __("Unknown SPA"))}</h4>`);
+			for (const section of SECTIONS) {
+				const section_rows = rows
+					.filter((r) => r.spa === spa && r.kind === section.kind)
+					.sort((a, b) => b.count - a.count);
+				if (!section_rows.length) continue;
+
+				const head = section.columns.map((c) => `<th>${c}</th>`).join("");
+				const body = section_rows
+					.map(
+						(r) =>
+							`<tr>${section
+								.row(r)
+								.map((cell) => `<td>${frappe.utils.escape_html(String(cell ?? ""))}</td>`)
+								.join("")}</tr>`
+					)
+					.join("");
+				$body.append(`
+					<h5 class="mt-3">${section.title}</h5>
+					<table class="table table-bordered table-sm">
+						<thead><tr>${head}</tr></thead>
+						<tbody>${body}</tbody>
+					</table>
+				`);
+			}
+		}
+	}
+
+	function refresh() {
+		frappe
+			.call("doppio.telemetry.get_summary", { hours: hours.get_value() })
+			.then((r) => render(r.message || []));
+	}
+
+	refresh();
+};
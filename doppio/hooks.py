@@ -57,6 +57,19 @@ website_route_rules = [
 	{"from_route": "/vision/<path:app_path>", "to_route": "vision"},
 ]
 
+# Boot
+# ----------
+
+# flags the SPAs' telemetry module reads from frappe.boot
+boot_session = "doppio.telemetry.boot_session"
+
+# Request hooks
+# ----------
+
+# profile API calls made by doppio SPAs, see `bench doppio-profile`
+before_request = ["doppio.profiler.before_request"]
+after_request = ["doppio.profiler.after_request"]
+
 # Jinja
 # ----------
 
@@ -72,6 +85,9 @@ website_route_rules = [
 # before_install = "doppio.install.before_install"
 # after_install = "doppio.install.after_install"
 
+# doctype meta may have changed, snapshots compare against fresh versions
+after_migrate = ["doppio.meta.clear_meta_versions"]
+
 # Desk Notifications
 # ------------------
 # See frappe.core.notifications.get_notification_config
@@ -110,9 +126,24 @@ website_route_rules = [
 # 	}
 # }
 
+# Versions of the doctype meta snapshotted by SPAs, see doppio/meta.py
+doc_events = {
+	doctype: {
+		"on_update": "doppio.meta.clear_meta_versions",
+		"on_trash": "doppio.meta.clear_meta_versions",
+	}
+	for doctype in ("DocType", "Custom Field", "Property Setter")
+}
+
 # Scheduled Tasks
 # ---------------
 
+scheduler_events = {
+	"daily": [
+		"doppio.utils.assets.prune_asset_generations",
+	],
+}
+
 # scheduler_events = {
 # 	"all": [
 # 		"doppio.tasks.all"
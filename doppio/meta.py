@@ -0,0 +1,100 @@
+"""Compact doctype meta for SPAs, snapshotted at build time by `bench doppio-meta`.
+
+A snapshot records the version of the meta it was taken from: the last time the
+doctype, its custom fields or its property setters were modified, with the count
+and a hash of the names of the customizations, so that deleting one changes it
+too. SPAs get the current versions with their boot and only fetch live meta
+(`get_meta`) for doctypes whose snapshot is stale, see libs/controllers/meta.js.
+"""
+
+import hashlib
+
+import frappe
+
+from doppio.utils.http_cache import cacheable
+
+# Redis hash of doctype -> meta version, cleared whenever meta may have changed
+META_VERSIONS_KEY = "doppio:meta_versions"
+
+DOCTYPE_PROPERTIES = (
+	"name",
+	"module",
+	"istable",
+	"issingle",
+	"is_submittable",
+	"title_field",
+	"image_field",
+	"search_fields",
+	"sort_field",
+	"sort_order",
+)
+
+FIELD_PROPERTIES = (
+	"fieldname",
+	"label",
+	"fieldtype",
+	"options",
+	"default",
+	"reqd",
+	"read_only",
+	"hidden",
+	"depends_on",
+	"mandatory_depends_on",
+	"read_only_depends_on",
+	"fetch_from",
+	"in_list_view",
+	"in_standard_filter",
+	"length",
+	"precision",
+	"description",
+)
+
+
+def get_meta_version(doctype):
+	def generator():
+		customizations = []
+		for customization, doctype_field in (("Custom Field", "dt"), ("Property Setter", "doc_type")):
+			customizations += frappe.get_all(
+				customization, filters={doctype_field: doctype}, fields=["name", "modified"]
+			)
+
+		modified = [frappe.db.get_value("DocType", doctype, "modified")]
+		modified += [customization["modified"] for customization in customizations]
+		modified = [value for value in modified if value]
+		if not modified:
+			return None
+
+		names = "\n".join(sorted(customization["name"] for customization in customizations))
+		return f"{max(modified)}|{len(customizations)}|{hashlib.sha1(names.encode()).hexdigest()[:8]}"
+
+	return frappe.cache().hget(META_VERSIONS_KEY, doctype, generator=generator)
+
+
+def get_meta_versions(doctypes):
+	return {doctype: get_meta_version(doctype) for doctype in doctypes}
+
+
+def get_compact_meta(doctype):
+	"""The parts of a doctype's meta forms and lists need, with empty properties left out"""
+	meta = frappe.get_meta(doctype)
+
+	compact = {key: meta.get(key) for key in DOCTYPE_PROPERTIES if meta.get(key)}
+	compact["fields"] = [
+		{key: field.get(key) for key in FIELD_PROPERTIES if field.get(key)} for field in meta.fields
+	]
+	compact["version"] = get_meta_version(doctype)
+	return compact
+
+
+@frappe.whitelist(methods=["GET"])
+# the version, not the last modified timestamp, also changes when a customization is deleted
+@cacheable(version=get_meta_version)
+def get_meta(doctype):
+	"""Live meta, for doctypes whose snapshot is stale or missing"""
+	frappe.has_permission(doctype, "read", throw=True)
+	return get_compact_meta(doctype)
+
+
+def clear_meta_versions(*args, **kwargs):
+	"""Runs after migrate and on changes to doctypes and their customizations"""
+	frappe.cache().delete_value(META_VERSIONS_KEY)
@@ -0,0 +1,127 @@
+"""Per-method latency profile of the API calls made by doppio SPAs.
+
+call.js marks its requests with an `X-Doppio-SPA` header. For those, request
+hooks record the time taken, database queries and response size of the
+whitelisted method into per-minute Redis hashes, kept for `WINDOW_MINUTES`.
+`bench doppio-profile` reads them back.
+"""
+
+import time
+
+import frappe
+
+from doppio.utils.histogram import estimate_percentile, get_histogram_bin
+
+SPA_HEADER = "X-Doppio-SPA"
+METHOD_PREFIX = "/api/method/"
+BUCKET_SECONDS = 60
+WINDOW_MINUTES = 60
+
+
+def get_window_minutes():
+	return int(frappe.conf.get("doppio_profile_window") or WINDOW_MINUTES)
+
+
+def get_bucket_key(timestamp):
+	bucket = int(timestamp // BUCKET_SECONDS) * BUCKET_SECONDS
+	return frappe.cache().make_key(f"doppio:profile:{bucket}")
+
+
+def before_request():
+	request = getattr(frappe.local, "request", None)
+	if not request or not request.path.startswith(METHOD_PREFIX):
+		return
+
+	spa = request.headers.get(SPA_HEADER)
+	if not spa or not frappe.db:
+		return
+
+	profile = frappe.local.doppio_profile = {
+		"spa": spa[:64],
+		"method": request.path[len(METHOD_PREFIX) :][:140],
+		"start": time.perf_counter(),
+		"queries": 0,
+	}
+
+	# count queries of this request only, frappe.db is per request
+	sql = frappe.db.sql
+
+	def counted_sql(*args, **kwargs):
+		profile["queries"] += 1
+		return sql(*args, **kwargs)
+
+	frappe.db.sql = counted_sql
+
+
+def after_request(response=None, request=None):
+	profile = getattr(frappe.local, "doppio_profile", None)
+	if not profile:
+		return
+
+	frappe.local.doppio_profile = None
+	duration = (time.perf_counter() - profile["start"]) * 1000
+	size = response.calculate_content_length() if response is not None else None
+	failed = response is None or response.status_code >= 400
+
+	prefix = f"{profile['spa']}|{profile['method']}"
+	key = get_bucket_key(time.time())
+	try:
+		pipeline = frappe.cache().pipeline()
+		pipeline.hincrby(key, f"{prefix}|count", 1)
+		pipeline.hincrbyfloat(key, f"{prefix}|time", duration)
+		pipeline.hincrby(key, f"{prefix}|queries", profile["queries"])
+		pipeline.hincrby(key, f"{prefix}|bytes", size or 0)
+		pipeline.hincrby(key, f"{prefix}|errors", int(failed))
+		pipeline.hincrby(key, f"{prefix}|bin|{get_histogram_bin(duration)}", 1)
+		pipeline.expire(key, get_window_minutes() * 60 + BUCKET_SECONDS)
+		pipeline.execute()
+	except Exception:
+		# never fail a request over profiling
+		pass
+
+
+def get_profile(minutes=None, spa=None):
+	"""Aggregates per SPA and method over the last `minutes`"""
+	minutes = min(int(minutes or WINDOW_MINUTES), get_window_minutes())
+	now = time.time()
+	timestamps = range(int(now - minutes * 60) + BUCKET_SECONDS, int(now) + 1, BUCKET_SECONDS)
+
+	pipeline = frappe.cache().pipeline()
+	for timestamp in timestamps:
+		pipeline.hgetall(get_bucket_key(timestamp))
+
+	totals = {}
+	for bucket in pipeline.execute():
+		for field, amount in bucket.items():
+			field = field.decode() if isinstance(field, bytes) else field
+			row, _, metric = field.rpartition("|")
+			if row.endswith("|bin"):
+				row, metric = row[: -len("|bin")], f"bin|{metric}"
+			totals.setdefault(row, {})
+			totals[row][metric] = totals[row].get(metric, 0) + float(amount)
+
+	profile = []
+	for row, metrics in totals.items():
+		row_spa, method = row.split("|", 1)
+		count = metrics.get("count", 0)
+		if not count or (spa and row_spa != spa):
+			continue
+
+		bins = {metric[4:]: amount for metric, amount in metrics.items() if metric.startswith("bin|")}
+		profile.append(
+			frappe._dict(
+				spa=row_spa,
+				method=method,
+				count=int(count),
+				total_time=metrics.get("time", 0),
+				average_time=metrics.get("time", 0) / count,
+				p50=estimate_percentile(bins, count, 50),
+				p95=estimate_percentile(bins, count, 95),
+				p99=estimate_percentile(bins, count, 99),
+				average_queries=metrics.get("queries", 0) / count,
+				average_bytes=metrics.get("bytes", 0) / count,
+				errors=int(metrics.get("errors", 0)),
+			)
+		)
+
+	return profile
@@ -0,0 +1,180 @@
+"""Aggregates the real-user performance events sent by libs/controllers/telemetry.js.
+
+Events are folded into Redis hashes, one per BUCKET_SECONDS window, so storage
+stays small however much traffic the SPAs get. Every metric keeps a count, a sum
+and a histogram of its values, enough for averages and percentile estimates.
+
+Enable it with `bench --site <site> set-config doppio_telemetry 1`.
+"""
+
+import json
+import math
+import re
+import time
+
+import frappe
+
+from frappe.rate_limiter import rate_limit
+
+from doppio.utils.histogram import estimate_percentile, get_histogram_bin
+
+BUCKET_SECONDS = 5 * 60
+RETENTION_SECONDS = 7 * 24 * 60 * 60
+MAX_EVENTS = 200
+
+VITALS = ("TTFB", "FCP", "LCP", "CLS", "INP")
+
+# Names of calls and cached resources are whitelisted method paths, anything
+# else would let a client create as many hash fields as it likes
+METHOD_PATTERN = re.compile(r"^\w+(\.\w+){0,9}$")
+MAX_NAME_LENGTH = 140
+
+
+def is_enabled():
+	return bool(frappe.conf.get("doppio_telemetry"))
+
+
+def boot_session(bootinfo):
+	if is_enabled():
+		bootinfo.doppio_telemetry = 1
+		bootinfo.doppio_telemetry_sample_rate = frappe.conf.get("doppio_telemetry_sample_rate", 1)
+
+
+def get_spas():
+	"""SPAs of the installed apps, from the route rules added when they were generated"""
+	return {
+		rule["to_route"]
+		for rule in frappe.get_hooks("website_route_rules")
+		if rule.get("to_route") and rule.get("from_route", "").startswith(f"/{rule['to_route']}/")
+	}
+
+
+def get_bucket_key(timestamp):
+	bucket = int(timestamp // BUCKET_SECONDS) * BUCKET_SECONDS
+	return frappe.cache().make_key(f"doppio:telemetry:{bucket}")
+
+
+@frappe.whitelist(allow_guest=True, methods=["POST"])
+@rate_limit(limit=120, seconds=60)
+def collect(spa=None, events=None):
+	if not is_enabled() or not events:
+		return
+
+	try:
+		events = json.loads(events) if isinstance(events, str) else events
+	except ValueError:
+		return
+
+	if not isinstance(events, list) or spa not in get_spas():
+		return
+
+	key = get_bucket_key(time.time())
+	pipeline = frappe.cache().pipeline()
+	for event in events[:MAX_EVENTS]:
+		for field, amount in get_increments(spa, event):
+			if isinstance(amount, float):
+				pipeline.hincrbyfloat(key, field, amount)
+			else:
+				pipeline.hincrby(key, field, amount)
+	pipeline.expire(key, RETENTION_SECONDS)
+	pipeline.execute()
+
+
+def get_increments(spa, event):
+	"""Hash fields to increment for one event, as (field, amount) pairs"""
+	if not isinstance(event, dict) or not is_valid_name(event.get("type"), event.get("name")):
+		return []
+
+	kind, name = event["type"], event["name"]
+
+	if kind == "resource":
+		prefix = f"{spa}|resource|{name}"
+		return [(f"{prefix}|count", 1), (f"{prefix}|hits", 1 if event.get("hit") else 0)]
+
+	try:
+		value = float(event.get("value"))
+	except (TypeError, ValueError):
+		return []
+
+	if not math.isfinite(value) or value < 0:
+		return []
+
+	prefix = f"{spa}|{kind}|{name}"
+	# CLS is unitless, bin it in thousandths
+	scaled = value * 1000 if name == "CLS" else value
+	increments = [
+		(f"{prefix}|count", 1),
+		(f"{prefix}|sum", value),
+		(f"{prefix}|bin|{get_histogram_bin(scaled)}", 1),
+	]
+	if kind == "call":
+		increments.append((f"{prefix}|errors", 0 if event.get("ok", True) else 1))
+		if type(event.get("bytes")) is int and event["bytes"] > 0:
+			increments.append((f"{prefix}|bytes", event["bytes"]))
+
+	return increments
+
+
+def is_valid_name(kind, name):
+	if not isinstance(name, str):
+		return False
+	if kind == "vital":
+		return name in VITALS
+	if kind in ("call", "resource"):
+		return len(name) <= MAX_NAME_LENGTH and bool(METHOD_PATTERN.match(name))
+	return False
+
+
+@frappe.whitelist()
+def get_summary(hours=24):
+	"""Aggregates of the last `hours`, one row per SPA, kind and name"""
+	frappe.only_for("System Manager")
+
+	now = time.time()
+	start = now - min(float(hours), RETENTION_SECONDS / 3600) * 3600
+	keys = [get_bucket_key(timestamp) for timestamp in range(int(start), int(now) + 1, BUCKET_SECONDS)]
+
+	pipeline = frappe.cache().pipeline()
+	for key in keys:
+		pipeline.hgetall(key)
+
+	totals = {}
+	for bucket in pipeline.execute():
+		for field, amount in bucket.items():
+			field = field.decode() if isinstance(field, bytes) else field
+			row, _, metric = field.rpartition("|")
+			if row.endswith("|bin"):
+				row, metric = row[: -len("|bin")], f"bin|{metric}"
+			totals.setdefault(row, {})
+			totals[row][metric] = totals[row].get(metric, 0) + float(amount)
+
+	summary = []
+	for row, metrics in sorted(totals.items()):
+		spa, kind, name = row.split("|", 2)
+		count = metrics.get("count", 0)
+		if not count:
+			continue
+
+		bins = {metric[4:]: amount for metric, amount in metrics.items() if metric.startswith("bin|")}
+		average = metrics.get("sum", 0) / count
+
+		def percentile(value):
+			bound = estimate_percentile(bins, count, value) if bins else None
+			# CLS is binned in thousandths
+			return bound / 1000 if name == "CLS" and isinstance(bound, int) else bound
+		summary.append(
+			{
+				"spa": spa,
+				"kind": kind,
+				"name": name,
+				"count": int(count),
+				"average": average,
+				"p75": percentile(75),
+				"p95": percentile(95),
+				"error_rate": metrics.get("errors", 0) / count if kind == "call" else None,
+				"average_bytes": metrics.get("bytes", 0) / count if kind == "call" else None,
+				"hit_rate": metrics.get("hits", 0) / count if kind == "resource" else None,
+			}
+		)
+
+	return summary
@@ -0,0 +1,67 @@
+from unittest import TestCase
+from doppio.commands.boilerplates import TEMPLATES, Template, TemplateError, get_template, render
+
+
+class TestBoilerplates(TestCase):
+	def test_all_templates_compile(self):
+		for name in TEMPLATES:
+			get_template(name)
+
+	def test_variables_and_sections(self):
+		template = Template("test", "a={{ app }}{{#flag}} on{{/flag}}{{^flag}} off{{/flag}}", {"app": str, "flag": bool})
+
+		self.assertEqual(template.render(app="x", flag=True), "a=x on")
+		self.assertEqual(template.render(app="x", flag=False), "a=x off")
+
+	def test_undeclared_placeholders_are_kept(self):
+		# Vue template expressions and Jinja rendered by Frappe must survive generation
+		content = render("desk_page_app.vue", app_component_path="app/public/js/page/App.vue")
+		self.assertIn("{{ dynamicMessage }}", content)
+		self.assertIn("app/public/js/page/App.vue", content)
+
+		index_html = render("index.html", title="Dashboard", mount_id="app", entry="main.js")
+		self.assertIn("{{ frappe.session.csrf_token }}", index_html)
+		self.assertIn("{{ initial_data }}", index_html)
+
+	def test_context_is_validated(self):
+		with self.assertRaises(TypeError):
+			render("router_index.js")
+		with self.assertRaises(TypeError):
+			render("router_index.js", name="dashboard", app="app")
+		with self.assertRaises(TypeError):
+			render("main.js", tailwindcss="yes")
+
+	def test_unbalanced_sections(self):
+		with self.assertRaises(TemplateError):
+			Template("test", "{{#flag}}", {"flag": bool})
+		with self.assertRaises(TemplateError):
+			Template("test", "{{/flag}}", {"flag": bool})
+
+	def render_vite_config(self, name, critical="'src/views/Home.vue'", **context):
+		return render(name, app="app", name="dashboard", optimize_deps="'vue'", warmup="'./src/main.js'", critical=critical, **context)
+
+	def test_tailwind_toggle(self):
+		with_tailwind = self.render_vite_config("vue_vite_config.js", tailwindcss=True, pwa=False)
+		without_tailwind = self.render_vite_config("vue_vite_config.js", tailwindcss=False, pwa=False)
+
+		self.assertIn("plugins: [vue(), tailwindcss(), preload({ critical: ['src/views/Home.vue'] })],", with_tailwind)
+		self.assertIn("plugins: [vue(), preload({ critical: ['src/views/Home.vue'] })],", without_tailwind)
+		self.assertNotIn("@tailwindcss/vite", without_tailwind)
+		self.assertIn("outDir: '../app/public/.doppio/dashboard/staging'", without_tailwind)
+
+	def test_dev_server_presets(self):
+		config = self.render_vite_config("vue_vite_config.js", tailwindcss=False, pwa=False)
+
+		self.assertIn("include: ['vue']", config)
+		self.assertIn("clientFiles: ['./src/main.js']", config)
+		self.assertIn("cacheDir: '../../../.doppio/vite-cache/app-dashboard'", config)
+
+	def test_pwa_toggle(self):
+		config = self.render_vite_config(
+			"react_vite_config.js", critical="'src/App.jsx'", tailwindcss=False, pwa=True
+		)
+		self.assertIn("plugins: [react(), preload({ critical: ['src/App.jsx'] }), pwa()],", config)
+
+		context = render("www_context.py", pwa=True)
+		self.assertIn("def service_worker():", context)
+		self.assertNotIn("service_worker", render("www_context.py", pwa=False))
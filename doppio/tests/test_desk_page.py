@@ -0,0 +1,65 @@
+import tempfile
+
+from pathlib import Path
+from unittest import TestCase
+from doppio.commands.desk_page import get_shared_runtime_paths, load_desk_pages_manifest, remove_new_paths
+
+
+class TestDeskPageManifest(TestCase):
+	def write_manifest(self, name, content):
+		tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(tmp.cleanup)
+		path = Path(tmp.name) / name
+		path.write_text(content)
+		return path
+
+	def test_yaml_manifest(self):
+		path = self.write_manifest(
+			"pages.yaml",
+			"starter: react\nshared_runtime: true\npages:\n  - sales-board\n  - page_name: stock-board\n    starter: vue\n",
+		)
+		pages, shared_runtime = load_desk_pages_manifest(path)
+
+		self.assertTrue(shared_runtime)
+		self.assertEqual(
+			pages,
+			[
+				{"page_name": "sales-board", "starter": "react"},
+				{"page_name": "stock-board", "starter": "vue"},
+			],
+		)
+
+	def test_json_list_manifest(self):
+		path = self.write_manifest("pages.json", '["sales-board"]')
+		pages, shared_runtime = load_desk_pages_manifest(path, default_starter="vue")
+
+		self.assertFalse(shared_runtime)
+		self.assertEqual(pages, [{"page_name": "sales-board", "starter": "vue"}])
+
+	def test_shared_runtime_paths(self):
+		self.assertEqual(
+			get_shared_runtime_paths("react", "../doppio_shared"),
+			{
+				"react": ["../doppio_shared/react/index.js"],
+				"react-dom": ["../doppio_shared/react-dom/index.js"],
+				"react-dom/client": ["../doppio_shared/react-dom/client.js"],
+			},
+		)
+
+
+class TestDeskPageRollback(TestCase):
+	def test_only_new_paths_are_removed(self):
+		with tempfile.TemporaryDirectory() as tmp:
+			pages_path = Path(tmp) / "page"
+			(pages_path / "existing_page").mkdir(parents=True)
+			existing_paths = set(pages_path.iterdir())
+
+			(pages_path / "sales_board").mkdir()
+			(pages_path / "sales_board" / "sales_board.json").write_text("{}")
+			(pages_path / "__init__.py").write_text("")
+			remove_new_paths(pages_path, existing_paths)
+
+			self.assertEqual(list(pages_path.iterdir()), [pages_path / "existing_page"])
+
+			remove_new_paths(pages_path, None)
+			self.assertFalse(pages_path.exists())
@@ -0,0 +1,58 @@
+import json
+import tempfile
+
+from pathlib import Path
+from unittest import TestCase
+
+from doppio.commands.dev import discover_spas
+
+
+class TestDevServer(TestCase):
+	def setUp(self):
+		self.tmp = tempfile.TemporaryDirectory()
+		self.bench_path = Path(self.tmp.name)
+		(self.bench_path / "sites").mkdir()
+		(self.bench_path / "sites" / "apps.txt").write_text("frappe\ncrm\nhelpdesk\n")
+
+		# registered in package.json
+		self.add_spa("crm", "dashboard")
+		(self.bench_path / "apps/crm/package.json").write_text(json.dumps({"doppio": {"spas": ["dashboard"]}}))
+
+		# only routed from hooks, like frappe-ui starters
+		self.add_spa("helpdesk", "frontend")
+		(self.bench_path / "apps/helpdesk/helpdesk").mkdir()
+		(self.bench_path / "apps/helpdesk/helpdesk/hooks.py").write_text(
+			"website_route_rules = [{'from_route': '/frontend/<path:app_path>', 'to_route': 'frontend'},"
+			" {'from_route': '/docs/<path:app_path>', 'to_route': 'docs'},]"
+		)
+
+		# only has a doppio manifest
+		self.add_spa("helpdesk", "portal")
+		(self.bench_path / "apps/helpdesk/portal/.doppio").mkdir()
+		(self.bench_path / "apps/helpdesk/portal/.doppio/manifest.json").write_text("{}")
+
+		(self.bench_path / "apps/frappe").mkdir()
+
+	def tearDown(self):
+		self.tmp.cleanup()
+
+	def add_spa(self, app, name):
+		spa_path = self.bench_path / "apps" / app / name
+		spa_path.mkdir(parents=True)
+		(spa_path / "vite.config.js").write_text("export default {}")
+
+	def test_discover_spas(self):
+		spas = discover_spas(self.bench_path)
+
+		# docs has a route rule but is not a vite project
+		self.assertEqual(
+			[(spa["app"], spa["name"]) for spa in spas],
+			[("crm", "dashboard"), ("helpdesk", "frontend"), ("helpdesk", "portal")],
+		)
+		self.assertEqual(
+			Path(spas[0]["cacheDir"]), (self.bench_path / ".doppio/vite-cache/crm-dashboard").resolve()
+		)
+
+	def test_filter_spas(self):
+		spas = discover_spas(self.bench_path, apps=["helpdesk"], spas=["portal"])
+		self.assertEqual([spa["name"] for spa in spas], ["portal"])
@@ -0,0 +1,19 @@
+from unittest import TestCase
+
+from doppio.utils.histogram import estimate_percentile, get_histogram_bin
+
+
+class TestHistogram(TestCase):
+	def test_histogram_bin(self):
+		self.assertEqual(get_histogram_bin(10), "50")
+		self.assertEqual(get_histogram_bin(50), "50")
+		self.assertEqual(get_histogram_bin(120), "200")
+		self.assertEqual(get_histogram_bin(60000), "inf")
+
+	def test_estimate_percentile(self):
+		bins = {"50": 70, "100": 20, "500": 9, "inf": 1}
+
+		self.assertEqual(estimate_percentile(bins, 100, 50), 50)
+		self.assertEqual(estimate_percentile(bins, 100, 75), 100)
+		self.assertEqual(estimate_percentile(bins, 100, 95), 500)
+		self.assertEqual(estimate_percentile(bins, 100, 100), "inf")
@@ -0,0 +1,46 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+import frappe
+
+from werkzeug.test import EnvironBuilder
+from werkzeug.wrappers import Response
+
+from doppio.utils.http_cache import cacheable
+from doppio.utils.streaming import stream_rows
+
+
+@cacheable(max_age=60, public=True)
+def get_countries():
+	return ["Netherlands", "India"]
+
+
+def get_orders():
+	return stream_rows([{"name": "SO-0001"}])
+
+
+def request(path, method="GET"):
+	return patch.object(frappe.local, "request", EnvironBuilder(path=path, method=method).get_request(), create=True)
+
+
+class TestHttpCache(TestCase):
+	def test_api_calls_get_a_cacheable_response(self):
+		with request("/api/method/doppio.tests.test_http_cache.get_countries"):
+			response = get_countries()
+
+		self.assertIsInstance(response, Response)
+		self.assertEqual(response.cache_control.max_age, 60)
+		self.assertEqual(frappe.parse_json(response.get_data()), {"message": ["Netherlands", "India"]})
+
+	def test_page_requests_get_the_value(self):
+		# e.g. INITIAL_RESOURCES of a www context, rendered with frappe.as_json
+		with request("/dashboard/orders"):
+			self.assertEqual(get_countries(), ["Netherlands", "India"])
+			self.assertEqual(get_orders(), [{"name": "SO-0001"}])
+
+		with request("/api/method/doppio.tests.test_http_cache.get_orders"):
+			self.assertIsInstance(get_orders(), Response)
+
+	def test_other_methods_get_the_value(self):
+		with request("/api/method/frappe.client.get_list"):
+			self.assertEqual(get_countries(), ["Netherlands", "India"])
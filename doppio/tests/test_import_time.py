@@ -0,0 +1,48 @@
+import json
+import subprocess
+import sys
+
+from pathlib import Path
+from unittest import TestCase
+
+# Bench imports `doppio.commands` on every invocation to discover commands,
+# so it must stay cheap: these modules must only be imported when a doppio
+# command actually runs
+DEFERRED_MODULES = (
+	"frappe",
+	"doppio.commands.boilerplates",
+	"doppio.commands.desk_page",
+	"doppio.commands.dev",
+	"doppio.commands.frappe_ui",
+	"doppio.commands.loadtest",
+	"doppio.commands.meta",
+	"doppio.commands.spa_generator",
+	"doppio.commands.translations",
+	"doppio.commands.upgrade",
+	"doppio.meta",
+	"doppio.profiler",
+)
+
+LIST_IMPORTED_MODULES = """
+import json, sys
+import click
+import doppio.commands
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+class TestImportTime(TestCase):
+	def get_imported_modules(self):
+		output = subprocess.run(
+			[sys.executable, "-c", LIST_IMPORTED_MODULES],
+			cwd=Path(__file__).parents[2],
+			capture_output=True,
+			text=True,
+			check=True,
+		).stdout
+		return json.loads(output)
+
+	def test_commands_import_is_lazy(self):
+		modules = self.get_imported_modules()
+		for module in DEFERRED_MODULES:
+			self.assertNotIn(module, modules)
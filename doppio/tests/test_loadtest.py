@@ -0,0 +1,26 @@
+from unittest import TestCase
+
+from doppio.commands.loadtest import get_query_string, percentile
+
+
+class TestLoadTest(TestCase):
+	def test_percentile(self):
+		values = list(range(1, 101))
+
+		self.assertEqual(percentile(values, 0), 1)
+		self.assertEqual(percentile(values, 50), 50.5)
+		self.assertAlmostEqual(percentile(values, 95), 95.05)
+		self.assertAlmostEqual(percentile(values, 99), 99.01)
+		self.assertEqual(percentile(values, 100), 100)
+
+	def test_percentile_of_few_values(self):
+		self.assertIsNone(percentile([], 50))
+		self.assertEqual(percentile([42], 99), 42)
+		self.assertEqual(percentile([30, 10, 20], 50), 20)
+
+	def test_query_string_matches_call_js(self):
+		self.assertEqual(
+			get_query_string({"z": 1, "filters": {"b": 2, "a": True}, "skip": None}),
+			"filters=%7B%22a%22%3Atrue%2C%22b%22%3A2%7D&skip=&z=1",
+		)
+		self.assertEqual(get_query_string({"txt": "it's (a) b/c"}), "txt=it's%20(a)%20b%2Fc")
@@ -0,0 +1,20 @@
+import json
+import tempfile
+
+from pathlib import Path
+from unittest import TestCase
+
+from doppio.commands.meta import get_snapshot_doctypes
+
+
+class TestMetaSnapshots(TestCase):
+	def test_snapshot_doctypes(self):
+		with tempfile.TemporaryDirectory() as tmp:
+			spa_path = Path(tmp)
+			self.assertEqual(get_snapshot_doctypes(spa_path), [])
+
+			(spa_path / "package.json").write_text(json.dumps({"name": "dashboard"}))
+			self.assertEqual(get_snapshot_doctypes(spa_path), [])
+
+			(spa_path / "package.json").write_text(json.dumps({"doppio": {"meta": ["ToDo", "Sales Order"]}}))
+			self.assertEqual(get_snapshot_doctypes(spa_path), ["ToDo", "Sales Order"])
@@ -0,0 +1,90 @@
+import importlib
+import sys
+
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+
+def import_or_mock(name):
+	try:
+		return importlib.import_module(name)
+	except ImportError:
+		return MagicMock()
+
+
+# These tests only reach frappe through the mocks below, so they also run where
+# frappe and werkzeug aren't installed
+with patch.dict(
+	sys.modules,
+	{name: import_or_mock(name) for name in ("frappe", "werkzeug", "werkzeug.http", "werkzeug.wrappers")},
+):
+	from doppio import meta
+
+
+def mock_frappe(customizations, doctype_modified="2024-01-01 10:00:00"):
+	frappe = MagicMock()
+	frappe.db.get_value.return_value = doctype_modified
+	frappe.get_all.side_effect = lambda doctype, **kwargs: customizations.get(doctype, [])
+	frappe.cache().hget.side_effect = lambda key, field, generator: generator()
+	return frappe
+
+
+class TestMetaVersions(TestCase):
+	def test_version_changes_when_a_customization_is_deleted(self):
+		custom_fields = [
+			{"name": "ToDo-priority_level", "modified": "2024-01-02 10:00:00"},
+			{"name": "ToDo-region", "modified": "2024-01-01 09:00:00"},
+		]
+
+		with patch.object(meta, "frappe", mock_frappe({"Custom Field": custom_fields})):
+			before = meta.get_meta_version("ToDo")
+		# the latest change is kept, only the older field is gone
+		with patch.object(meta, "frappe", mock_frappe({"Custom Field": custom_fields[:1]})):
+			after = meta.get_meta_version("ToDo")
+
+		self.assertTrue(before.startswith("2024-01-02 10:00:00|2|"))
+		self.assertTrue(after.startswith("2024-01-02 10:00:00|1|"))
+		self.assertNotEqual(before, after)
+
+	def test_version_is_stable(self):
+		property_setters = [
+			{"name": "ToDo-status-default", "modified": "2024-01-01 11:00:00"},
+			{"name": "ToDo-main-sort_field", "modified": "2024-01-01 12:00:00"},
+		]
+
+		with patch.object(meta, "frappe", mock_frappe({"Property Setter": property_setters})):
+			version = meta.get_meta_version("ToDo")
+		with patch.object(meta, "frappe", mock_frappe({"Property Setter": property_setters[::-1]})):
+			self.assertEqual(meta.get_meta_version("ToDo"), version)
+
+	def test_no_version_without_a_doctype(self):
+		with patch.object(meta, "frappe", mock_frappe({}, doctype_modified=None)):
+			self.assertIsNone(meta.get_meta_version("ToDo"))
+
+	def test_compact_meta_leaves_empty_properties_out(self):
+		doctype_meta = MagicMock(
+			fields=[
+				dict(fieldname="status", fieldtype="Select", options="Open\nClosed", reqd=0, hidden=0),
+				dict(fieldname="description", fieldtype="Text Editor", reqd=1, label="Description"),
+			]
+		)
+		doctype_meta.get.side_effect = dict(name="ToDo", module="Desk", istable=0, title_field="description").get
+		frappe = mock_frappe({})
+		frappe.get_meta.return_value = doctype_meta
+
+		with patch.object(meta, "frappe", frappe):
+			compact = meta.get_compact_meta("ToDo")
+
+		self.assertTrue(compact.pop("version").startswith("2024-01-01 10:00:00|0|"))
+		self.assertEqual(
+			compact,
+			{
+				"name": "ToDo",
+				"module": "Desk",
+				"title_field": "description",
+				"fields": [
+					{"fieldname": "status", "fieldtype": "Select", "options": "Open\nClosed"},
+					{"fieldname": "description", "label": "Description", "fieldtype": "Text Editor", "reqd": 1},
+				],
+			},
+		)
@@ -0,0 +1,78 @@
+import json
+import tempfile
+
+from pathlib import Path
+from unittest import TestCase
+
+from doppio.commands.presets import (
+	PRESETS,
+	get_install_command,
+	get_optimized_dependencies,
+	get_presets,
+	get_preset_dependencies,
+	pin_preset_dependencies,
+)
+
+
+class TestPresets(TestCase):
+	def test_get_presets(self):
+		self.assertEqual(get_presets("vue"), ["vue"])
+		self.assertEqual(
+			get_presets("react", typescript=True, tailwindcss=True, shadcn=True),
+			["react", "typescript", "tailwindcss", "shadcn"],
+		)
+
+	def test_preset_dependencies_are_pinned(self):
+		dependencies, dev_dependencies = get_preset_dependencies(
+			get_presets("vue", tailwindcss=True)
+		)
+
+		self.assertIn("vue-router", dependencies)
+		self.assertIn("tailwindcss", dev_dependencies)
+
+		# exact versions only, no ranges or dist-tags
+		for version in {**dependencies, **dev_dependencies}.values():
+			self.assertRegex(version, r"^\d+\.\d+\.\d+$")
+
+	def test_optimized_dependencies(self):
+		self.assertEqual(
+			get_optimized_dependencies(get_presets("react", typescript=True, tailwindcss=True, shadcn=True)),
+			[
+				"class-variance-authority",
+				"clsx",
+				"frappe-react-sdk",
+				"react",
+				"react-dom",
+				"react-dom/client",
+				"tailwind-merge",
+			],
+		)
+		# dev tooling is never pre-bundled
+		self.assertNotIn("vite", get_optimized_dependencies(["vue", "tailwindcss"]))
+
+	def test_template_ranges_are_pinned(self):
+		with tempfile.TemporaryDirectory() as tmp:
+			package_json_path = Path(tmp) / "package.json"
+			package_json_path.write_text(
+				json.dumps(
+					{
+						"dependencies": {"vue": "^3.4.0"},
+						"devDependencies": {"eslint": "^9.13.0", "globals": "~15.11.0", "local": "file:../local"},
+					}
+				)
+			)
+			pin_preset_dependencies(package_json_path, ["vue"])
+			data = json.loads(package_json_path.read_text())
+
+		self.assertEqual(data["dependencies"]["vue"], PRESETS["vue"]["dependencies"]["vue"])
+		self.assertEqual(data["devDependencies"]["eslint"], "9.13.0")
+		self.assertEqual(data["devDependencies"]["globals"], "15.11.0")
+		self.assertEqual(data["devDependencies"]["local"], "file:../local")
+
+	def test_install_command_matches_yarn_version(self):
+		self.assertEqual(get_install_command("4.5.1"), ["yarn", "install"])
+		self.assertEqual(get_install_command("4.5.1", frozen=True), ["yarn", "install", "--immutable"])
+		self.assertEqual(get_install_command("1.22.22"), ["yarn", "install", "--prefer-offline"])
+		self.assertEqual(
+			get_install_command("1.22.22", frozen=True), ["yarn", "install", "--prefer-offline", "--frozen-lockfile"]
+		)
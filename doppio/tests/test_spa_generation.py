@@ -30,7 +30,7 @@ class TestSPAGeneration(TestCase):
 		# check if package.json has correct build command
 		package_json = self.app_path.joinpath("dashboard").joinpath("package.json")
 		self.assertTrue(package_json.exists())
-		self.assertTrue('"build": "vite build --base=/assets/fake_app/dashboard/ && yarn copy-html-entry"' in package_json.read_text())
+		self.assertTrue('"build": "vite build --base=/assets/fake_app/dashboard/ && yarn deploy"' in package_json.read_text())
 
 		# check if hooks.py has correct list website_route_rules
 		hooks_py = self.app_path.joinpath("fake_app").joinpath("hooks.py")
@@ -53,7 +53,13 @@ class TestSPAGeneration(TestCase):
 		# check if package.json has correct build command
 		package_json = self.app_path.joinpath("frontend").joinpath("package.json")
 		self.assertTrue(package_json.exists())
-		self.assertTrue('"build": "vite build --base=/assets/fake_app/frontend/ && yarn copy-html-entry"' in package_json.read_text())
+		self.assertTrue('"build": "vite build --base=/assets/fake_app/frontend/ && yarn deploy"' in package_json.read_text())
+
+		# built into the staging directory doppio-deploy.mjs publishes from
+		self.assertTrue(self.app_path.joinpath("doppio-build.mjs").exists())
+		self.assertTrue(self.app_path.joinpath("doppio-deploy.mjs").exists())
+		vite_config = self.app_path.joinpath("frontend/vite.config.js").read_text()
+		self.assertIn("outDir: '../fake_app/public/.doppio/frontend/staging'", vite_config)
 
 
 
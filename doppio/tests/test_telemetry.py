@@ -0,0 +1,37 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from doppio.telemetry import get_increments, get_spas
+
+
+class TestTelemetry(TestCase):
+	def test_call_increments(self):
+		increments = dict(
+			get_increments("dashboard", {"type": "call", "name": "app.api.get", "value": 120, "bytes": 2048, "ok": False})
+		)
+
+		self.assertEqual(increments["dashboard|call|app.api.get|count"], 1)
+		self.assertEqual(increments["dashboard|call|app.api.get|bin|200"], 1)
+		self.assertEqual(increments["dashboard|call|app.api.get|errors"], 1)
+		self.assertEqual(increments["dashboard|call|app.api.get|bytes"], 2048)
+
+	def test_unknown_events_are_ignored(self):
+		self.assertEqual(get_increments("dashboard", {"type": "vital", "name": "XYZ", "value": 1}), [])
+		self.assertEqual(get_increments("dashboard", {"type": "call", "name": "m", "value": "slow"}), [])
+
+	def test_unbounded_names_are_ignored(self):
+		self.assertEqual(get_increments("dashboard", {"type": "call", "name": "app.api.get?x=1", "value": 1}), [])
+		self.assertEqual(get_increments("dashboard", {"type": "call", "name": "app." * 100 + "get", "value": 1}), [])
+		self.assertEqual(get_increments("dashboard", {"type": "resource", "name": ["app.api.get"]}), [])
+		self.assertEqual(get_increments("dashboard", {"type": "custom", "name": "app.api.get", "value": 1}), [])
+		self.assertEqual(get_increments("dashboard", {"type": "call", "name": "app.api.get", "value": "nan"}), [])
+		self.assertEqual(get_increments("dashboard", ["call", "app.api.get", 1]), [])
+		self.assertEqual(len(get_increments("dashboard", {"type": "resource", "name": "login", "hit": True})), 2)
+
+	def test_spas_come_from_route_rules(self):
+		rules = [
+			{"from_route": "/dashboard/<path:app_path>", "to_route": "dashboard"},
+			{"from_route": "/blog/<category>", "to_route": "blog_list"},
+		]
+		with patch("frappe.get_hooks", return_value=rules):
+			self.assertEqual(get_spas(), {"dashboard"})
@@ -0,0 +1,42 @@
+import json
+import tempfile
+
+from pathlib import Path
+from unittest import TestCase
+
+from doppio.commands.translations import extract_messages, filter_translations, write_catalog
+
+
+class TestTranslations(TestCase):
+	def test_extract_messages(self):
+		code = """
+			<button>{{ __("Save") }}</button>
+			toast(__('Deleted {0}', [name]));
+			const title = __(`Don't panic`, null, "Heading");
+			__("It's \\"quoted\\"");
+			obj.__("Not this"); my__("Nor this");
+			__(variable);
+		"""
+
+		self.assertEqual(
+			extract_messages(code),
+			["Save", "Deleted {0}", "Don't panic", 'It\'s "quoted"'],
+		)
+
+	def test_filter_translations(self):
+		translations = {"Save": "Sichern", "Save:Button": "Speichern", "Cancel": "Abbrechen"}
+
+		self.assertEqual(
+			filter_translations(translations, {"Save"}),
+			{"Save": "Sichern", "Save:Button": "Speichern"},
+		)
+
+	def test_catalog_name_changes_with_content(self):
+		with tempfile.TemporaryDirectory() as tmp:
+			catalog_path = Path(tmp)
+			first = write_catalog(catalog_path, "de", {"Save": "Sichern"})
+			second = write_catalog(catalog_path, "de", {"Save": "Speichern"})
+
+			self.assertRegex(first, r"^de\.[0-9a-f]{10}\.json$")
+			self.assertNotEqual(first, second)
+			self.assertEqual(json.loads((catalog_path / second).read_text()), {"Save": "Speichern"})
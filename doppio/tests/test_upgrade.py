@@ -0,0 +1,76 @@
+import json
+import os
+import tempfile
+
+from pathlib import Path
+from unittest import TestCase
+
+from doppio.commands.upgrade import merge_file, upgrade_spa
+
+
+class TestUpgrade(TestCase):
+	def test_merge_non_overlapping_changes(self):
+		base = "a\nb\nc\nd\ne\n"
+		current = "a\nb\nc\nd\ne\nlocal\n"
+		new = "template\na\nb\nc\nd\ne\n"
+
+		self.assertEqual(merge_file(current, base, new), "template\na\nb\nc\nd\ne\nlocal\n")
+
+	def test_merge_conflict(self):
+		base = "port: 8080\n"
+		current = "port: 3000\n"
+		new = "port: 8081\n"
+
+		self.assertIsNone(merge_file(current, base, new))
+
+
+class TestUpgradeSPA(TestCase):
+	def setUp(self):
+		self.tmp = tempfile.TemporaryDirectory()
+		bench_path = Path(self.tmp.name)
+		(bench_path / "sites").mkdir()
+		self.app_path = bench_path / "apps" / "fake_app"
+		self.spa_path = self.app_path / "dashboard"
+		(self.app_path / "fake_app" / "www").mkdir(parents=True)
+		self.spa_path.mkdir()
+
+		(self.app_path / "package.json").write_text(json.dumps({"scripts": {"build": "cd dashboard && yarn build"}}))
+		# as generated before builds were deployed from a staging directory
+		(self.spa_path / "package.json").write_text(
+			json.dumps(
+				{
+					"scripts": {
+						"dev": "vite",
+						"build": "vite build --base=/assets/fake_app/dashboard/ && yarn copy-html-entry",
+						"copy-html-entry": "cp ../fake_app/public/dashboard/index.html ../fake_app/www/dashboard.html",
+					}
+				}
+			)
+		)
+		(self.spa_path / "src").mkdir()
+		(self.spa_path / "src/App.vue").write_text("<template></template>")
+
+		self.cwd = os.getcwd()
+		os.chdir(bench_path / "sites")
+
+	def tearDown(self):
+		os.chdir(self.cwd)
+		self.tmp.cleanup()
+
+	def test_upgrade_migrates_build_scripts(self):
+		self.assertEqual(upgrade_spa("fake_app", "dashboard", dry_run=True, adopt=True)["dashboard/package.json"], "updated")
+
+		results = upgrade_spa("fake_app", "dashboard", adopt=True)
+
+		self.assertEqual(results["dashboard/package.json"], "updated")
+		scripts = json.loads((self.spa_path / "package.json").read_text())["scripts"]
+		self.assertEqual(scripts["build"], "vite build --base=/assets/fake_app/dashboard/ && yarn deploy")
+		self.assertEqual(scripts["deploy"], "node ../doppio-deploy.mjs dashboard")
+		self.assertNotIn("copy-html-entry", scripts)
+		self.assertEqual(scripts["dev"], "vite")
+
+		# the deploy script the new build runs, and the vite config building into staging
+		self.assertTrue((self.app_path / "doppio-deploy.mjs").exists())
+		self.assertIn(".doppio/dashboard/staging", (self.spa_path / "vite.config.js").read_text())
+
+		self.assertNotIn("dashboard/package.json", upgrade_spa("fake_app", "dashboard"))
@@ -0,0 +1,60 @@
+import json
+import os
+import shutil
+import time
+
+from pathlib import Path
+
+import frappe
+
+# Written by doppio-deploy.mjs next to an SPA's generations, {"keep": <count>}
+GENERATIONS_FILE = "generations.json"
+
+# Default of DOPPIO_ASSET_GENERATIONS in doppio-deploy.mjs, for SPAs deployed
+# before it recorded the count
+DEFAULT_GENERATIONS = 3
+
+# Staging builds older than this were left behind by failed builds
+STALE_STAGING_SECONDS = 24 * 60 * 60
+
+
+def prune_asset_generations():
+	"""Delete SPA build generations that doppio-deploy.mjs no longer needs.
+
+	Deploys prune as they go, this catches what they leave behind: generations
+	beyond the number the last deploy kept (DOPPIO_ASSET_GENERATIONS) and staging
+	directories of failed builds. The generation public/<spa> points to is never
+	removed.
+	"""
+	for app in frappe.get_installed_apps():
+		public_path = Path(frappe.get_app_path(app, "public"))
+		for generations_path in (public_path / ".doppio").glob("*"):
+			if generations_path.is_dir():
+				prune_spa_generations(
+					public_path / generations_path.name, generations_path, get_kept_generations(generations_path)
+				)
+
+
+def get_kept_generations(generations_path: Path):
+	try:
+		keep = int(json.loads((generations_path / GENERATIONS_FILE).read_text())["keep"])
+	except (OSError, ValueError, KeyError, TypeError):
+		keep = DEFAULT_GENERATIONS
+	return max(1, keep)
+
+
+def prune_spa_generations(link_path: Path, generations_path: Path, keep: int):
+	current = os.readlink(link_path).rstrip("/").rsplit("/", 1)[-1] if link_path.is_symlink() else None
+
+	generations = sorted(
+		(path for path in generations_path.glob("g*") if path.name[1:].isdigit()),
+		key=lambda path: int(path.name[1:]),
+		reverse=True,
+	)
+	for path in generations[keep:]:
+		if path.name != current:
+			shutil.rmtree(path, ignore_errors=True)
+
+	staging = generations_path / "staging"
+	if staging.exists() and time.time() - staging.stat().st_mtime > STALE_STAGING_SECONDS:
+		shutil.rmtree(staging, ignore_errors=True)
@@ -0,0 +1,23 @@
+# Fixed-bin latency histograms, kept as Redis hash fields so that they can be
+# incremented with HINCRBY and merged by adding counts.
+
+# Upper bounds of the bins, in ms
+HISTOGRAM_BOUNDS = (50, 100, 200, 500, 1000, 2500, 5000, 10000)
+
+
+def get_histogram_bin(value):
+	for bound in HISTOGRAM_BOUNDS:
+		if value <= bound:
+			return str(bound)
+	return "inf"
+
+
+def estimate_percentile(bins, count, percentile):
+	"""Upper bound of the histogram bin holding the `percentile` (0-100) value"""
+	target = count * percentile / 100
+	seen = 0
+	for bound in (*HISTOGRAM_BOUNDS, "inf"):
+		seen += bins.get(str(bound), 0)
+		if seen >= target:
+			return bound
+	return "inf"
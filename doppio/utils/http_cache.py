@@ -0,0 +1,119 @@
+import functools
+import hashlib
+
+from zoneinfo import ZoneInfo
+
+import frappe
+
+from werkzeug.http import is_resource_modified
+from werkzeug.wrappers import Response
+
+# Paths whitelisted methods are called at over the API
+API_METHOD_PREFIXES = ("/api/method/", "/api/v1/method/", "/api/v2/method/")
+
+
+def cacheable(max_age=0, public=False, last_modified=None, version=None):
+	"""Make a whitelisted read-only method cacheable by browsers and proxies.
+
+	Use it below `frappe.whitelist` and call the method over GET (`cacheable: true`
+	in call.js / Resource options):
+
+		@frappe.whitelist(methods=["GET"])
+		@cacheable(max_age=300)
+		def get_countries(): ...
+
+	GET responses get an ETag and `Cache-Control` (`private` unless `public`, and
+	revalidated on every use unless `max_age` seconds are given). Requests whose
+	`If-None-Match` matches get an empty 304 Not Modified. ETags of private
+	responses include the session user, and they vary by cookie. Calls made while
+	handling another request, e.g. for a page's initial data, get the plain value.
+
+	`last_modified` is an optional callable taking the method's arguments and
+	returning the datetime of the last change to its data. It is checked before the
+	method runs, so unchanged data is answered with a 304 without calling it. The
+	ETag is then derived from that datetime (and the user) instead of the body.
+
+	`version` works the same way but returns a string that changes whenever the
+	data does, for data whose last modified datetime can stay the same when it
+	changes, e.g. when a record is deleted. The ETag is derived from it instead.
+	"""
+
+	def decorator(fn):
+		@functools.wraps(fn)
+		def wrapper(*args, **kwargs):
+			request = getattr(frappe.local, "request", None)
+			if not request or request.method not in ("GET", "HEAD") or not is_api_call(request, fn):
+				return fn(*args, **kwargs)
+
+			modified = to_utc(last_modified(*args, **kwargs)) if last_modified else None
+			source = version(*args, **kwargs) if version else modified and modified.isoformat()
+			if source:
+				etag = get_etag(source, public)
+				# private: only If-None-Match, whose ETag is per user, not
+				# If-Modified-Since, which another user's cached copy would match
+				if not is_resource_modified(
+					request.environ, etag=etag, last_modified=modified if public else None
+				):
+					return make_response(None, max_age, public, modified, status=304, etag=etag)
+
+			body = frappe.as_json({"message": fn(*args, **kwargs)}, indent=None, separators=(",", ":"))
+			etag = get_etag(source or body, public)
+			response = make_response(body, max_age, public, modified, etag=etag)
+			return response.make_conditional(request)
+
+		return wrapper
+
+	return decorator
+
+
+def is_api_request(request):
+	return request.path.startswith(API_METHOD_PREFIXES)
+
+
+def is_api_call(request, fn):
+	"""Whether `request` is an API call to `fn`, and not e.g. a page calling it to render"""
+	method = f"{fn.__module__}.{fn.__name__}"
+	return request.path.rstrip("/") in {prefix + method for prefix in API_METHOD_PREFIXES}
+
+
+def get_etag(source, public):
+	# private responses differ per user, so must their ETags
+	if not public:
+		source = f"{frappe.session.user}:{source}"
+	return hashlib.sha1(source.encode()).hexdigest()
+
+
+def make_response(body, max_age, public, modified, status=200, etag=None):
+	response = Response(body, status=status, mimetype="application/json")
+
+	if public:
+		response.cache_control.public = True
+	else:
+		response.cache_control.private = True
+		# shared browsers: a cached copy is only valid for the session it was fetched with
+		response.vary.add("Cookie")
+
+	if max_age:
+		response.cache_control.max_age = max_age
+	else:
+		response.cache_control.no_cache = True
+
+	# the ETag of private responses carries the user, a Last-Modified date can't
+	if modified and public:
+		response.last_modified = modified
+	if etag:
+		response.set_etag(etag)
+
+	return response
+
+
+def to_utc(value):
+	"""Frappe datetimes are naive, in the system timezone"""
+	if not value:
+		return None
+
+	value = frappe.utils.get_datetime(value).replace(microsecond=0)
+	if value.tzinfo is None:
+		value = value.replace(tzinfo=ZoneInfo(frappe.utils.get_system_timezone()))
+
+	return value.astimezone(ZoneInfo("UTC"))
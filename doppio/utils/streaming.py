@@ -0,0 +1,37 @@
+import frappe
+
+from werkzeug.wrappers import Response
+
+from doppio.utils.http_cache import is_api_request
+
+# Rows per chunk written to the response
+CHUNK_SIZE = 500
+
+
+def stream_rows(rows, chunk_size=CHUNK_SIZE):
+	"""Return `rows` as newline delimited JSON, for `callStream` / `stream: true` resources.
+
+		@frappe.whitelist()
+		def get_orders():
+			return stream_rows(frappe.get_all("Sales Order", fields=["name", "grand_total"]))
+
+	The client renders rows as chunks arrive instead of after parsing the whole body.
+	Rows are serialized up front: the database connection and request locals are
+	gone by the time the response body is iterated, so don't pass a lazy query.
+	Outside an API request, e.g. for a page's initial data, the rows are returned
+	as a list.
+	"""
+	request = getattr(frappe.local, "request", None)
+	if not request or not is_api_request(request):
+		return list(rows)
+
+	lines = [frappe.as_json(row, indent=None, separators=(",", ":")) for row in rows]
+
+	def generate():
+		for start in range(0, len(lines), chunk_size):
+			yield "\n".join(lines[start : start + chunk_size]) + "\n"
+
+	response = Response(generate(), mimetype="application/x-ndjson")
+	# let nginx pass chunks through instead of buffering the whole response
+	response.headers["X-Accel-Buffering"] = "no"
+	return response
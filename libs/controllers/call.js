@@ -1,90 +1,164 @@
 // Author: Gavin D'souza <gavin@frappe.io>
 
 import router from '@/router';
+import { toQueryString } from './utils';
+import { decodeJSON, decodeNDJSON } from './decode';
+import { schedule } from './scheduler';
+import { recordCall } from './telemetry';
 
-export default async function call(method, args) {
+// options.cacheable: send the call as a GET with a stable query string, so that
+// the browser, nginx or a CDN can cache the response. Only use it for read
+// methods, e.g. ones decorated with doppio.utils.http_cache.cacheable
+// options.workerThreshold: Content-Length above which the response is parsed in
+// a worker, see decode.js
+// options.priority, options.signal: see scheduler.js
+export default async function call(method, args, options = {}) {
+	updateState(this, 'RequestStarted', null);
+
+	try {
+		return await schedule(async (signal) => {
+			const start = performance.now();
+			const res = await request(method, args, { ...options, signal });
+
+			if (res.ok) {
+				updateState(this, null, null);
+				const data = await decodeJSON(res, options.workerThreshold);
+				recordCall(method, performance.now() - start, getContentLength(res), true);
+				if (data.docs || method === 'login') {
+					return data;
+				}
+				return data.message;
+			} else {
+				let e = await getError(res, method);
+				recordCall(method, performance.now() - start, getContentLength(res), false);
+				updateState(this, null, e.messages.join('\n'));
+				throw e;
+			}
+		}, options);
+	} catch (e) {
+		if (e.name === 'AbortError') {
+			updateState(this, null, null);
+		}
+		throw e;
+	}
+}
+
+// Call a method whose response is newline delimited JSON, e.g. one returning
+// doppio.utils.streaming.stream_rows. options.onRows is called with each batch
+// of rows as it arrives; resolves with all rows. Methods returning a regular
+// list work too, as a single batch.
+export function callStream(method, args, options = {}) {
+	return schedule(async (signal) => {
+		const res = await request(method, args, {
+			...options,
+			signal,
+			accept: 'application/x-ndjson, application/json'
+		});
+
+		if (!res.ok) {
+			throw await getError(res, method);
+		}
+
+		if (!res.headers.get('Content-Type')?.includes('application/x-ndjson')) {
+			const rows = (await decodeJSON(res, options.workerThreshold)).message || [];
+			options.onRows?.(rows);
+			return rows;
+		}
+
+		return decodeNDJSON(res, options.onRows);
+	}, options);
+}
+
+function getContentLength(res) {
+	return Number(res.headers.get('Content-Length')) || null;
+}
+
+function request(method, args, options) {
 	if (!args) {
 		args = {};
 	}
 
 	let headers = {
-		Accept: 'application/json',
+		Accept: options.accept || 'application/json',
 		'Content-Type': 'application/json; charset=utf-8',
-		'X-Frappe-Site-Name': window.location.hostname
+		'X-Frappe-Site-Name': window.location.hostname,
+		// lets doppio's profiler attribute the call to this SPA
+		'X-Doppio-SPA': window.location.pathname.split('/')[1] || ''
 	};
 
 	if (window.csrf_token && window.csrf_token !== '{{ csrf_token }}') {
 		headers['X-Frappe-CSRF-Token'] = window.csrf_token;
 	}
 
-	updateState(this, 'RequestStarted', null);
+	if (options.cacheable) {
+		delete headers['Content-Type'];
+		let query = toQueryString(args);
+		return fetch(`/api/method/${method}${query ? `?${query}` : ''}`, {
+			method: 'GET',
+			headers,
+			signal: options.signal
+		});
+	}
 
-	const res = await fetch(`/api/method/${method}`, {
+	return fetch(`/api/method/${method}`, {
 		method: 'POST',
 		headers,
-		body: JSON.stringify(args)
+		body: JSON.stringify(args),
+		signal: options.signal
 	});
+}
 
-	if (res.ok) {
-		updateState(this, null, null);
-		const data = await res.json();
-		if (data.docs || method === 'login') {
-			return data;
-		}
-		return data.message;
-	} else {
-		let response = await res.text();
-		let error, exception;
+async function getError(res, method) {
+	let response = await res.text();
+	let error = {}, exception;
+	try {
+		error = JSON.parse(response);
+		// eslint-disable-next-line no-empty
+	} catch (e) {}
+	let errorParts = [
+		[method, error.exc_type, error._error_message].filter(Boolean).join(' ')
+	];
+	if (error.exc) {
+		exception = error.exc;
 		try {
-			error = JSON.parse(response);
+			exception = JSON.parse(exception)[0];
 			// eslint-disable-next-line no-empty
 		} catch (e) {}
-		let errorParts = [
-			[method, error.exc_type, error._error_message].filter(Boolean).join(' ')
-		];
-		if (error.exc) {
-			exception = error.exc;
-			try {
-				exception = JSON.parse(exception)[0];
-				// eslint-disable-next-line no-empty
-			} catch (e) {}
-			errorParts.push(exception);
-		}
-		let e = new Error(errorParts.join('\n'));
-		e.exc_type = error.exc_type;
-		e.exc = exception;
-		e.messages = error._server_messages
-			? JSON.parse(error._server_messages)
-			: [];
-		e.messages = e.messages.concat(error.message);
-		e.messages = e.messages.map(m => {
-			try {
-				return JSON.parse(m).message;
-			} catch (error) {
-				return m;
-			}
-		});
-		e.messages = e.messages.filter(Boolean);
-		if (!e.messages.length) {
-			e.messages = error._error_message ? [error._error_message] : ['Internal Server Error'];
+		errorParts.push(exception);
+	}
+	let e = new Error(errorParts.join('\n'));
+	e.exc_type = error.exc_type;
+	e.exc = exception;
+	e.messages = error._server_messages
+		? JSON.parse(error._server_messages)
+		: [];
+	e.messages = e.messages.concat(error.message);
+	e.messages = e.messages.map(m => {
+		try {
+			return JSON.parse(m).message;
+		} catch (error) {
+			return m;
 		}
-		updateState(this, null, e.messages.join('\n'));
+	});
+	e.messages = e.messages.filter(Boolean);
+	if (!e.messages.length) {
+		e.messages = error._error_message ? [error._error_message] : ['Internal Server Error'];
+	}
 
-		if (
-			[401, 403].includes(res.status) &&
-			router.currentRoute.name !== 'Login'
-		) {
-			router.push('/login');
-		}
-		throw e;
+	if (
+		[401, 403].includes(res.status) &&
+		router.currentRoute.name !== 'Login'
+	) {
+		router.push('/login');
 	}
+	return e;
+}
 
-	function updateState(vm, state, errorMessage) {
-		if (vm?.state !== undefined) {
-			vm.state = state;
-		}
-		if (vm?.errorMessage !== undefined) {
-			vm.errorMessage = errorMessage;
-		}
+function updateState(vm, state, errorMessage) {
+	if (vm?.state !== undefined) {
+		vm.state = state;
+	}
+	if (vm?.errorMessage !== undefined) {
+		vm.errorMessage = errorMessage;
 	}
 }
@@ -0,0 +1,103 @@
+// Responses larger than this (per Content-Length) are parsed in a worker
+export const WORKER_THRESHOLD = 512 * 1024;
+
+// Inlined so that it works with any bundler (Vite or Frappe's esbuild)
+const WORKER_SOURCE = `
+const decoder = new TextDecoder();
+self.onmessage = (event) => {
+	const { id, buffer } = event.data;
+	try {
+		self.postMessage({ id, data: JSON.parse(decoder.decode(buffer)) });
+	} catch (error) {
+		self.postMessage({ id, error: String(error) });
+	}
+};
+`;
+
+let worker = null;
+let lastId = 0;
+const pending = new Map();
+
+function getWorker() {
+	if (worker === null) {
+		try {
+			const url = URL.createObjectURL(
+				new Blob([WORKER_SOURCE], { type: 'text/javascript' })
+			);
+			worker = new Worker(url);
+			worker.onmessage = ({ data: { id, data, error } }) => {
+				if (!pending.has(id)) return;
+				const { resolve, reject } = pending.get(id);
+				pending.delete(id);
+				error ? reject(new SyntaxError(error)) : resolve(data);
+			};
+			worker.onerror = disableWorker;
+			worker.onmessageerror = disableWorker;
+		} catch (e) {
+			// e.g. blob: workers blocked by a Content-Security-Policy
+			worker = false;
+		}
+	}
+	return worker;
+}
+
+// Once the worker fails, e.g. its script was blocked after it was created, the
+// parses waiting on it and all later ones run on the main thread
+function disableWorker() {
+	if (!worker) return;
+	worker.terminate();
+	worker = false;
+
+	for (const { buffer, resolve, reject } of pending.values()) {
+		parseOnMainThread(buffer).then(resolve, reject);
+	}
+	pending.clear();
+}
+
+async function parseOnMainThread(buffer) {
+	return JSON.parse(new TextDecoder().decode(buffer));
+}
+
+function parseInWorker(buffer) {
+	const id = ++lastId;
+	return new Promise((resolve, reject) => {
+		// copied, not transferred, so that the main thread can still parse it if
+		// the worker fails
+		pending.set(id, { buffer, resolve, reject });
+		getWorker().postMessage({ id, buffer });
+	});
+}
+
+// res.json(), off the main thread for large bodies. Chunked responses have no
+// Content-Length and are always parsed on the main thread.
+export async function decodeJSON(res, threshold = WORKER_THRESHOLD) {
+	const length = Number(res.headers.get('Content-Length'));
+	if (!length || length < threshold || typeof Worker === 'undefined' || !getWorker()) {
+		return res.json();
+	}
+	return parseInWorker(await res.arrayBuffer());
+}
+
+// Calls onRows with each batch of rows of a newline delimited JSON body as it
+// arrives, and resolves with all rows
+export async function decodeNDJSON(res, onRows) {
+	const reader = res.body.getReader();
+	const decoder = new TextDecoder();
+	let rows = [];
+	let buffer = '';
+
+	for (;;) {
+		const { done, value } = await reader.read();
+		buffer += done ? decoder.decode() : decoder.decode(value, { stream: true });
+
+		const lines = buffer.split('\n');
+		buffer = done ? '' : lines.pop();
+
+		const batch = lines.filter((line) => line.trim()).map((line) => JSON.parse(line));
+		if (batch.length) {
+			rows = rows.concat(batch);
+			onRows?.(batch);
+		}
+		if (done) return rows;
+	}
+}
@@ -0,0 +1,29 @@
+import { stableStringify } from './utils';
+
+// Results of the INITIAL_RESOURCES declared in the SPA's www context file,
+// embedded in the page as <script type="application/json" id="initial-data">
+let initialData;
+
+function getInitialData() {
+	if (initialData === undefined) {
+		try {
+			initialData =
+				JSON.parse(document.getElementById('initial-data')?.textContent) || {};
+		} catch (e) {
+			// not rendered by Frappe, e.g. on the Vite dev server
+			initialData = {};
+		}
+	}
+	return initialData;
+}
+
+// Returns the embedded { method, params, message } for key if it was fetched
+// with the same params, and removes it so that later fetches hit the server
+export function takeInitialData(key, params) {
+	let entry = getInitialData()[key];
+	if (!entry || stableStringify(entry.params || {}) !== stableStringify(params || {})) {
+		return undefined;
+	}
+	delete initialData[key];
+	return entry;
+}
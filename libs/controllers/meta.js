@@ -0,0 +1,45 @@
+// Doctype meta for forms and lists.
+//
+// `bench doppio-meta` snapshots the doctypes an SPA declares (`doppio.meta` in its
+// package.json) to src/meta/, and vite bundles each snapshot as its own hashed
+// chunk. A snapshot is used as long as its version matches the one the boot
+// carries (doppio_meta_versions), otherwise the meta is fetched live.
+
+import call from './call';
+
+const snapshots = import.meta.glob('/src/meta/*.json', { import: 'default' });
+
+// doctype -> Promise of its meta, for the lifetime of the page
+const cache = new Map();
+
+// same as frappe.scrub, which names the snapshot files
+function scrub(doctype) {
+	return doctype.replace(/ /g, '_').replace(/-/g, '_').toLowerCase();
+}
+
+export function getMeta(doctype) {
+	if (!cache.has(doctype)) {
+		const meta = loadMeta(doctype);
+		// retry on the next call
+		meta.catch(() => cache.delete(doctype));
+		cache.set(doctype, meta);
+	}
+	return cache.get(doctype);
+}
+
+async function loadMeta(doctype) {
+	const versions = window.frappe?.boot?.doppio_meta_versions || {};
+	const loadSnapshot = snapshots[`/src/meta/${scrub(doctype)}.json`];
+
+	if (loadSnapshot) {
+		const snapshot = await loadSnapshot();
+		// no version to compare with, e.g. on the vite dev server
+		if (!(doctype in versions) || snapshot.version === versions[doctype]) {
+			return snapshot;
+		}
+	}
+
+	return call('doppio.meta.get_meta', { doctype }, { cacheable: true });
+}
+
+export default getMeta;
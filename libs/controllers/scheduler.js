@@ -0,0 +1,108 @@
+// Shared queue for server calls, so that a page mounting many components does
+// not open dozens of requests at once and exhaust the browser's connection
+// pool and the bench's gunicorn workers.
+//
+// Priorities:
+//   critical    data the page can't render without, never queued
+//   visible     data for what is on screen (default)
+//   background  prefetches and the like, cancelled on route change
+
+export const PRIORITIES = ['critical', 'visible', 'background'];
+
+let maxInFlight = 6;
+let inFlight = 0;
+const queues = { visible: [], background: [] };
+const running = new Set();
+
+export function configureScheduler(options = {}) {
+	if (options.maxInFlight) {
+		maxInFlight = options.maxInFlight;
+	}
+	next();
+}
+
+// Run task(signal) when a slot is free. The task must honour signal, which
+// aborts when options.signal does or the task's priority class is cancelled.
+export function schedule(task, options = {}) {
+	const priority = options.priority || 'visible';
+	if (!PRIORITIES.includes(priority)) {
+		throw new Error(`[Scheduler]: unknown priority ${priority}`);
+	}
+
+	const controller = new AbortController();
+	const job = { task, priority, controller };
+
+	const promise = new Promise((resolve, reject) => {
+		job.resolve = resolve;
+		job.reject = reject;
+	});
+
+	if (options.signal) {
+		if (options.signal.aborted) {
+			controller.abort(options.signal.reason);
+		} else {
+			options.signal.addEventListener('abort', () => abort(job, options.signal.reason), {
+				once: true,
+			});
+		}
+	}
+
+	if (controller.signal.aborted) {
+		job.reject(controller.signal.reason);
+	} else if (priority === 'critical') {
+		start(job);
+	} else {
+		queues[priority].push(job);
+		next();
+	}
+	return promise;
+}
+
+// Abort queued and running work of a priority class
+export function cancelAll(priority = 'background') {
+	for (const job of [...queues[priority] || [], ...running]) {
+		if (job.priority === priority) {
+			abort(job);
+		}
+	}
+}
+
+export function getSchedulerStats() {
+	return {
+		inFlight,
+		queued: queues.visible.length + queues.background.length,
+	};
+}
+
+function abort(job, reason) {
+	const queue = queues[job.priority];
+	const index = queue ? queue.indexOf(job) : -1;
+	if (index !== -1) {
+		queue.splice(index, 1);
+	}
+	job.controller.abort(reason);
+	if (index !== -1) {
+		job.reject(job.controller.signal.reason);
+	}
+}
+
+function start(job) {
+	inFlight++;
+	running.add(job);
+	Promise.resolve()
+		.then(() => job.task(job.controller.signal))
+		.then(job.resolve, job.reject)
+		.finally(() => {
+			inFlight--;
+			running.delete(job);
+			next();
+		});
+}
+
+function next() {
+	while (inFlight < maxInFlight) {
+		const job = queues.visible.shift() || queues.background.shift();
+		if (!job) return;
+		start(job);
+	}
+}
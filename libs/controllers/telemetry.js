@@ -0,0 +1,137 @@
+// Real-user performance telemetry: web vitals, call() latency and payload
+// size, and how often resources are served without a request. Events are
+// batched and sent with sendBeacon to doppio.telemetry.collect, which keeps
+// time-bucketed aggregates (see the Doppio Telemetry desk page).
+//
+// Opt-in: nothing is recorded unless `doppio_telemetry` is enabled in the
+// site config (it reaches the SPA through frappe.boot).
+
+const ENDPOINT = '/api/method/doppio.telemetry.collect';
+
+let options = null;
+let queue = [];
+let timer = null;
+
+export function enableTelemetry(config = {}) {
+	if (options || !window.frappe?.boot?.doppio_telemetry) return;
+
+	options = {
+		spa: window.location.pathname.split('/')[1] || '',
+		sampleRate: window.frappe.boot.doppio_telemetry_sample_rate ?? 1,
+		flushInterval: 10000,
+		maxBatch: 50,
+		...config,
+	};
+	if (Math.random() >= options.sampleRate) {
+		options = { ...options, disabled: true };
+		return;
+	}
+
+	observeWebVitals();
+	document.addEventListener('visibilitychange', () => {
+		if (document.visibilityState === 'hidden') flush();
+	});
+}
+
+export function recordCall(method, duration, bytes, ok) {
+	record({ type: 'call', name: method, value: duration, bytes, ok });
+}
+
+export function recordResourceFetch(method, hit) {
+	record({ type: 'resource', name: method, hit });
+}
+
+function record(event) {
+	if (!options || options.disabled) return;
+
+	queue.push(event);
+	if (queue.length >= options.maxBatch) {
+		flush();
+	} else if (!timer) {
+		timer = setTimeout(flush, options.flushInterval);
+	}
+}
+
+function flush() {
+	clearTimeout(timer);
+	timer = null;
+	if (!queue.length) return;
+
+	const events = queue;
+	queue = [];
+
+	// sendBeacon can't set headers, so the CSRF token goes in the body
+	const body = new URLSearchParams({
+		spa: options.spa,
+		events: JSON.stringify(events),
+	});
+	if (window.csrf_token && window.csrf_token !== '{{ csrf_token }}') {
+		body.set('csrf_token', window.csrf_token);
+	}
+
+	if (!navigator.sendBeacon?.(ENDPOINT, body)) {
+		fetch(ENDPOINT, { method: 'POST', body, keepalive: true }).catch(() => {});
+	}
+}
+
+function observe(type, callback) {
+	try {
+		new PerformanceObserver((list) => list.getEntries().forEach(callback)).observe({
+			type,
+			buffered: true,
+		});
+	} catch (e) {
+		// entry type not supported by this browser
+	}
+}
+
+// Same definitions as the web-vitals library, simplified: LCP, CLS and INP are
+// reported when the page is hidden, with their value at that point
+function observeWebVitals() {
+	const vital = (name, value) => record({ type: 'vital', name, value });
+
+	const navigation = performance.getEntriesByType?.('navigation')[0];
+	if (navigation) {
+		vital('TTFB', navigation.responseStart);
+	}
+
+	observe('paint', (entry) => {
+		if (entry.name === 'first-contentful-paint') vital('FCP', entry.startTime);
+	});
+
+	let lcp = null;
+	observe('largest-contentful-paint', (entry) => {
+		lcp = entry.startTime;
+	});
+
+	let cls = 0;
+	let sessionValue = 0;
+	let sessionEntries = [];
+	observe('layout-shift', (entry) => {
+		if (entry.hadRecentInput) return;
+		const first = sessionEntries[0];
+		const last = sessionEntries[sessionEntries.length - 1];
+		if (last && entry.startTime - last.startTime < 1000 && entry.startTime - first.startTime < 5000) {
+			sessionValue += entry.value;
+			sessionEntries.push(entry);
+		} else {
+			sessionValue = entry.value;
+			sessionEntries = [entry];
+		}
+		cls = Math.max(cls, sessionValue);
+	});
+
+	let inp = null;
+	observe('event', (entry) => {
+		if (entry.interactionId) inp = Math.max(inp ?? 0, entry.duration);
+	});
+
+	let reported = false;
+	document.addEventListener('visibilitychange', () => {
+		if (document.visibilityState !== 'hidden' || reported) return;
+		reported = true;
+		if (lcp !== null) vital('LCP', lcp);
+		vital('CLS', cls);
+		if (inp !== null) vital('INP', inp);
+	});
+}
@@ -0,0 +1,41 @@
+// Translations for SPAs, from the catalogs exported by `bench doppio-translations`.
+//
+// A catalog only holds the messages the SPA's source uses, for one language. It
+// is a hashed static file, so the boot carries its URL (translations_url)
+// instead of every message of every app, and browsers cache it for good.
+// Translations edited on the site (Translation doctype) come with the boot as
+// translation_overrides.
+
+let messages = {};
+let loading = null;
+
+export function loadTranslations() {
+	if (!loading) {
+		const boot = window.frappe?.boot || {};
+		loading = boot.translations_url
+			? fetch(boot.translations_url)
+					.then((res) => (res.ok ? res.json() : {}))
+					.catch(() => ({}))
+			: // no catalog exported, the boot has the messages
+			  Promise.resolve(boot.__messages || {});
+
+		loading = loading.then((catalog) => {
+			messages = { ...catalog, ...boot.translation_overrides };
+			return messages;
+		});
+	}
+	return loading;
+}
+
+// Same signature as __() in the desk: placeholders {0}, {1}... are replaced
+// with `replace`, `context` picks a translation specific to it
+export function __(message, replace, context = null) {
+	let translated = (context && messages[`${message}:${context}`]) || messages[message] || message;
+
+	if (replace && typeof replace === 'object') {
+		translated = translated.replace(/{(\d+)}/g, (match, index) => replace[index] ?? match);
+	}
+	return translated;
+}
+
+export default __;
@@ -0,0 +1,31 @@
+// JSON.stringify with object keys sorted at every level, so that equal
+// params always serialize to the same string
+export function stableStringify(value) {
+	if (Array.isArray(value)) {
+		return `[${value.map((item) => stableStringify(item ?? null)).join(',')}]`;
+	}
+	if (value && typeof value === 'object' && !(value instanceof Date)) {
+		let entries = Object.keys(value)
+			.filter((key) => value[key] !== undefined && typeof value[key] !== 'function')
+			.sort()
+			.map((key) => `${JSON.stringify(key)}:${stableStringify(value[key])}`);
+		return `{${entries.join(',')}}`;
+	}
+	return JSON.stringify(value);
+}
+
+// Query string with keys sorted and objects JSON encoded, so that the same
+// args always map to the same (cacheable) URL
+export function toQueryString(args) {
+	return Object.keys(args)
+		.filter((key) => args[key] !== undefined && typeof args[key] !== 'function')
+		.sort()
+		.map((key) => {
+			let value = args[key];
+			if (value !== null && typeof value === 'object') {
+				value = stableStringify(value);
+			}
+			return `${encodeURIComponent(key)}=${encodeURIComponent(value ?? '')}`;
+		})
+		.join('&');
+}
@@ -0,0 +1,151 @@
+// Serves every SPA of the bench from one Node process, started by `bench doppio-dev`.
+//
+// Each SPA gets a Vite server in middleware mode, mounted at /<spa>/ on a single
+// HTTP server. Everything else is proxied to the bench web server once, instead of
+// by every SPA's proxyOptions.
+//
+// This saves the Node processes, HTTP servers and proxies of one `yarn dev` per
+// SPA, and vite is loaded once. Every Vite server still watches its own root,
+// so file watches are the same as with separate processes.
+//
+//	node libs/dev/server.mjs '{"port": 8080, "webserverPort": 8000, "spas": [{"name", "root", "cacheDir"}]}'
+
+import http from 'http';
+import net from 'net';
+import path from 'path';
+import { createRequire } from 'module';
+import { pathToFileURL } from 'url';
+
+const HMR_PROTOCOL = 'vite-hmr';
+
+const config = JSON.parse(process.argv[2]);
+
+if (!config.spas.length) {
+	console.error('No SPAs to serve');
+	process.exit(1);
+}
+
+// SPAs pin the same vite version, load it once from the first SPA that has it installed
+async function loadVite(spas) {
+	for (const spa of spas) {
+		const require = createRequire(path.join(spa.root, 'package.json'));
+		try {
+			const packageJsonPath = require.resolve('vite/package.json');
+			return import(pathToFileURL(path.join(path.dirname(packageJsonPath), 'dist/node/index.js')).href);
+		} catch (e) {
+			// not installed in this SPA
+		}
+	}
+	throw new Error('vite is not installed in any SPA, run yarn install in one of them');
+}
+
+// The bench proxy below replaces the proxyOptions of each SPA
+function withoutProxy() {
+	return {
+		name: 'doppio-dev',
+		config(userConfig) {
+			if (userConfig.server) {
+				delete userConfig.server.proxy;
+			}
+		},
+	};
+}
+
+const { createServer } = await loadVite(config.spas);
+
+const server = http.createServer();
+const agent = new http.Agent({ keepAlive: true, maxSockets: 64 });
+
+function proxy(req, res) {
+	const upstream = http.request(
+		{
+			host: '127.0.0.1',
+			port: config.webserverPort,
+			method: req.method,
+			path: req.url,
+			// Frappe resolves the site from the host header
+			headers: req.headers,
+			agent,
+		},
+		(upstreamRes) => {
+			res.writeHead(upstreamRes.statusCode, upstreamRes.headers);
+			upstreamRes.pipe(res);
+		}
+	);
+	upstream.on('error', (e) => {
+		if (!res.headersSent) {
+			res.writeHead(502, { 'Content-Type': 'text/plain' });
+		}
+		res.end(`Could not reach the bench at port ${config.webserverPort}: ${e.message}`);
+	});
+	req.pipe(upstream);
+}
+
+function proxyUpgrade(req, socket, head) {
+	const upstream = net.connect(config.webserverPort, '127.0.0.1', () => {
+		let requestHead = `${req.method} ${req.url} HTTP/${req.httpVersion}\r\n`;
+		for (let i = 0; i < req.rawHeaders.length; i += 2) {
+			requestHead += `${req.rawHeaders[i]}: ${req.rawHeaders[i + 1]}\r\n`;
+		}
+		upstream.write(requestHead + '\r\n');
+		upstream.write(head);
+		socket.pipe(upstream).pipe(socket);
+	});
+	upstream.on('error', () => socket.destroy());
+	socket.on('error', () => upstream.destroy());
+}
+
+const spas = await Promise.all(
+	config.spas.map(async (spa) => {
+		const vite = await createServer({
+			root: spa.root,
+			base: `/${spa.name}/`,
+			cacheDir: spa.cacheDir,
+			appType: 'spa',
+			clearScreen: false,
+			plugins: [withoutProxy()],
+			server: {
+				middlewareMode: true,
+				// HMR websockets share the HTTP server, each SPA answers on its base
+				hmr: { server },
+				watch: { ignored: ['**/.doppio/**'] },
+			},
+		});
+		return { ...spa, prefix: `/${spa.name}/`, vite };
+	})
+);
+
+server.on('request', (req, res) => {
+	const spa = spas.find(({ name, prefix }) => req.url.startsWith(prefix) || req.url === `/${name}`);
+	if (!spa) {
+		proxy(req, res);
+	} else if (req.url === `/${spa.name}`) {
+		res.writeHead(302, { Location: spa.prefix });
+		res.end();
+	} else {
+		spa.vite.middlewares(req, res, () => proxy(req, res));
+	}
+});
+
+server.on('upgrade', (req, socket, head) => {
+	// handled by the vite server of the SPA
+	if (req.headers['sec-websocket-protocol'] === HMR_PROTOCOL) return;
+	proxyUpgrade(req, socket, head);
+});
+
+server.listen(config.port, config.host, () => {
+	console.log(`Proxying to the bench at port ${config.webserverPort}, serving:`);
+	for (const spa of spas) {
+		console.log(`  ${spa.app}/${spa.name}\thttp://localhost:${config.port}${spa.prefix}`);
+	}
+});
+
+async function close() {
+	await Promise.all(spas.map(({ vite }) => vite.close()));
+	server.close();
+	agent.destroy();
+	process.exit(0);
+}
+
+process.on('SIGINT', close);
+process.on('SIGTERM', close);
@@ -1,26 +1,30 @@
 // Authors: Faris Ansari <faris@frappe.io> & Hussain Nagaria <hussain@frappe.io>
 
-import call from '../controllers/call';
+import call, { callStream } from '../controllers/call';
+import { takeInitialData } from '../controllers/initialData';
+import { stableStringify } from '../controllers/utils';
+import { recordResourceFetch } from '../controllers/telemetry';
 import { ref, reactive } from 'vue';
 
 export default class ResourceManager {
-	constructor(vm, resourceDefs) {
+	// options are the `$options` key of the resources definition, see
+	// `watchResource` for what they control
+	constructor(vm, resourceDefs, options = {}) {
 		this._vm = vm;
 		this._watchers = [];
+		this._cancelWatchers = [];
 		let resources = reactive({});
 
 		for (let key in resourceDefs) {
 			let resourceDef = resourceDefs[key];
 			if (typeof resourceDef === 'function') {
-				this._watchers.push([
+				let watcher = watchResource(
 					() => resourceDef.call(vm),
 					(n, o) => this.updateResource(key, n, o),
-					{
-						immediate: true,
-						deep: true,
-						flush: 'sync',
-					},
-				]);
+					options
+				);
+				this._watchers.push([watcher.source, watcher.callback, watcher.options]);
+				this._cancelWatchers.push(watcher.cancel);
 			} else {
 				let resource = new Resource(vm, resourceDef);
 				resources[key] = ref(resource);
@@ -39,6 +43,7 @@ export default class ResourceManager {
 
 	destroy() {
 		const vm = this._vm;
+		this._cancelWatchers.forEach((cancel) => cancel());
 		delete vm._rm;
 	}
 
@@ -51,26 +56,75 @@ export default class ResourceManager {
 			this.resources[key] = resource;
 		}
 
-		let oldData = resource.data;
+		refreshResource(resource, newValue, oldValue);
+	}
+}
 
-		// cancel existing fetches
-		if (oldValue && resource) {
-			resource.cancel();
-		}
+// Watcher for a function resource, as `{ source, callback, options, cancel }`.
+//
+// By default the options it returns are watched deeply and synchronously, so
+// every nested change of params refetches right away. With `watch: 'key'` only
+// a serialized key of them is compared: changes are batched to the next tick,
+// optionally debounced by `debounce` ms, and nothing is refetched unless the
+// key changed. `cancel` drops a pending debounced update.
+export function watchResource(getter, callback, options = {}) {
+	if (options.watch !== 'key') {
+		return {
+			source: getter,
+			callback,
+			options: { immediate: true, deep: true, flush: 'sync' },
+			cancel() {},
+		};
+	}
 
-		resource.update(newValue);
-		// keep data if it is needed between refreshes
-		if (resource.keepData) {
-			resource.data = oldData;
-		}
+	let value, previousValue, timer;
+	let update = () => {
+		timer = null;
+		let oldValue = previousValue;
+		previousValue = value;
+		callback(value, oldValue);
+	};
 
-		if (resource.auto) {
-			resource.reload();
-		}
+	return {
+		source: () => {
+			value = getter();
+			return stableStringify(value);
+		},
+		callback: (key, oldKey) => {
+			clearTimeout(timer);
+			if (oldKey === undefined || !options.debounce) {
+				update();
+			} else {
+				timer = setTimeout(update, options.debounce);
+			}
+		},
+		options: { immediate: true, flush: 'pre' },
+		cancel: () => clearTimeout(timer),
+	};
+}
+
+// Apply new options to a resource defined by a function, e.g. when its params
+// changed, and refetch if it is auto
+export function refreshResource(resource, newValue, oldValue) {
+	let oldData = resource.data;
+
+	// cancel existing fetches
+	if (oldValue && resource) {
+		resource.cancel();
+	}
+
+	resource.update(newValue);
+	// keep data if it is needed between refreshes
+	if (resource.keepData) {
+		resource.data = oldData;
+	}
+
+	if (resource.auto) {
+		resource.reload();
 	}
 }
 
-class Resource {
+export class Resource {
 	constructor(vm, options = {}) {
 		if (typeof options == 'string') {
 			options = { method: options, auto: true };
@@ -102,6 +156,14 @@ class Resource {
 		this.keepData = options.keepData || false;
 		this.condition = options.condition || (() => true);
 		this.paged = options.paged || false;
+		// fetch over GET so the response can be HTTP cached
+		this.cacheable = options.cacheable || false;
+		// show rows as they arrive from a method returning NDJSON
+		this.stream = options.stream || false;
+		// critical, visible or background, see controllers/scheduler.js
+		this.priority = options.priority || 'visible';
+		// key of the data prefetched by the www context, see INITIAL_RESOURCES
+		this.initialDataKey = options.initialDataKey || this.method;
 		this.validate = options.validate || null;
 		if (this.validate) {
 			this.validate = this.validate.bind(this._vm);
@@ -137,20 +199,54 @@ class Resource {
 			}
 		}
 
+		let controller = new AbortController();
+		this._controller = controller;
+
 		try {
-			let data = await call(this.method, this.currentParams);
-			if (this.delay) {
+			let previousData = this.data;
+			let initial = takeInitialData(this.initialDataKey, this.currentParams);
+			recordResourceFetch(this.method, Boolean(initial));
+			let data;
+			if (initial) {
+				data = initial.message;
+			} else if (this.stream) {
+				let base = this.paged ? previousData || [] : [];
+				data = await callStream(this.method, this.currentParams, {
+					cacheable: this.cacheable,
+					priority: this.priority,
+					signal: controller.signal,
+					onRows: (rows) => {
+						base = base.concat(rows);
+						this.data = base;
+					},
+				});
+			} else {
+				data = await call(this.method, this.currentParams, {
+					cacheable: this.cacheable,
+					priority: this.priority,
+					signal: controller.signal,
+				});
+			}
+			if (this.delay && !initial) {
 				// artificial delay
 				await new Promise((resolve) => setTimeout(resolve, this.delay * 1000));
 			}
 			if (Array.isArray(data) && this.paged) {
 				this.lastPageEmpty = data.length === 0;
-				this.data = [].concat(this.data || [], data);
+				this.data = [].concat(previousData || [], data);
 			} else {
 				this.data = data;
 			}
 			this.emit('Success', this.data);
 		} catch (error) {
+			if (error.name === 'AbortError') {
+				// cancelled, a newer fetch (if any) owns the state now
+				if (this._controller === controller) {
+					this.loading = false;
+					this.currentParams = null;
+				}
+				return;
+			}
 			let errorMessages = error.messages || ['Internal Server Error'];
 			this.setError(errorMessages.join('\n'));
 		}
@@ -176,7 +272,9 @@ class Resource {
 		this.currentParams = null;
 	}
 
-	cancel() {}
+	cancel() {
+		this._controller?.abort();
+	}
 
 	setError(error) {
 		this.error = error;
@@ -0,0 +1,108 @@
+// Mount cost of a large list of components that don't declare resources, with
+// the resources plugin installed as a global mixin, without the mixin, and
+// without the plugin. Rendered to plain objects, so no DOM is needed.
+
+import { createRenderer, defineComponent, h } from 'vue';
+import resourceManager from '../index';
+
+const nodeOps = {
+	createElement: (tag) => ({ tag, props: {}, children: [], parent: null }),
+	createText: (text) => ({ text, parent: null }),
+	createComment: (text) => ({ comment: text, parent: null }),
+	setText: (node, text) => {
+		node.text = text;
+	},
+	setElementText: (el, text) => {
+		el.children = [{ text, parent: el }];
+	},
+	insert: (child, parent, anchor) => {
+		child.parent = parent;
+		const index = anchor ? parent.children.indexOf(anchor) : -1;
+		if (index === -1) {
+			parent.children.push(child);
+		} else {
+			parent.children.splice(index, 0, child);
+		}
+	},
+	remove: (child) => {
+		const parent = child.parent;
+		if (parent) {
+			parent.children.splice(parent.children.indexOf(child), 1);
+			child.parent = null;
+		}
+	},
+	parentNode: (node) => node.parent,
+	nextSibling: (node) => {
+		const siblings = node.parent ? node.parent.children : [];
+		return siblings[siblings.indexOf(node) + 1] || null;
+	},
+	patchProp: (el, key, prevValue, nextValue) => {
+		el.props[key] = nextValue;
+	},
+};
+
+const { createApp } = createRenderer(nodeOps);
+
+const Row = defineComponent({
+	props: ['row'],
+	data() {
+		return { selected: false };
+	},
+	render() {
+		return h('tr', [h('td', this.row.name), h('td', this.row.value)]);
+	},
+});
+
+const Table = defineComponent({
+	props: ['rows'],
+	render() {
+		return h(
+			'table',
+			this.rows.map((row) => h(Row, { row, key: row.name }))
+		);
+	},
+});
+
+const VARIANTS = {
+	'mixin (default)': (app) => app.use(resourceManager),
+	'{ mixin: false }': (app) => app.use(resourceManager, { mixin: false }),
+	'no plugin': () => {},
+};
+
+function mount(install, rows) {
+	const app = createApp(Table, { rows });
+	install(app);
+
+	const start = performance.now();
+	app.mount(nodeOps.createElement('div'));
+	const elapsed = performance.now() - start;
+
+	app.unmount();
+	return elapsed;
+}
+
+function median(values) {
+	const sorted = [...values].sort((a, b) => a - b);
+	return sorted[Math.floor(sorted.length / 2)];
+}
+
+export function run({ rows: count, iterations }) {
+	const rows = Array.from({ length: count }, (_, i) => ({ name: `row-${i}`, value: i }));
+	const results = {};
+
+	// warm up the JIT for every variant before measuring any
+	for (const install of Object.values(VARIANTS)) {
+		for (let i = 0; i < 5; i++) mount(install, rows);
+	}
+
+	for (const [name, install] of Object.entries(VARIANTS)) {
+		const times = Array.from({ length: iterations }, () => mount(install, rows));
+		results[name] = {
+			'median (ms)': +median(times).toFixed(2),
+			'per row (µs)': +((median(times) / count) * 1000).toFixed(2),
+		};
+	}
+
+	console.log(`Mounting ${count} rows, ${iterations} iterations`);
+	console.table(results);
+}
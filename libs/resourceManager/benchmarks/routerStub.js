@@ -0,0 +1,4 @@
+export default {
+	currentRoute: { name: null },
+	push() {},
+};
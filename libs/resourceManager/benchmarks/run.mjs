@@ -0,0 +1,32 @@
+// Loads the benchmarks through Vite, so that libs resolve like they do in an SPA.
+//
+//	yarn bench:resources [rows] [iterations]
+
+import path from 'path';
+import { fileURLToPath } from 'url';
+
+process.env.NODE_ENV = process.env.NODE_ENV || 'production';
+
+const { createServer } = await import('vite');
+
+const here = path.dirname(fileURLToPath(import.meta.url));
+
+const server = await createServer({
+	root: here,
+	configFile: false,
+	logLevel: 'error',
+	appType: 'custom',
+	server: { middlewareMode: true, hmr: false },
+	resolve: {
+		// libs import the SPA's router
+		alias: { '@/router': path.join(here, 'routerStub.js') },
+	},
+});
+
+try {
+	const { run } = await server.ssrLoadModule('/mount.bench.js');
+	const [rows = 5000, iterations = 20] = process.argv.slice(2).map(Number);
+	run({ rows, iterations });
+} finally {
+	await server.close();
+}
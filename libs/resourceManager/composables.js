@@ -0,0 +1,69 @@
+import { effectScope, getCurrentScope, onScopeDispose, reactive, watch } from 'vue';
+import { Resource, refreshResource, watchResource } from './ResourceManager';
+
+// Composition API counterpart of the `resources` component option, for apps
+// that install the plugin with `{ mixin: false }`.
+//
+//	const todos = useResource(() => ({
+//		method: 'frappe.client.get_list',
+//		params: { doctype: 'ToDo', filters: filters.value },
+//		auto: true,
+//	}));
+//
+// A definition is a method name, an options object, or a function returning
+// options that is watched like a function resource. Watchers live in their own
+// effect scope, stopped (and pending fetches cancelled) with the calling
+// component or scope. `options` are the same as the `$options` of the resources
+// component option, e.g. `{ watch: 'key', debounce: 300 }`.
+export function useResource(definition, options = {}) {
+	return useResources({ resource: definition }, options).resource;
+}
+
+export function useResources(definitions, options = {}) {
+	const scope = effectScope();
+	const resources = reactive({});
+	const cancelWatchers = [];
+
+	scope.run(() => {
+		for (const key in definitions) {
+			resources[key] = createResource(definitions[key], options, cancelWatchers);
+		}
+	});
+
+	if (getCurrentScope()) {
+		onScopeDispose(() => {
+			scope.stop();
+			cancelWatchers.forEach((cancel) => cancel());
+			for (const key in resources) {
+				resources[key].cancel();
+			}
+		});
+	}
+
+	return resources;
+}
+
+function createResource(definition, options, cancelWatchers) {
+	if (typeof definition !== 'function') {
+		const resource = reactive(new Resource(null, definition));
+		if (resource.auto) {
+			resource.reload();
+		}
+		return resource;
+	}
+
+	let resource = null;
+	const watcher = watchResource(
+		definition,
+		(value, oldValue) => {
+			if (!resource) {
+				resource = reactive(new Resource(null, value));
+			}
+			refreshResource(resource, value, oldValue);
+		},
+		options
+	);
+	watch(watcher.source, watcher.callback, watcher.options);
+	cancelWatchers.push(watcher.cancel);
+	return resource;
+}
@@ -15,7 +15,7 @@ let plugin = {
 
 		if (isPlainObject(vmOptions.resources)) {
 			const { $options, ...resourceDefs } = vmOptions.resources;
-			resourceManager = new ResourceManager(this, resourceDefs);
+			resourceManager = new ResourceManager(this, resourceDefs, $options);
 		} else {
 			throw new Error(
 				'[ResourceManager]: resources options should be an object or a function that returns object'
@@ -55,10 +55,21 @@ let plugin = {
 		if (!this._rm) return;
 		this._rm.init();
 	},
+	beforeUnmount() {
+		if (!this._rm) return;
+		this._rm.destroy();
+	},
 };
 
-export default function install(app) {
-	app.mixin(plugin);
+export { useResource, useResources } from './composables';
+
+// With `{ mixin: false }` the `resources` component option is not available and
+// components use `useResource` instead. This saves the mixin's hooks on every
+// component instance, most of which don't declare resources.
+export default function install(app, { mixin = true } = {}) {
+	if (mixin) {
+		app.mixin(plugin);
+	}
 }
 
 function isPlainObject(value) {